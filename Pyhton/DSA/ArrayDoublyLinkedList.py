@@ -0,0 +1,287 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+from array import array
+
+# Array backed doubly linked list (struct of arrays)
+# There are no Node objects. Node number i is stored in three parallel arrays:
+#
+#   index :   0    1    2    3
+#   data  : [ 30,  10,  40,  20 ]
+#   prev  : [  3,  -1,   0,   1 ]        head = 1, tail = 2
+#   next  : [  2,   3,  -1,   0 ]        list is 10 <--> 20 <--> 30 <--> 40
+#
+# A "reference" to a node is just its index and -1 plays the role of None.
+# Every node costs 3 * 8 bytes instead of a Python object per node, and the
+# arrays can be shared with NumPy (numpy.frombuffer) without copying.
+# Deleted indexes are kept in a free list (chained through the next array)
+# and reused by the next insert. compact() renumbers the nodes in list order
+# so that walking the list reads the arrays sequentially again.
+
+NONE = -1
+
+# observer is an optional function which receives diagnostic messages
+# typecode is the array type of data: 'q' for 64 bit integers, 'd' for floats
+class ArrayDoublyLinkedList:
+    def __init__(self, typecode: str = "q", observer = None):
+        self.typecode = typecode
+        self.data = array(typecode)
+        self.prev = array("q")
+        self.next = array("q")
+
+        self.head = NONE
+        self.tail = NONE
+        self.free_head = NONE
+        self.count = 0
+        self.observer = observer
+
+    # Number of nodes in the list, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the data of every node from head to tail
+    def __iter__(self):
+        data = self.data
+        next = self.next
+        current_node = self.head
+        while (current_node != NONE):
+            yield data[current_node]
+            current_node = next[current_node]
+
+    # Supports "key in dlist"
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Takes an index from the free list or grows the arrays by one slot
+    def _allocate(self, data) -> int:
+        if (self.free_head != NONE):
+            index = self.free_head
+            self.free_head = self.next[index]
+            self.data[index] = data
+            return index
+
+        self.data.append(data)
+        self.prev.append(NONE)
+        self.next.append(NONE)
+        return len(self.data) - 1
+
+    # Puts an index on the free list, its data slot is simply left behind
+    def _release(self, index: int):
+        self.prev[index] = NONE
+        self.next[index] = self.free_head
+        self.free_head = index
+
+    # Returns the index of the node at the given position (1 to count),
+    # walking from whichever end is closer
+    def _get_node(self, target_position: int) -> int:
+        if (target_position <= (self.count + 1) // 2):
+            current_node = self.head
+            for _ in range(target_position - 1):
+                current_node = self.next[current_node]
+        else:
+            current_node = self.tail
+            for _ in range(self.count - target_position):
+                current_node = self.prev[current_node]
+        return current_node
+
+    # Returns the data stored at a node index
+    def get_data(self, node: int):
+        return self.data[node]
+
+    # Unlinks the node with the given index in O(1), the index stays in use
+    def _unlink(self, node: int):
+        previous_node = self.prev[node]
+        next_node = self.next[node]
+
+        if (previous_node == NONE):
+            self.head = next_node
+        else:
+            self.next[previous_node] = next_node
+
+        if (next_node == NONE):
+            self.tail = previous_node
+        else:
+            self.prev[next_node] = previous_node
+
+        self.count = self.count - 1
+
+    # Unlinks the node with the given index in O(1) and frees the index
+    def remove_node(self, node: int):
+        self._unlink(node)
+        self._release(node)
+
+    # Links the node index before next_node (at the end when next_node is NONE)
+    def _link_before(self, node: int, next_node: int):
+        previous_node = self.tail if (next_node == NONE) else self.prev[next_node]
+        self.prev[node] = previous_node
+        self.next[node] = next_node
+
+        if (previous_node == NONE):
+            self.head = node
+        else:
+            self.next[previous_node] = node
+
+        if (next_node == NONE):
+            self.tail = node
+        else:
+            self.prev[next_node] = node
+
+        self.count = self.count + 1
+
+    # Moves a node to the beginning in O(1), the index stays the same
+    def move_to_beginning(self, node: int):
+        if (node == self.head):
+            return
+
+        self._unlink(node)
+        self._link_before(node, self.head)
+
+    # Insert methods return the index of the new node (its handle)
+    def insert_at_beginning(self, data) -> int:
+        node = self._allocate(data)
+        self._link_before(node, self.head)
+        return node
+
+    def insert_at_end(self, data) -> int:
+        node = self._allocate(data)
+        self._link_before(node, NONE)
+        return node
+
+    def insert_at_position(self, data, target_position) -> int:
+        # Valid positions are 1 to count + 1
+        if (target_position <= 0 or target_position > self.count + 1):
+            if (self.observer != None):
+                self.observer("Invalid position")
+            return NONE
+
+        if (target_position == self.count + 1):
+            return self.insert_at_end(data)
+
+        next_node = self._get_node(target_position)
+        node = self._allocate(data)
+        self._link_before(node, next_node)
+        return node
+
+    def delete_at_beginning(self):
+        if (self.head == NONE):
+            return
+        self.remove_node(self.head)
+
+    # Time complexity O(1)
+    def delete_at_end(self):
+        if (self.tail == NONE):
+            return
+        self.remove_node(self.tail)
+
+    def delete_at_position(self, target_position):
+        # Valid positions are 1 to count
+        if (target_position <= 0 or target_position > self.count):
+            if (self.observer != None):
+                self.observer(f"Invalid target position {target_position}")
+            return
+
+        self.remove_node(self._get_node(target_position))
+
+    # Returns True when the key is present
+    def search(self, key) -> bool:
+        data = self.data
+        next = self.next
+        current_node = self.head
+        while (current_node != NONE):
+            if (data[current_node] == key):
+                return True
+            current_node = next[current_node]
+        return False
+
+    def print_all_nodes(self):
+        print(" \n Printing all the nodes in the doubly linked list \n")
+        if (self.head == NONE):
+            print("List is empty")
+            return
+
+        for value in self:
+            print(f" <-- {value} -->", end=" ")
+
+    # Renumbers the nodes in list order: node i becomes index i, so the
+    # arrays have no holes and are read front to back while walking.
+    # Node indexes (handles) taken before compact() are no longer valid.
+    def compact(self):
+        data = array(self.typecode, self)
+        count = self.count
+
+        self.data = data
+        self.prev = array("q", range(-1, count - 1))
+        self.next = array("q", range(1, count + 1))
+        if (count > 0):
+            self.next[count - 1] = NONE
+
+        self.head = 0 if (count > 0) else NONE
+        self.tail = count - 1 if (count > 0) else NONE
+        self.free_head = NONE
+
+
+### This code is outside the class
+# Driver code to test the above class
+
+def operations_test(dlist: ArrayDoublyLinkedList):
+    dlist.insert_at_end(20)
+    dlist.insert_at_end(40)
+    dlist.insert_at_beginning(10)
+    dlist.insert_at_position(30, 3)
+    dlist.insert_at_position(100, 10)
+    dlist.print_all_nodes()
+
+    dlist.delete_at_position(2)
+    dlist.delete_at_end()
+    dlist.insert_at_end(50)
+    print(f"\nValues = {list(dlist)}, search 50 = {dlist.search(50)}, 20 in list = {20 in dlist}")
+    print(f"Before compact: data = {dlist.data.tolist()}, next = {dlist.next.tolist()}")
+
+    dlist.compact()
+    print(f"After compact : data = {dlist.data.tolist()}, next = {dlist.next.tolist()}")
+
+# Memory used per element, DoublyLinkedList against ArrayDoublyLinkedList
+def memory_test(size: int = 1_000_000):
+    import tracemalloc
+    from DoublyLinkedList import DoublyLinkedList
+
+    for list_class in (DoublyLinkedList, ArrayDoublyLinkedList):
+        tracemalloc.start()
+        dlist = list_class()
+        for value in range(size):
+            dlist.insert_at_end(value)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{list_class.__name__:>22}: {current / size:.1f} bytes per element")
+
+
+if __name__ == "__main__":
+    dlist = ArrayDoublyLinkedList(observer = print)
+
+    operations_test(dlist)
+
+    #memory_test()
@@ -0,0 +1,174 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import time
+from array import array
+
+# Array backed stack
+# Items live in one growable contiguous buffer and the top of the stack is
+# its last slot, so there is no Node per push:
+#
+#   bottom                 top
+#   [ 1 | 2 | 3 | 4 | 5 ]
+#
+# The buffer is a Python list by default, or an array for numeric data:
+# typecode 'q' (64 bit integers) or 'd' (floats) stores raw numbers,
+# 8 bytes per item instead of one object reference + object per item.
+
+# observer is an optional function which receives diagnostic messages
+class ArrayStack:
+
+    def __init__(self, typecode: str = None, observer = None):
+        self.typecode = typecode
+        self.items = [] if (typecode == None) else array(typecode)
+        self.observer = observer
+
+    # Number of items, Time complexity O(1)
+    def __len__(self):
+        return len(self.items)
+
+    # Yields the items from top to bottom
+    def __iter__(self):
+        return reversed(self.items)
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def search(self, key) -> bool:
+        return key in self.items
+
+    # Time complexity amortized O(1)
+    def push(self, data):
+        self.items.append(data)
+
+    def pop(self) -> int:
+        # Case 1: Stack is empty
+        if (not self.items):
+            if (self.observer != None):
+                self.observer("Stack is empty! can't perform pop operation")
+            return -100
+
+        return self.items.pop()
+
+    def peek(self) -> int:
+        # Case 1: Stack is empty
+        if (not self.items):
+            if (self.observer != None):
+                self.observer("Stack is empty! can't perform peek operation")
+            return -100
+
+        return self.items[-1]
+
+    def get_count(self) -> int:
+        return len(self.items)
+
+    # Pushes all the values in order, the last value ends up on top
+    def push_many(self, values):
+        self.items.extend(values)
+
+    # Pops up to n items in one slice, returned in pop order (top first)
+    def pop_many(self, n: int) -> list:
+        if (n <= 0):
+            return []
+
+        popped = self.items[-n:]
+        del self.items[-n:]
+        popped.reverse()
+        return popped if (self.typecode == None) else popped.tolist()
+
+    def print_all_values(self):
+        if (not self.items):
+            print("Stack is empty")
+            return
+
+        print("Elements in the stack are as below")
+        for value in self:
+            print(f" {value} ")
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def array_stack_test():
+    stack = ArrayStack(typecode = "q", observer = print)
+    stack.pop()
+    stack.push(1)
+    stack.push_many([2, 3, 4, 5])
+    stack.print_all_values()
+
+    print(f"Peek = {stack.peek()}, count = {stack.get_count()}")
+    print(f"pop_many(3) = {stack.pop_many(3)}, left = {list(stack)}")
+
+# Push n items then pop n items, one at a time and in bulk.
+# large_sizes are opt-in, e.g. (10_000_000, 100_000_000), and skip the linked
+# Stack: 10 ** 8 items need about 1 GB as ArrayStack q and several GB as list.
+def stack_benchmark(sizes = (1_000, 100_000, 1_000_000), large_sizes = ()):
+    from Stack import Stack
+
+    def run_single(stack, size: int):
+        for value in range(size):
+            stack.push(value)
+        for _ in range(size):
+            stack.pop()
+
+    def run_list(stack: list, size: int):
+        for value in range(size):
+            stack.append(value)
+        for _ in range(size):
+            stack.pop()
+
+    def run_bulk(stack: ArrayStack, size: int):
+        stack.push_many(range(size))
+        stack.pop_many(size)
+
+    workloads = [
+        ("linked Stack", lambda: Stack(), run_single),
+        ("list", lambda: [], run_list),
+        ("ArrayStack", lambda: ArrayStack(), run_single),
+        ("ArrayStack q", lambda: ArrayStack("q"), run_single),
+        ("ArrayStack bulk", lambda: ArrayStack(), run_bulk),
+        ("ArrayStack q bulk", lambda: ArrayStack("q"), run_bulk),
+    ]
+
+    print(f"{'operations':>12} {'stack':>18} {'time (s)':>10} {'ops/sec':>14}")
+    for size in list(sizes) + list(large_sizes):
+        for name, create, run in workloads:
+            # One Node object per element does not fit in memory at that size
+            if (size in large_sizes and name == "linked Stack"):
+                continue
+
+            stack = create()
+            start = time.perf_counter()
+            run(stack, size)
+            elapsed = time.perf_counter() - start
+            print(f"{2 * size:>12} {name:>18} {elapsed:>10.4f} {2 * size / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    array_stack_test()
+
+    #stack_benchmark()
+    #stack_benchmark(large_sizes = (10_000_000, 100_000_000))
@@ -0,0 +1,231 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from Queue import Queue
+from Stack import Stack
+
+# asyncio versions of Queue and Stack
+#
+# put waits while the container is full (capacity > 0), get waits while it
+# is empty. Waiting coroutines park on a future in FIFO order:
+#   getters : futures of coroutines waiting for an item
+#   putters : (future, item) of coroutines waiting for a free slot
+#
+# Fast path: when an operation can complete immediately no future is created
+# and the coroutine never yields to the event loop, so a put / get costs about
+# one enqueue / dequeue. Handoffs are direct, so a woken coroutine never has
+# to check again:
+#   put with waiting getters : the item goes straight to the oldest getter
+#   get with waiting putters : the freed slot is filled with the item of the
+#                              oldest putter, which is then woken
+#
+# Both classes share this logic, they only differ in _add / _take.
+class AsyncContainer:
+
+    def _init_waiters(self, capacity: int):
+        if (capacity < 0):
+            raise ValueError("capacity can not be negative")
+
+        # capacity 0 means unbounded
+        self.capacity = capacity
+        self.getters = deque()
+        self.putters = deque()
+
+    def full(self) -> bool:
+        return self.capacity > 0 and self.count >= self.capacity
+
+    def empty(self) -> bool:
+        return self.count == 0
+
+    # Gives the item to the oldest getter which is still waiting
+    # Returns False when no getter is waiting
+    def _hand_to_getter(self, data) -> bool:
+        while (self.getters):
+            getter = self.getters.popleft()
+            if (not getter.done()):
+                getter.set_result(data)
+                return True
+        return False
+
+    # Adds the item without waiting, returns False when the container is full
+    def put_nowait(self, data) -> bool:
+        # Case 1: A getter waits, so the container is empty, skip it
+        if (self._hand_to_getter(data)):
+            return True
+
+        # Case 2: Full
+        if (self.full()):
+            if (self.observer != None):
+                self.observer("Container is full")
+            return False
+
+        # Case 3: Free slot
+        self._add(data)
+        return True
+
+    # Removes an item without waiting, returns -100 when empty
+    def get_nowait(self):
+        if (self.count == 0):
+            if (self.observer != None):
+                self.observer("Container is empty")
+            return -100
+
+        data = self._take()
+
+        # One slot became free, it belongs to the oldest waiting putter
+        while (self.putters):
+            putter, pending = self.putters.popleft()
+            if (not putter.done()):
+                self._add(pending)
+                putter.set_result(None)
+                break
+        return data
+
+    async def put(self, data):
+        # Fast path, no future and no trip through the event loop
+        if (not self.getters and (self.capacity == 0 or self.count < self.capacity)):
+            self._add(data)
+            return
+        if (self.put_nowait(data)):
+            return
+
+        putter = asyncio.get_running_loop().create_future()
+        self.putters.append((putter, data))
+        # A cancelled putter stays in the deque, get_nowait skips it. When it
+        # is cancelled after it was woken, the item was already added.
+        await putter
+
+    async def get(self):
+        # Fast path, no future and no trip through the event loop
+        if (self.count > 0):
+            if (not self.putters):
+                return self._take()
+            return self.get_nowait()
+
+        getter = asyncio.get_running_loop().create_future()
+        self.getters.append(getter)
+        try:
+            return await getter
+        except asyncio.CancelledError:
+            # Cancelled after an item was handed over: pass the item on to
+            # the next getter, or keep it even if that exceeds the capacity
+            if (not getter.cancelled()):
+                data = getter.result()
+                if (not self._hand_to_getter(data)):
+                    self._add(data)
+            raise
+
+# FIFO: get returns the oldest item
+class AsyncQueue(AsyncContainer, Queue):
+
+    def __init__(self, capacity: int = 0, observer = None, node_pool = None):
+        Queue.__init__(self, observer, node_pool)
+        self._init_waiters(capacity)
+
+    _add = Queue.enqueue
+    _take = Queue.dequeue
+
+# LIFO: get returns the newest item
+class AsyncStack(AsyncContainer, Stack):
+
+    def __init__(self, capacity: int = 0, observer = None, node_pool = None):
+        Stack.__init__(self, observer, node_pool)
+        self._init_waiters(capacity)
+
+    _add = Stack.push
+    _take = Stack.pop
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+async def async_queue_test():
+    jobs = AsyncQueue(capacity = 2)
+
+    async def producer():
+        for number in range(1, 6):
+            await jobs.put(number)
+            print(f"Put {number}, count = {jobs.get_count()}")
+        await jobs.put(None)
+
+    async def consumer():
+        while (True):
+            number = await jobs.get()
+            if (number == None):
+                break
+            print(f"Got {number}")
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(producer(), consumer())
+
+    stack = AsyncStack()
+    for number in (1, 2, 3):
+        await stack.put(number)
+    print(f"Stack gets {await stack.get()}, {await stack.get()}, {await stack.get()}")
+    print(f"get_nowait on empty stack = {stack.get_nowait()}")
+
+# One producer and one consumer task move n items
+async def _run_pipeline(container, put, get, items: int) -> float:
+    async def producer():
+        for value in range(items):
+            await put(container, value)
+
+    async def consumer():
+        for _ in range(items):
+            await get(container)
+
+    start = time.perf_counter()
+    await asyncio.gather(producer(), consumer())
+    return items / (time.perf_counter() - start)
+
+async def _async_benchmark(items: int, capacities):
+    variants = [
+        ("asyncio.Queue", asyncio.Queue, asyncio.Queue.put, asyncio.Queue.get),
+        ("AsyncQueue", AsyncQueue, AsyncQueue.put, AsyncQueue.get),
+        ("asyncio.LifoQueue", asyncio.LifoQueue, asyncio.LifoQueue.put, asyncio.LifoQueue.get),
+        ("AsyncStack", AsyncStack, AsyncStack.put, AsyncStack.get),
+    ]
+
+    print(f"{'capacity':>10} {'container':>18} {'items/sec':>12}")
+    for capacity in capacities:
+        for name, create, put, get in variants:
+            rate = await _run_pipeline(create(capacity), put, get, items)
+            print(f"{capacity:>10} {name:>18} {rate:>12,.0f}")
+
+# capacity 0 (unbounded) runs the producer without waiting, small
+# capacities force the producer and consumer to take turns
+def async_benchmark(items: int = 200_000, capacities = (0, 1_000, 10)):
+    asyncio.run(_async_benchmark(items, capacities))
+
+
+if __name__ == "__main__":
+    asyncio.run(async_queue_test())
+
+    #async_benchmark()
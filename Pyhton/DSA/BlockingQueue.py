@@ -0,0 +1,182 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import queue
+import threading
+import time
+
+from Queue import Queue
+
+# Bounded blocking queue for producer / consumer pipelines
+#
+#   producers --enqueue--> [ front ... rear ] --dequeue--> consumers
+#                           at most `capacity`
+#
+# One lock protects the linked Queue. Two conditions on that lock let
+# threads sleep instead of spinning:
+#   not_full  : producers wait here while the queue is full (backpressure)
+#   not_empty : consumers wait here while the queue is empty
+# timeout = None waits forever, timeout = 0 never waits.
+class BlockingQueue(Queue):
+
+    def __init__(self, capacity: int, observer = None, node_pool = None):
+        if (capacity <= 0):
+            raise ValueError("capacity must be greater than 0")
+
+        super().__init__(observer, node_pool)
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    # Adds data at the rear, waits while the queue is full
+    # Returns False when the timeout expired before there was room
+    def enqueue(self, data, timeout: float = None) -> bool:
+        with self.not_full:
+            # Only build the wait predicate when we really have to wait
+            if (self.count >= self.capacity and
+                    not self.not_full.wait_for(lambda: self.count < self.capacity, timeout)):
+                return False
+
+            super().enqueue(data)
+            self.not_empty.notify()
+            return True
+
+    # Removes the front element, waits while the queue is empty
+    # Returns -100 (like Queue.dequeue on an empty queue) on timeout
+    def dequeue(self, timeout: float = None) -> int:
+        with self.not_empty:
+            if (self.count == 0 and
+                    not self.not_empty.wait_for(lambda: self.count > 0, timeout)):
+                return -100
+
+            data = super().dequeue()
+            self.not_full.notify()
+            return data
+
+    # Waits like dequeue for the first element, then takes up to max_n
+    # elements under the same lock, so the lock is taken once per batch
+    # instead of once per element. Returns an empty list on timeout.
+    def dequeue_many(self, max_n: int, timeout: float = None) -> list:
+        with self.not_empty:
+            if (self.count == 0 and
+                    not self.not_empty.wait_for(lambda: self.count > 0, timeout)):
+                return []
+
+            batch = []
+            for _ in range(min(max_n, self.count)):
+                batch.append(super().dequeue())
+
+            # Several slots became free, wake up to that many producers
+            self.not_full.notify(len(batch))
+            return batch
+
+    def peek(self) -> int:
+        with self.lock:
+            return super().peek()
+
+    def get_count(self) -> int:
+        with self.lock:
+            return self.count
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def producer_consumer_test():
+    pipeline = BlockingQueue(capacity = 2)
+
+    def producer():
+        for value in range(1, 6):
+            pipeline.enqueue(value)
+            print(f"Produced {value}")
+        pipeline.enqueue(None)
+
+    thread = threading.Thread(target = producer)
+    thread.start()
+
+    while (True):
+        value = pipeline.dequeue()
+        if (value == None):
+            break
+        print(f"Consumed {value}")
+        time.sleep(0.01)
+    thread.join()
+
+    print(f"Timed out dequeue returns {pipeline.dequeue(timeout = 0.01)}")
+
+# Runs `producers` threads putting items and `consumers` threads taking them
+# and returns items per second. get_batch returns the items of one take.
+def _run_pipeline(make_queue, put, get_batch, producers: int, consumers: int, items: int) -> float:
+    work_queue = make_queue()
+    per_producer = items // producers
+
+    def produce():
+        for value in range(per_producer):
+            put(work_queue, value)
+
+    # None is the stop signal, one per consumer. A batch can hold the stop
+    # signals of other consumers too, those are put back before stopping.
+    def consume():
+        while (True):
+            batch = get_batch(work_queue)
+            if (None in batch):
+                for _ in range(batch.count(None) - 1):
+                    put(work_queue, None)
+                return
+
+    threads = [threading.Thread(target = produce) for _ in range(producers)]
+    threads += [threading.Thread(target = consume) for _ in range(consumers)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[:producers]:
+        thread.join()
+    for _ in range(consumers):
+        put(work_queue, None)
+    for thread in threads[producers:]:
+        thread.join()
+    return per_producer * producers / (time.perf_counter() - start)
+
+def throughput_benchmark(items: int = 200_000, capacity: int = 1_000, shapes = ((1, 1), (4, 1), (1, 4), (4, 4))):
+    variants = [
+        ("queue.Queue", lambda: queue.Queue(capacity), queue.Queue.put, lambda q: (q.get(),)),
+        ("BlockingQueue", lambda: BlockingQueue(capacity), BlockingQueue.enqueue, lambda q: (q.dequeue(),)),
+        ("BlockingQueue x64", lambda: BlockingQueue(capacity), BlockingQueue.enqueue, lambda q: q.dequeue_many(64)),
+    ]
+
+    print(f"{'producers':>10} {'consumers':>10} {'queue':>18} {'items/sec':>12}")
+    for producers, consumers in shapes:
+        for name, make_queue, put, get_batch in variants:
+            rate = _run_pipeline(make_queue, put, get_batch, producers, consumers, items)
+            print(f"{producers:>10} {consumers:>10} {name:>18} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    producer_consumer_test()
+
+    #throughput_benchmark()
@@ -0,0 +1,369 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import functools
+import sys
+import threading
+
+from DoublyLinkedList import DoublyLinkedList, Node
+
+# Caches with eviction built on DoublyLinkedList
+#
+# A dictionary maps every key to its node in a doubly linked list. With the
+# node in hand we can unlink it / move it to the front in O(1) using
+# remove_node / insert_node_at_beginning, so get, put and evict are all O(1).
+#
+# LRU (least recently used):
+#   most recent                                      least recent
+#   head <--> [C] <--> [A] <--> [D] <--> [B] <--> tail   --> evict B
+#
+# LFU (least frequently used): one list per access frequency, the least
+# recently used node of the lowest frequency is evicted
+#   freq 1: [E] <--> [F]          --> evict F
+#   freq 3: [A] <--> [C]
+
+# Used by get to tell "key missing" apart from a stored None value
+_MISSING = object()
+
+# Data stored in every node of the cache lists
+class CacheEntry:
+    __slots__ = ("key", "value", "size", "frequency")
+
+    def __init__(self, key, value, size: int):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.frequency = 1
+
+# Common limits, counters and helpers for LRUCache and LFUCache
+# max_size  : maximum number of entries (None means no limit)
+# max_bytes : maximum total size of the values (None means no limit)
+# size_of   : function returning the size of a value, sys.getsizeof by default
+class BaseCache:
+
+    def __init__(self, max_size: int = 128, max_bytes: int = None, size_of = sys.getsizeof):
+        if (max_size != None and max_size <= 0):
+            raise ValueError("max_size must be greater than 0")
+        if (max_bytes != None and max_bytes <= 0):
+            raise ValueError("max_bytes must be greater than 0")
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.nodes = {}
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    # Checks presence only, does not count as a hit / miss or an access
+    def __contains__(self, key):
+        return key in self.nodes
+
+    def get_stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.nodes),
+            "bytes": self.total_bytes,
+        }
+
+    # True when adding `size` more bytes / one more entry breaks a limit
+    def _is_over_limit(self, extra_entries: int, extra_bytes: int) -> bool:
+        if (self.max_size != None and len(self.nodes) + extra_entries > self.max_size):
+            return True
+        if (self.max_bytes != None and self.total_bytes + extra_bytes > self.max_bytes):
+            return True
+        return False
+
+    def get(self, key, default = None):
+        node = self.nodes.get(key)
+        if (node == None):
+            self.misses = self.misses + 1
+            return default
+
+        self.hits = self.hits + 1
+        self._on_access(node)
+        return node.data.value
+
+    def put(self, key, value):
+        size = 0 if (self.max_bytes == None) else self.size_of(value)
+
+        # A value bigger than the whole cache is never stored
+        if (self.max_bytes != None and size > self.max_bytes):
+            self.delete(key)
+            return
+
+        # Key already present, replace the value and count it as an access
+        node = self.nodes.get(key)
+        if (node != None):
+            self.total_bytes = self.total_bytes - node.data.size + size
+            node.data.value = value
+            node.data.size = size
+            self._on_access(node)
+            while (self._is_over_limit(0, 0)):
+                self._evict(protected = node)
+            return
+
+        while (len(self.nodes) > 0 and self._is_over_limit(1, size)):
+            self._evict()
+
+        node = Node(CacheEntry(key, value, size))
+        self.nodes[key] = node
+        self.total_bytes = self.total_bytes + size
+        self._on_insert(node)
+
+    # Removes the key, returns True when it was present
+    def delete(self, key) -> bool:
+        node = self.nodes.pop(key, None)
+        if (node == None):
+            return False
+
+        self.total_bytes = self.total_bytes - node.data.size
+        self._on_remove(node)
+        return True
+
+    def clear(self):
+        for key in list(self.nodes):
+            self.delete(key)
+
+    # Removes the entry chosen by the eviction policy
+    def _evict(self, protected: Node = None):
+        node = self._choose_victim(protected)
+        del self.nodes[node.data.key]
+        self.total_bytes = self.total_bytes - node.data.size
+        self._on_remove(node)
+        self.evictions = self.evictions + 1
+
+class LRUCache(BaseCache):
+
+    def __init__(self, max_size: int = 128, max_bytes: int = None, size_of = sys.getsizeof):
+        super().__init__(max_size, max_bytes, size_of)
+        # Most recently used entry at head, least recently used at tail
+        self.order = DoublyLinkedList()
+
+    def _on_access(self, node: Node):
+        self.order.move_to_beginning(node)
+
+    def _on_insert(self, node: Node):
+        self.order.insert_node_at_beginning(node)
+
+    def _on_remove(self, node: Node):
+        self.order.remove_node(node)
+
+    def _choose_victim(self, protected: Node) -> Node:
+        node = self.order.tail
+        if (node == protected):
+            node = node.prev
+        return node
+
+class LFUCache(BaseCache):
+
+    def __init__(self, max_size: int = 128, max_bytes: int = None, size_of = sys.getsizeof):
+        super().__init__(max_size, max_bytes, size_of)
+        # frequency --> DoublyLinkedList of nodes, most recent at head
+        self.frequency_lists = {}
+        # The frequencies which have a list are chained in increasing order
+        # (frequency --> next lower / higher one, None at the ends), so the
+        # lowest one is known without scanning when a list becomes empty
+        self.lower_frequency = {}
+        self.higher_frequency = {}
+        self.min_frequency = None
+
+    # Links the node in the list of its frequency. lower is the highest
+    # frequency below it which has a list, used when the list is created.
+    def _link(self, node: Node, lower: int):
+        frequency = node.data.frequency
+        frequency_list = self.frequency_lists.get(frequency)
+        if (frequency_list == None):
+            frequency_list = DoublyLinkedList()
+            self.frequency_lists[frequency] = frequency_list
+
+            higher = self.min_frequency if (lower == None) else self.higher_frequency[lower]
+            self.lower_frequency[frequency] = lower
+            self.higher_frequency[frequency] = higher
+            if (lower == None):
+                self.min_frequency = frequency
+            else:
+                self.higher_frequency[lower] = frequency
+            if (higher != None):
+                self.lower_frequency[higher] = frequency
+        frequency_list.insert_node_at_beginning(node)
+
+    # Unlinks the node, an empty frequency list leaves the chain. Returns the
+    # highest frequency up to the one of the node which still has a list.
+    def _unlink(self, node: Node) -> int:
+        frequency = node.data.frequency
+        frequency_list = self.frequency_lists[frequency]
+        frequency_list.remove_node(node)
+        if (len(frequency_list) != 0):
+            return frequency
+
+        del self.frequency_lists[frequency]
+        lower = self.lower_frequency.pop(frequency)
+        higher = self.higher_frequency.pop(frequency)
+        if (lower == None):
+            self.min_frequency = higher
+        else:
+            self.higher_frequency[lower] = higher
+        if (higher != None):
+            self.lower_frequency[higher] = lower
+        return lower
+
+    # Moves the node from the list of frequency f to the list of f + 1
+    def _on_access(self, node: Node):
+        lower = self._unlink(node)
+        node.data.frequency = node.data.frequency + 1
+        self._link(node, lower)
+
+    # A new node has frequency 1, no list can be below it
+    def _on_insert(self, node: Node):
+        self._link(node, None)
+
+    def _on_remove(self, node: Node):
+        self._unlink(node)
+
+    def _choose_victim(self, protected: Node) -> Node:
+        node = self.frequency_lists[self.min_frequency].tail
+        if (node != protected):
+            return node
+
+        # Protected node is the only candidate of the lowest frequency
+        if (node.prev != None):
+            return node.prev
+        return self.frequency_lists[self.higher_frequency[self.min_frequency]].tail
+
+# Wraps any cache so that it can be shared between threads
+# Every operation holds one lock, the wrapped cache stays unchanged
+class ThreadSafeCache:
+
+    def __init__(self, cache: BaseCache):
+        self.cache = cache
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.cache)
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.cache
+
+    def get(self, key, default = None):
+        with self.lock:
+            return self.cache.get(key, default)
+
+    def put(self, key, value):
+        with self.lock:
+            self.cache.put(key, value)
+
+    def delete(self, key) -> bool:
+        with self.lock:
+            return self.cache.delete(key)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return self.cache.get_stats()
+
+# Decorator for bounded memoization of a function with hashable arguments
+#   @memoize(LRUCache(max_size = 1000))
+#   def expensive(x): ...
+def memoize(cache):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            result = cache.get(key, _MISSING)
+            if (result is _MISSING):
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+### This code is outside the class
+# Driver code to test the above classes
+
+def lru_cache_test():
+    cache = LRUCache(max_size = 3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")          # a becomes most recent, b is least recent
+    cache.put("d", 4)       # evicts b
+
+    print(f"LRU keys = {[entry.key for entry in cache.order]}")
+    print(f"b in cache = {'b' in cache}, get('a') = {cache.get('a')}")
+    print(f"LRU stats = {cache.get_stats()}")
+
+def lfu_cache_test():
+    cache = LFUCache(max_size = 3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.put("d", 4)       # c was used least often, evicts c
+
+    print(f"c in cache = {'c' in cache}, a in cache = {'a' in cache}")
+    print(f"LFU stats = {cache.get_stats()}")
+
+def max_bytes_test():
+    cache = LRUCache(max_size = None, max_bytes = 100, size_of = len)
+    cache.put("x", "x" * 40)
+    cache.put("y", "y" * 40)
+    cache.put("z", "z" * 40)  # 120 bytes would be too many, evicts x
+
+    print(f"Keys = {[entry.key for entry in cache.order]}, bytes = {cache.total_bytes}")
+
+def memoize_test():
+    @memoize(ThreadSafeCache(LRUCache(max_size = 100)))
+    def fibonacci(n: int) -> int:
+        if (n < 2):
+            return n
+        return fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(f"fibonacci(80) = {fibonacci(80)}, stats = {fibonacci.cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    lru_cache_test()
+    lfu_cache_test()
+    max_bytes_test()
+    memoize_test()
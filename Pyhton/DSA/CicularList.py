@@ -28,16 +28,45 @@
 """
 
 # This class represent a single node
+# prev makes the ring doubly linked, so the node before tail is known
+# without walking around the whole ring
 class Node:
 
     def __init__(self, data):
         self.data = data
         self.next = None
+        self.prev = None
 
+# observer is an optional function which receives diagnostic messages
 class CicularList:
 
-    def __init__(self):
+    def __init__(self, observer = None):
         self.tail = None
+        self.count = 0
+        self.observer = observer
+
+    # Number of nodes in the list, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the data of every node once, starting from the node after tail
+    # and stopping at tail, so there is no risk of looping forever
+    def __iter__(self):
+        if (self.tail == None):
+            return
+
+        current_node = self.tail.next
+        while (True):
+            yield current_node.data
+
+            if (current_node == self.tail):
+                break
+
+            current_node = current_node.next
+
+    # Supports "key in clist"
+    def __contains__(self, key):
+        return self.search_key(key)
     
     # This function insert a node after tail (start)
     # If there is node at start then it becomes the 2nd node
@@ -46,15 +75,19 @@ class CicularList:
     def insert_at_beginning(self, data):
         # Create new node
         new_node = Node(data)
+        self.count = self.count + 1
 
         # Empty list
         if (self.tail == None):
             self.tail = new_node
             new_node.next = new_node
+            new_node.prev = new_node
             return
 
         # Single node / multi node
         new_node.next = self.tail.next
+        new_node.prev = self.tail
+        self.tail.next.prev = new_node
         self.tail.next = new_node
 
     
@@ -62,16 +95,19 @@ class CicularList:
     # Time complexity O(1)
     def insert_at_tail(self, data):
         new_node = Node(data)
+        self.count = self.count + 1
 
         # Case 1: Empty list
         if (self.tail == None):
             self.tail = new_node
             new_node.next = new_node
+            new_node.prev = new_node
             return
         
-        # You don't know the address of node before the tail node.
         # Case 2: Single node / multi node
         new_node.next = self.tail.next
+        new_node.prev = self.tail
+        self.tail.next.prev = new_node
         self.tail.next = new_node
         self.tail = new_node
 
@@ -80,9 +116,12 @@ class CicularList:
     def delete_at_beginning(self):
         # List empty
         if (self.tail == None):
-            print("List is empty")
+            if (self.observer != None):
+                self.observer("List is empty")
             return
         
+        self.count = self.count - 1
+
         # Case 1: Single node then list will become empty
         if (self.tail.next == self.tail):
             self.tail = None
@@ -90,28 +129,44 @@ class CicularList:
         
         # Case 2: Two or more nodes
         self.tail.next = self.tail.next.next 
+        self.tail.next.prev = self.tail
 
     # Node before tail becomes the new tail
-    # Since we don't have address of node before tail node 
-    # we have to traverse to reach there
+    # tail.prev is the node before tail, so no traversal is needed
+    # Time complexity O(1)
     def delete_at_tail(self):
         # Case 1: Empty list
         if (self.tail == None):
             return
         
+        self.count = self.count - 1
+
         # Case 2: Single node
         if (self.tail.next == self.tail):
             self.tail = None
             return
         
         # Case 3: 2 or more nodes
-        # Find the ref to the node previous to the current tail node
-        new_tail = self.tail.next
-        while (new_tail.next != self.tail ):
-            new_tail = new_tail.next
-
-        new_tail.next   = self.tail.next
+        new_tail = self.tail.prev
+        new_tail.next = self.tail.next
+        self.tail.next.prev = new_tail
         self.tail = new_tail
+
+    # Rotates the list left by k: the first k nodes move to the end.
+    # Negative k rotates right. Only tail moves, walking forward k steps or
+    # backward count - k steps, whichever is shorter: O(min(k, n - k))
+    # Round robin: rotate(1) makes the next node the start of the list
+    def rotate(self, k: int = 1):
+        if (self.tail == None):
+            return
+
+        k = k % self.count
+        if (k <= self.count - k):
+            for _ in range(k):
+                self.tail = self.tail.next
+        else:
+            for _ in range(self.count - k):
+                self.tail = self.tail.prev
     
     def print_all_nodes(self):
         # Case 1: List is empty
@@ -130,24 +185,29 @@ class CicularList:
         # This is after the while loop
 
 
-    def search_key(self, key):
+    # Returns True when the key is present, nothing is printed in the loop
+    def search_key(self, key) -> bool:
         # Case 1: List is empty
         if (self.tail == None):
-            print("List is empty")
-            return
+            if (self.observer != None):
+                self.observer("List is empty")
+            return False
 
         current_node = self.tail.next
         while (True):
             if (current_node.data == key):
-                print("Key is found in the list")
-                return
+                if (self.observer != None):
+                    self.observer("Key is found in the list")
+                return True
 
             if (current_node == self.tail):
                 break
             
             current_node = current_node.next
         
-        print("Key is not present in the list")
+        if (self.observer != None):
+            self.observer("Key is not present in the list")
+        return False
 
 def Cicular_list_tests(clist: CicularList):
     # List is empty and trying to delete a node
@@ -174,8 +234,24 @@ def Cicular_list_tests(clist: CicularList):
 
     clist.insert_at_tail(40)
     clist.print_all_nodes()
-    clist.search_key(40)
-    clist.search_key(100)
+    print(f"Search 40 = {clist.search_key(40)}")
+    print(f"Search 100 = {clist.search_key(100)}")
+    print(f"Values = {list(clist)}, count = {len(clist)}")
+
+# Round robin scheduling: serve the first task, then rotate it to the end
+def round_robin_test(clist: CicularList):
+    for task in ("A", "B", "C", "D"):
+        clist.insert_at_tail(task)
+
+    for _ in range(6):
+        print(f"Serving task {clist.tail.next.data}, order = {list(clist)}")
+        clist.rotate(1)
+
+    clist.rotate(-2)
+    print(f"After rotate(-2) order = {list(clist)}")
+
+    clist.delete_at_tail()
+    print(f"After delete_at_tail order = {list(clist)}, count = {len(clist)}")
 
 def demo_infinite_loop(clist: CicularList):
     clist.insert_at_beginning(10)
@@ -188,11 +264,13 @@ def demo_infinite_loop(clist: CicularList):
 
 
 if __name__ == "__main__":
-    clist = CicularList()
+    clist = CicularList(observer = print)
     #Cicular_list_tests(clist)
 
     demo_infinite_loop(clist)
 
+    #round_robin_test(CicularList())
+
 
 
     
@@ -24,21 +24,101 @@ Telegram: https://t.me/+hyVHXek9WM0zNWQ1
 -----------------------------------------------------------------------------
 """
 
+import random
+import time
+
 class Node:
+    __slots__ = ("data", "prev", "next")
+
     def __init__(self, data):
         self.data = data
         self.prev = None
         self.next = None
 
+# observer is an optional function which receives diagnostic messages
+# node_pool is an optional NodePool(Node) which recycles deleted nodes.
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, observer = None, node_pool = None):
         self.head = None
+        # Last node and number of nodes, so that we can add / remove at the
+        # end in O(1) and walk to a position from whichever end is closer
+        self.tail = None
+        self.count = 0
+        self.observer = observer
+        self.node_pool = node_pool
+
+    # Number of nodes in the list, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the data of every node from head to the last node
+    def __iter__(self):
+        current_node = self.head
+        while (current_node != None):
+            yield current_node.data
+            current_node = current_node.next
+
+    # Supports "key in dlist"
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Returns the node at the given position (1 to count)
+    # Walks forward from head when the position is in the first half,
+    # otherwise walks backward from tail, so at most count / 2 steps
+    def _get_node(self, target_position: int) -> Node:
+        if (target_position <= (self.count + 1) // 2):
+            current_node = self.head
+            for _ in range(target_position - 1):
+                current_node = current_node.next
+        else:
+            current_node = self.tail
+            for _ in range(self.count - target_position):
+                current_node = current_node.prev
+        return current_node
     
+    # Unlinks the given node in O(1), the node must belong to this list.
+    # Used when we already hold a reference (handle) to the node,
+    # e.g. from a dictionary, so no search is needed.
+    def remove_node(self, node: Node):
+        if (node.prev == None):
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if (node.next == None):
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = None
+        node.next = None
+        self.count = self.count - 1
+
+    # Links an existing (unlinked) node at the beginning in O(1)
+    def insert_node_at_beginning(self, node: Node):
+        node.prev = None
+        node.next = self.head
+        if (self.head == None):
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+        self.count = self.count + 1
+
+    # Moves a node of this list to the beginning in O(1)
+    def move_to_beginning(self, node: Node):
+        if (node == self.head):
+            return
+        self.remove_node(node)
+        self.insert_node_at_beginning(node)
+
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
+        self.count = self.count + 1
         # Case 1: List is empty
         if (self.head == None):
             self.head = new_node
+            self.tail = new_node
             return
 
         # Case 2: List has one or more nodes 
@@ -47,27 +127,20 @@ class DoublyLinkedList:
         self.head = new_node #3
 
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
+        self.count = self.count + 1
 
         # Case 1: List is empty
         if (self.head == None):
             self.head = new_node
+            self.tail = new_node
             return
 
-        # Case 2: List has only one node
-        if (self.head.next == None):
-            self.head.next = new_node
-            new_node.prev = self.head
-            return
-        
-        # Case 3: List has more than one node
-        # Loop exist to find the ref to the last node
-        last_node = self.head
-        while (last_node.next != None):
-            last_node = last_node.next
-        
-        last_node.next = new_node
-        new_node.prev = last_node
+        # Case 2: List has one or more nodes
+        # tail is the last node, no loop is needed
+        self.tail.next = new_node
+        new_node.prev = self.tail
+        self.tail = new_node
 
     def print_all_nodes(self):
         print(" \n Printing all the nodes in the doubly linked list \n")
@@ -83,142 +156,182 @@ class DoublyLinkedList:
             current_node = current_node.next
         
     
-    def search(self, key):
-        if (self.head == None):
-            print("Key is not found in the list")
-            return
-        
-        # Case 2: List has more than one node
+    # Returns True when the key is present, nothing is printed in the loop
+    def search(self, key) -> bool:
         current_node = self.head
         while (current_node != None):
             if (current_node.data == key):
-                print("Key is found in the list")
-                return
+                if (self.observer != None):
+                    self.observer("Key is found in the list")
+                return True
             
             current_node = current_node.next
         
         # if we reach here, it means key is not found
-        print("Key is not found in the list")
+        if (self.observer != None):
+            self.observer("Key is not found in the list")
+        return False
 
     def delete_at_beginning(self):
         # Case 1: List is empty
         if (self.head == None):
             return
         
+        self.count = self.count - 1
+        deleted_node = self.head
+
         # Case 2: Only one node is present
         if (self.head.next == None):
             self.head = None
-            return
-        
-        # Case 3: We have 2 or more nodes
-        self.head = self.head.next
-        self.head.prev = None
-
-        # You can also write above two lines in this way for simplicity
-        """
-        new_head = self.head.next 
-        new_head.prev = None
-        self.head = new_head 
-        """
-
+            self.tail = None
+        else:
+            # Case 3: We have 2 or more nodes
+            self.head = self.head.next
+            self.head.prev = None
+
+            # You can also write above two lines in this way for simplicity
+            """
+            new_head = self.head.next 
+            new_head.prev = None
+            self.head = new_head 
+            """
+
+        if (self.node_pool != None):
+            self.node_pool.release(deleted_node)
+
+    # Time complexity O(1), tail.prev is the node before the last node
     def delete_at_end(self):
         # Case 1: List is empty
         if (self.head == None):
             return
         
+        self.count = self.count - 1
+        deleted_node = self.tail
+
         # Case 2: List has only one node
         if (self.head.next == None):
             self.head = None
-            return
-        
-        # Case 3: 2 more more nodes present in the list
-        # Loop till we get last_node to last but one node
-        last_node = self.head
-        while(last_node.next.next != None):
-            last_node = last_node.next
-        
-        last_node.next = None
+            self.tail = None
+        else:
+            # Case 3: 2 more more nodes present in the list
+            # Node before the tail becomes the new tail
+            self.tail = self.tail.prev
+            self.tail.next = None
+
+        if (self.node_pool != None):
+            self.node_pool.release(deleted_node)
 
     def insert_at_position(self, data, target_position):
-        print(f"\nInsert at position {target_position} value {data}")
+        if (self.observer != None):
+            self.observer(f"\nInsert at position {target_position} value {data}")
         
         if (target_position <= 0 ):
-            print("Invalid position")
+            if (self.observer != None):
+                self.observer("Invalid position")
             return
         
-        # When list is empty, we can only support insert at position 1
-        if (self.head == None and target_position != 1):
-            print("Invalid position")
+        # Valid positions are 1 to count + 1, this also covers the empty
+        # list where we can only support insert at position 1
+        if (target_position > self.count + 1):
+            if (self.observer != None):
+                self.observer("Invalid position")
             return
         
         if (target_position == 1):
             self.insert_at_beginning(data)
             return
 
-        # Trying to handle the case when we have only one node and valid operation is 
-        # you can insert at 1st or 2nd position
-      #  if (self.head.next == None and target_position > 2):
-        #    print("Invalid position")
-        
-        current_position = 1
-        current_node = self.head
-        while (current_node != None and current_position < target_position-1):
-            current_position = current_position + 1
-            current_node = current_node.next
-
-        if (current_node == None):
-            print("Invalid position")
+        if (target_position == self.count + 1):
+            self.insert_at_end(data)
             return
-        
-        new_node = Node(data)
 
-        # When we are inserting between two nodes, we need these steps
-        if (current_node.next != None):
-            current_node.next.prev = new_node #1
-            new_node.next = current_node.next #2
+        # Node which will come after the new node, walks from the closer end
+        current_node = self._get_node(target_position)
+        
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
+        self.count = self.count + 1
 
-        # These are needed for both inserting between and also at the end
-        current_node.next = new_node #3
-        new_node.prev = current_node #4
+        # We are inserting between current_node.prev and current_node
+        new_node.prev = current_node.prev #1
+        new_node.next = current_node #2
+        current_node.prev.next = new_node #3
+        current_node.prev = new_node #4
 
     def delete_at_position(self, target_position):
         #1. List is empty
         if (self.head == None):
-            print("List is empty")
+            if (self.observer != None):
+                self.observer("List is empty")
             return
         
         #2. Position is invalid 
         if (target_position <= 0):
-            print(f"Invalid target position {target_position}")
+            if (self.observer != None):
+                self.observer(f"Invalid target position {target_position}")
             return
 
-        #3. Single node
-        if (self.head.next == None):
-            self.head = None
+        #3. First node (also covers the single node list)
+        if (target_position == 1):
+            self.delete_at_beginning()
             return
 
-        #4. Multi node
-        to_be_deleted = self.head
-        current_position = 1
-
-        while (current_position < target_position and to_be_deleted is not None):
-            current_position = current_position + 1
-            to_be_deleted = to_be_deleted.next
-        
-        if (to_be_deleted == None):
-            print(f"Target position {target_position} is invalid, we have lesser number of nodes")
+        if (target_position > self.count):
+            if (self.observer != None):
+                self.observer(f"Target position {target_position} is invalid, we have lesser number of nodes")
             return
-        
-              
-        # Case 4.1: to_be_deleted node is the last node
-        if (to_be_deleted.next == None):
-            to_be_deleted.prev.next = None
+
+        #4. Last node, no walk needed
+        if (target_position == self.count):
+            self.delete_at_end()
             return
+
+        #5. Node in between, walks from the closer end
+        to_be_deleted = self._get_node(target_position)
+        self.count = self.count - 1
         
-         # Case 4.2: There are nodes after the to_be_deleted Node
+        # There are nodes before and after the to_be_deleted Node
         to_be_deleted.next.prev = to_be_deleted.prev
         to_be_deleted.prev.next = to_be_deleted.next
 
+        if (self.node_pool != None):
+            self.node_pool.release(to_be_deleted)
+
+
+# Same list but positions are always reached by walking from head,
+# which is how insert_at_position / delete_at_position used to work
+class HeadWalkDoublyLinkedList(DoublyLinkedList):
+    def _get_node(self, target_position: int) -> Node:
+        current_node = self.head
+        for _ in range(target_position - 1):
+            current_node = current_node.next
+        return current_node
+
+# Times insert_at_position + delete_at_position pairs for different list sizes
+# and position distributions, walking from head only vs from the closer end
+def positional_benchmark(sizes = (1_000, 10_000, 50_000), operations: int = 2_000):
+    distributions = {
+        "uniform": lambda size: random.randint(1, size),
+        "near head": lambda size: random.randint(1, max(1, size // 10)),
+        "near tail": lambda size: random.randint(size - size // 10, size),
+    }
+
+    print(f"{'nodes':>8} {'positions':>10} {'head walk (s)':>14} {'closer end (s)':>15} {'speedup':>8}")
+    for size in sizes:
+        for name, next_position in distributions.items():
+            positions = [next_position(size) for _ in range(operations)]
+            timings = []
+            for list_class in (HeadWalkDoublyLinkedList, DoublyLinkedList):
+                dlist = list_class()
+                for value in range(size):
+                    dlist.insert_at_end(value)
+
+                start = time.perf_counter()
+                for position in positions:
+                    dlist.insert_at_position(-1, position)
+                    dlist.delete_at_position(position)
+                timings.append(time.perf_counter() - start)
+
+            print(f"{size:>8} {name:>10} {timings[0]:>14.4f} {timings[1]:>15.4f} {timings[0] / timings[1]:>7.2f}x")
 
 def delete_at_position_test(dlist: DoublyLinkedList):
     dlist.delete_at_position(-1)
@@ -284,8 +397,9 @@ def search_test(dlist: DoublyLinkedList):
     dlist.insert_at_beginning(30)
     dlist.insert_at_beginning(40)
 
-    dlist.search(100)
-    dlist.search(30)
+    print(f"Search 100 = {dlist.search(100)}")
+    print(f"Search 30 = {dlist.search(30)}")
+    print(f"Values = {list(dlist)}, count = {len(dlist)}, 30 in list = {30 in dlist}")
 
 def print_all_nodes_test(dlist: DoublyLinkedList):
     dlist.print_all_nodes()
@@ -309,7 +423,7 @@ def insert_at_end_test(dlist: DoublyLinkedList):
     dlist.insert_at_end(40)
 
 if __name__ == "__main__":
-    dlist = DoublyLinkedList()
+    dlist = DoublyLinkedList(observer = print)
 
     #insert_at_beginning_test(dlist)
     #insert_at_end_test(dlist)
@@ -323,5 +437,7 @@ if __name__ == "__main__":
 
     delete_at_position_test(dlist)
 
+    #positional_benchmark()
+
    
 
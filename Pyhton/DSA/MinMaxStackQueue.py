@@ -0,0 +1,230 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+from collections import deque
+
+from Queue import Queue
+from Stack import Stack
+
+# NumPy is optional, sliding_window_extrema uses it when it is installed
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Stack which knows its minimum and maximum in O(1)
+# Next to the normal stack there are two auxiliary stacks. Their top is the
+# min / max of everything currently in the stack:
+#
+#   push: 5, 2, 8        stack  [5, 2, 8]   (8 on top)
+#                        mins   [5, 2, 2]
+#                        maxs   [5, 5, 8]
+#
+# pop removes the top of all three stacks, so the min / max of the items
+# below are on top again.
+class MinMaxStack(Stack):
+
+    def __init__(self, observer = None, node_pool = None):
+        super().__init__(observer, node_pool)
+        self.mins = Stack()
+        self.maxs = Stack()
+
+    def push(self, data):
+        if (self.top == None):
+            self.mins.push(data)
+            self.maxs.push(data)
+        else:
+            self.mins.push(min(data, self.mins.peek()))
+            self.maxs.push(max(data, self.maxs.peek()))
+        super().push(data)
+
+    def pop(self) -> int:
+        if (self.top != None):
+            self.mins.pop()
+            self.maxs.pop()
+        return super().pop()
+
+    # Returns the smallest item in the stack, -100 when empty like peek
+    def get_min(self) -> int:
+        return self.mins.peek()
+
+    # Returns the largest item in the stack, -100 when empty like peek
+    def get_max(self) -> int:
+        return self.maxs.peek()
+
+# Queue which knows its minimum and maximum in amortized O(1)
+# Two monotonic deques hold the candidates for min / max in queue order:
+# max_candidates is decreasing, so its first element is the maximum.
+# An element which is smaller than a newer element can never become the
+# maximum again (the newer one leaves the queue later), so enqueue drops it:
+#
+#   enqueue: 3, 1, 4, 1     queue          [3, 1, 4, 1]
+#                           max_candidates [4, 1]
+#                           min_candidates [1, 1]
+#
+# Every element enters and leaves each deque at most once, hence amortized O(1).
+class MonotonicQueue(Queue):
+
+    def __init__(self, observer = None, node_pool = None):
+        super().__init__(observer, node_pool)
+        self.max_candidates = deque()
+        self.min_candidates = deque()
+
+    def enqueue(self, data):
+        super().enqueue(data)
+
+        while (self.max_candidates and self.max_candidates[-1] < data):
+            self.max_candidates.pop()
+        self.max_candidates.append(data)
+
+        while (self.min_candidates and self.min_candidates[-1] > data):
+            self.min_candidates.pop()
+        self.min_candidates.append(data)
+
+    def dequeue(self) -> int:
+        if (self.front == None):
+            return super().dequeue()
+
+        data = super().dequeue()
+        if (self.max_candidates[0] == data):
+            self.max_candidates.popleft()
+        if (self.min_candidates[0] == data):
+            self.min_candidates.popleft()
+        return data
+
+    # Returns the smallest element in the queue, -100 when empty like peek
+    def get_min(self) -> int:
+        if (not self.min_candidates):
+            return -100
+        return self.min_candidates[0]
+
+    # Returns the largest element in the queue, -100 when empty like peek
+    def get_max(self) -> int:
+        if (not self.max_candidates):
+            return -100
+        return self.max_candidates[0]
+
+# Min and max of every window of `window` consecutive values.
+# Returns two lists of length len(values) - window + 1, with or without NumPy.
+#
+# With NumPy the values are cut into blocks of `window` items and, per block,
+# running max from the left (prefix) and from the right (suffix) are computed
+# with vectorized accumulate calls. A window starting at i covers the end of
+# one block and the start of the next one, so its max is
+# max(suffix[i], prefix[i + window - 1]) (van Herk / Gil-Werman), O(n) total
+# with no Python loop. Without NumPy a monotonic deque pass is used.
+def sliding_window_extrema(values, window: int):
+    if (window <= 0):
+        raise ValueError("window must be greater than 0")
+    if (len(values) < window):
+        return [], []
+
+    if (NUMPY_AVAILABLE):
+        values = np.asarray(values)
+        return (_numpy_window_reduce(values, window, np.minimum).tolist(),
+                _numpy_window_reduce(values, window, np.maximum).tolist())
+
+    return _deque_window_extrema(values, window)
+
+def _numpy_window_reduce(values, window: int, reduce):
+    count = len(values)
+    blocks = -(-count // window)
+
+    # Pad up to full blocks, no window below reads a padded slot: a window
+    # which starts at i <= count - window ends inside the real values
+    padded = np.full(blocks * window, values[0], dtype = values.dtype)
+    padded[:count] = values
+    padded = padded.reshape(blocks, window)
+
+    prefix = reduce.accumulate(padded, axis = 1).ravel()
+    suffix = reduce.accumulate(padded[:, ::-1], axis = 1)[:, ::-1].ravel()
+
+    windows = count - window + 1
+    return reduce(suffix[:windows], prefix[window - 1:window - 1 + windows])
+
+def _deque_window_extrema(values, window: int):
+    mins = []
+    maxs = []
+    min_candidates = deque()
+    max_candidates = deque()
+
+    # The deques hold indexes, so elements leaving the window are recognised
+    for i, value in enumerate(values):
+        while (min_candidates and values[min_candidates[-1]] >= value):
+            min_candidates.pop()
+        min_candidates.append(i)
+        while (max_candidates and values[max_candidates[-1]] <= value):
+            max_candidates.pop()
+        max_candidates.append(i)
+
+        if (min_candidates[0] <= i - window):
+            min_candidates.popleft()
+        if (max_candidates[0] <= i - window):
+            max_candidates.popleft()
+
+        if (i >= window - 1):
+            mins.append(values[min_candidates[0]])
+            maxs.append(values[max_candidates[0]])
+
+    return mins, maxs
+
+
+### This code is outside the class
+# Driver code to test the above classes
+
+def min_max_stack_test():
+    stack = MinMaxStack()
+    for value in (5, 2, 8, 1):
+        stack.push(value)
+        print(f"Pushed {value}: min = {stack.get_min()}, max = {stack.get_max()}")
+
+    while (len(stack) > 0):
+        value = stack.pop()
+        print(f"Popped {value}: min = {stack.get_min()}, max = {stack.get_max()}")
+
+def monotonic_queue_test():
+    queue = MonotonicQueue()
+    for value in (3, 1, 4, 1, 5):
+        queue.enqueue(value)
+    print(f"Queue = {list(queue)}, min = {queue.get_min()}, max = {queue.get_max()}")
+
+    queue.dequeue()
+    queue.dequeue()
+    print(f"Queue = {list(queue)}, min = {queue.get_min()}, max = {queue.get_max()}")
+
+def sliding_window_test():
+    values = [4, 2, 12, 3, 8, 1, 7, 9, 5]
+    mins, maxs = sliding_window_extrema(values, 3)
+    print(f"Values = {values}, window = 3, NumPy = {NUMPY_AVAILABLE}")
+    print(f"Window mins = {list(mins)}")
+    print(f"Window maxs = {list(maxs)}")
+
+
+if __name__ == "__main__":
+    min_max_stack_test()
+    monotonic_queue_test()
+    sliding_window_test()
@@ -0,0 +1,152 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import time
+import tracemalloc
+
+# Node pool (free list)
+# Deleting a node normally leaves it to the garbage collector and the next
+# insert allocates a brand new one. A pool keeps deleted nodes in a free
+# list and hands them out again on the next insert, so a workload which
+# keeps inserting and deleting reaches a steady state with no allocation.
+#
+#   insert: free list [n3, n2, n1] --> take n1, fill data --> list
+#   delete: list --> clear n1 --> free list [n3, n2, n1]
+#
+# The pool is opt-in: pass node_pool = NodePool(Node) to SinglyLinkedList,
+# DoublyLinkedList, Stack or Queue. A deleted node is reused, so do not keep
+# references to nodes after deleting them.
+
+class NodePool:
+
+    # node_class : Node class of the data structure using this pool
+    # capacity   : maximum number of free nodes kept, extra ones are dropped
+    def __init__(self, node_class, capacity: int = 1024):
+        if (capacity < 0):
+            raise ValueError("capacity must not be negative")
+
+        self.node_class = node_class
+        self.capacity = capacity
+        self.free_nodes = []
+
+        # Counters to check how well the pool is working
+        self.allocated = 0
+        self.reused = 0
+
+    # Number of free nodes waiting to be reused
+    def __len__(self):
+        return len(self.free_nodes)
+
+    # Returns a node holding data, reusing a free node when there is one
+    def acquire(self, data):
+        if (self.free_nodes):
+            # Links were already cleared by release, only data is set here
+            node = self.free_nodes.pop()
+            node.data = data
+            self.reused = self.reused + 1
+            return node
+
+        self.allocated = self.allocated + 1
+        return self.node_class(data)
+
+    # Gives a deleted node back to the pool
+    def release(self, node):
+        if (len(self.free_nodes) >= self.capacity):
+            return
+
+        # Drop the references now so data and neighbours can be collected
+        # __init__ resets every link of the node class (next / prev)
+        node.__init__(None)
+        self.free_nodes.append(node)
+
+
+### This code is outside the class
+# Benchmark: churn workloads with and without a pool
+
+def _churn_workloads():
+    from DoublyLinkedList import DoublyLinkedList, Node as DNode
+    from SinglyLinkedList import SinglyLinkedList, Node as SNode
+    from Stack import Stack, Node as StackNode
+    from Queue import Queue, Node as QueueNode
+
+    # name, node class, container class, insert, delete
+    return [
+        ("SinglyLinkedList", SNode, SinglyLinkedList,
+            SinglyLinkedList.insert_at_beginning, SinglyLinkedList.delete_at_beginning),
+        ("DoublyLinkedList", DNode, DoublyLinkedList,
+            DoublyLinkedList.insert_at_end, DoublyLinkedList.delete_at_beginning),
+        ("Stack", StackNode, Stack, Stack.push, Stack.pop),
+        ("Queue", QueueNode, Queue, Queue.enqueue, Queue.dequeue),
+    ]
+
+# Returns the number of nodes allocated while running the workload
+def _run_churn(container_class, insert, delete, node_pool, size: int, operations: int) -> int:
+    container = container_class(node_pool = node_pool)
+
+    # Fill the container first, then insert + delete keeps its size steady
+    for value in range(size):
+        insert(container, value)
+
+    for value in range(operations):
+        insert(container, value)
+        delete(container)
+
+    return (size + operations) if (node_pool == None) else node_pool.allocated
+
+def churn_benchmark(size: int = 1_000, operations: int = 500_000):
+    print(f"{'container':>18} {'pool':>5} {'ops/sec':>12} {'nodes allocated':>16} {'peak memory (KiB)':>18}")
+    for name, node_class, container_class, insert, delete in _churn_workloads():
+        for use_pool in (False, True):
+            # Speed is measured without tracemalloc, it slows down allocation
+            node_pool = NodePool(node_class) if use_pool else None
+            start = time.perf_counter()
+            allocated = _run_churn(container_class, insert, delete, node_pool, size, operations)
+            elapsed = time.perf_counter() - start
+
+            node_pool = NodePool(node_class) if use_pool else None
+            tracemalloc.start()
+            _run_churn(container_class, insert, delete, node_pool, size, operations // 10)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{name:>18} {str(use_pool):>5} {operations / elapsed:>12,.0f} {allocated:>16,} {peak / 1024:>18.1f}")
+
+
+if __name__ == "__main__":
+    from Stack import Stack, Node as StackNode
+
+    pool = NodePool(StackNode, capacity = 2)
+    stack = Stack(node_pool = pool)
+    for value in range(5):
+        stack.push(value)
+    for _ in range(5):
+        stack.pop()
+    for value in range(5):
+        stack.push(value)
+
+    print(f"Allocated = {pool.allocated}, reused = {pool.reused}, free = {len(pool)}")
+
+    #churn_benchmark()
@@ -0,0 +1,427 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import os
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+
+# Durable FIFO queue of byte records stored in segment files
+#
+#   directory/
+#     segment-0000000001.log   [header][len|crc|payload][len|crc|payload]...
+#     segment-0000000002.log   [header][len|crc|payload]...      <- written
+#     cursor                   segment id, offset, index of the next read
+#
+# Segment files have a fixed size. Records are appended to the newest
+# segment, when a record does not fit any more a new segment is started.
+# Reads follow the cursor from the oldest segment to the newest.
+#
+# A header holds the number of records and the end offset of the segment.
+# It is rewritten only after the records themselves reached the disk (fsync),
+# so a header never points at data which could be lost in a crash. Startup
+# therefore reads the headers only, not the records.
+#
+# fsync is expensive, the fsync policy decides how often it happens:
+#   FSYNC_EVERY_OP   : after every enqueue / dequeue, nothing acknowledged is lost
+#   FSYNC_EVERY_N    : after every fsync_every operations
+#   FSYNC_INTERVAL   : when fsync_interval_ms passed since the last sync,
+#                      checked on every operation (call sync() when idle)
+# A crash loses the enqueues after the last sync and delivers the dequeues
+# after the last sync again (at least once delivery).
+#
+# The cursor is saved on sync, by writing a new file and renaming it over the
+# old one. Segments which were completely read are deleted after that.
+
+FSYNC_EVERY_OP = "every_op"
+FSYNC_EVERY_N = "every_n"
+FSYNC_INTERVAL = "interval"
+
+SEGMENT_MAGIC = b"PQSG"
+# magic, version, segment id, record count, end offset, crc of the fields
+SEGMENT_HEADER = struct.Struct("<4sIQQQ")
+HEADER_CRC = struct.Struct("<I")
+HEADER_SIZE = 64
+# payload length, crc of length and payload
+RECORD_HEADER = struct.Struct("<II")
+RECORD_LENGTH = struct.Struct("<I")
+# segment id, offset, index of the record in the segment, crc of the fields
+CURSOR = struct.Struct("<QQQ")
+
+# The length is part of the checksum, so the zero filled free space of a
+# segment never looks like a valid (empty) record
+def record_crc(data) -> int:
+    return zlib.crc32(data, zlib.crc32(RECORD_LENGTH.pack(len(data))))
+
+# State of one segment file as described by its header
+class Segment:
+    __slots__ = ("id", "path", "count", "end")
+
+    def __init__(self, segment_id: int, path: str, count: int = 0, end: int = HEADER_SIZE):
+        self.id = segment_id
+        self.path = path
+        self.count = count
+        self.end = end
+
+# observer is an optional function which receives diagnostic messages
+class PersistentQueue:
+
+    def __init__(self, directory: str, segment_size: int = 4 * 1024 * 1024, fsync_policy: str = FSYNC_EVERY_OP,
+                 fsync_every: int = 100, fsync_interval_ms: float = 10, observer = None):
+        if (segment_size <= HEADER_SIZE + RECORD_HEADER.size):
+            raise ValueError(f"segment_size must be greater than {HEADER_SIZE + RECORD_HEADER.size}")
+        if (fsync_policy not in (FSYNC_EVERY_OP, FSYNC_EVERY_N, FSYNC_INTERVAL)):
+            raise ValueError(f"Unknown fsync policy {fsync_policy}")
+
+        self.directory = directory
+        self.segment_size = segment_size
+        self.fsync_policy = fsync_policy
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval_ms / 1000
+        self.observer = observer
+
+        self.unsynced_ops = 0
+        self.last_sync = time.monotonic()
+        self.write_dirty = False
+        self.cursor_dirty = False
+        # Segments which were read completely, deleted after the next checkpoint
+        self.consumed = []
+
+        os.makedirs(directory, exist_ok = True)
+        self._recover()
+
+    # Rebuilds segments, count and cursor from the headers and the cursor file
+    def _recover(self):
+        self.segments = []
+        for name in sorted(os.listdir(self.directory)):
+            if (name.startswith("segment-") and name.endswith(".log")):
+                path = os.path.join(self.directory, name)
+                self.segments.append(self._read_segment_header(int(name[8:-4]), path))
+
+        cursor = self._read_cursor()
+
+        # Segments before the cursor were consumed, the crash came before
+        # they were deleted
+        if (cursor != None):
+            while (self.segments and self.segments[0].id < cursor[0]):
+                os.remove(self.segments.pop(0).path)
+
+        if (not self.segments):
+            next_id = 1 if (cursor == None) else cursor[0]
+            self.segments.append(self._create_segment(next_id))
+            cursor = None
+
+        if (cursor == None or cursor[0] != self.segments[0].id):
+            cursor = (self.segments[0].id, HEADER_SIZE, 0)
+        self.read_index = 0
+        _, self.read_offset, self.read_position = cursor
+
+        self.count = sum(segment.count for segment in self.segments) - self.read_position
+        self.write_fd = os.open(self.segments[-1].path, os.O_RDWR)
+        self.read_fd = os.open(self.segments[0].path, os.O_RDONLY)
+
+        if (self.observer != None):
+            self.observer(f"Recovered {len(self.segments)} segments with {self.count} records")
+
+    def _segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment_id:010d}.log")
+
+    def _pack_header(self, segment: Segment) -> bytes:
+        fields = SEGMENT_HEADER.pack(SEGMENT_MAGIC, 1, segment.id, segment.count, segment.end)
+        return fields + HEADER_CRC.pack(zlib.crc32(fields))
+
+    # Returns the Segment described by the header of the file. A torn or
+    # missing header (crash while the segment was created) is rebuilt by
+    # scanning the records, the only case where records are read.
+    def _read_segment_header(self, segment_id: int, path: str) -> Segment:
+        with open(path, "rb") as file:
+            data = file.read(SEGMENT_HEADER.size + HEADER_CRC.size)
+
+        if (len(data) == SEGMENT_HEADER.size + HEADER_CRC.size):
+            fields = data[:SEGMENT_HEADER.size]
+            crc, = HEADER_CRC.unpack_from(data, SEGMENT_HEADER.size)
+            magic, _, header_id, count, end = SEGMENT_HEADER.unpack(fields)
+            if (magic == SEGMENT_MAGIC and header_id == segment_id and crc == zlib.crc32(fields)):
+                return Segment(segment_id, path, count, end)
+
+        if (self.observer != None):
+            self.observer(f"Header of {path} is damaged, scanning its records")
+        return self._scan_segment(segment_id, path)
+
+    def _scan_segment(self, segment_id: int, path: str) -> Segment:
+        segment = Segment(segment_id, path)
+        with open(path, "r+b") as file:
+            file.seek(HEADER_SIZE)
+            while (True):
+                record_header = file.read(RECORD_HEADER.size)
+                if (len(record_header) < RECORD_HEADER.size):
+                    break
+                length, crc = RECORD_HEADER.unpack(record_header)
+                payload = file.read(length)
+                if (len(payload) < length or record_crc(payload) != crc):
+                    break
+                segment.count = segment.count + 1
+                segment.end = segment.end + RECORD_HEADER.size + length
+
+            file.seek(0)
+            file.write(self._pack_header(segment))
+            file.flush()
+            os.fsync(file.fileno())
+        return segment
+
+    # Creates the file of a new, empty segment with its full fixed size
+    def _create_segment(self, segment_id: int) -> Segment:
+        segment = Segment(segment_id, self._segment_path(segment_id))
+        fd = os.open(segment.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, self.segment_size)
+            os.pwrite(fd, self._pack_header(segment), 0)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._sync_directory()
+        return segment
+
+    # Makes creating, renaming and deleting files in the directory durable
+    def _sync_directory(self):
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # Returns (segment id, offset, index) of the saved cursor, None if none
+    def _read_cursor(self):
+        path = os.path.join(self.directory, "cursor")
+        if (not os.path.exists(path)):
+            return None
+
+        with open(path, "rb") as file:
+            data = file.read()
+        if (len(data) != CURSOR.size + HEADER_CRC.size):
+            return None
+        crc, = HEADER_CRC.unpack_from(data, CURSOR.size)
+        if (crc != zlib.crc32(data[:CURSOR.size])):
+            return None
+        return CURSOR.unpack_from(data)
+
+    def _write_cursor(self):
+        fields = CURSOR.pack(self.segments[self.read_index].id, self.read_offset, self.read_position)
+        path = os.path.join(self.directory, "cursor")
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(fields + HEADER_CRC.pack(zlib.crc32(fields)))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+        self._sync_directory()
+
+    # Number of records in the queue, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Makes every enqueue and dequeue so far durable
+    def sync(self):
+        # Records first, then the header which points at them
+        if (self.write_dirty):
+            os.fsync(self.write_fd)
+            os.pwrite(self.write_fd, self._pack_header(self.segments[-1]), 0)
+            os.fsync(self.write_fd)
+            self.write_dirty = False
+
+        if (self.cursor_dirty):
+            self._write_cursor()
+            self.cursor_dirty = False
+
+            # The saved cursor is past these segments, nobody needs them
+            for segment in self.consumed:
+                os.remove(segment.path)
+            if (self.consumed):
+                self.consumed = []
+                self._sync_directory()
+
+        self.unsynced_ops = 0
+        self.last_sync = time.monotonic()
+
+    # Applies the fsync policy after an operation
+    def _after_operation(self):
+        self.unsynced_ops = self.unsynced_ops + 1
+        if (self.fsync_policy == FSYNC_EVERY_OP):
+            self.sync()
+        elif (self.fsync_policy == FSYNC_EVERY_N):
+            if (self.unsynced_ops >= self.fsync_every):
+                self.sync()
+        elif (time.monotonic() - self.last_sync >= self.fsync_interval):
+            self.sync()
+
+    # Appends one record (any bytes like object) at the rear
+    def enqueue(self, data):
+        data = bytes(data)
+        record_size = RECORD_HEADER.size + len(data)
+        if (HEADER_SIZE + record_size > self.segment_size):
+            raise ValueError(f"record of {len(data)} bytes does not fit into a segment")
+
+        segment = self.segments[-1]
+
+        # Case 1: Segment is full, seal it and continue in a new one
+        if (segment.end + record_size > self.segment_size):
+            self.write_dirty = True
+            self.sync()
+            os.close(self.write_fd)
+            segment = self._create_segment(segment.id + 1)
+            self.segments.append(segment)
+            self.write_fd = os.open(segment.path, os.O_RDWR)
+
+        # Case 2: Append the record after the last one
+        os.pwrite(self.write_fd, RECORD_HEADER.pack(len(data), record_crc(data)) + data, segment.end)
+        segment.end = segment.end + record_size
+        segment.count = segment.count + 1
+        self.count = self.count + 1
+        self.write_dirty = True
+        self._after_operation()
+
+    # Moves the cursor to the next segment when the current one is read
+    # completely. Returns False when there is nothing to read.
+    def _seek_record(self) -> bool:
+        while (self.read_offset >= self.segments[self.read_index].end):
+            if (self.read_index == len(self.segments) - 1):
+                return False
+
+            self.consumed.append(self.segments[self.read_index])
+            self.read_index = self.read_index + 1
+            self.read_offset = HEADER_SIZE
+            self.read_position = 0
+            os.close(self.read_fd)
+            self.read_fd = os.open(self.segments[self.read_index].path, os.O_RDONLY)
+        return True
+
+    # Returns (payload, record size) at the cursor
+    def _read_record(self):
+        length, crc = RECORD_HEADER.unpack(os.pread(self.read_fd, RECORD_HEADER.size, self.read_offset))
+        data = os.pread(self.read_fd, length, self.read_offset + RECORD_HEADER.size)
+        if (len(data) != length or record_crc(data) != crc):
+            raise IOError(f"Corrupted record in {self.segments[self.read_index].path} at offset {self.read_offset}")
+        return data, RECORD_HEADER.size + length
+
+    # Removes the front record and returns its bytes, -100 when empty
+    def dequeue(self):
+        if (self.count == 0 or not self._seek_record()):
+            if (self.observer != None):
+                self.observer("Queue is empty")
+            return -100
+
+        data, record_size = self._read_record()
+        self.read_offset = self.read_offset + record_size
+        self.read_position = self.read_position + 1
+        self.count = self.count - 1
+
+        # Fully read segments leave the in memory list, their files go on sync
+        if (self.read_index > 0):
+            del self.segments[:self.read_index]
+            self.read_index = 0
+
+        self.cursor_dirty = True
+        self._after_operation()
+        return data
+
+    # Returns the bytes of the front record without removing it, -100 when empty
+    def peek(self):
+        if (self.count == 0 or not self._seek_record()):
+            if (self.observer != None):
+                self.observer("Queue is empty")
+            return -100
+
+        data, _ = self._read_record()
+        return data
+
+    def get_count(self) -> int:
+        return self.count
+
+    # Syncs everything and closes the files
+    def close(self):
+        self.sync()
+        os.close(self.write_fd)
+        os.close(self.read_fd)
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def persistent_queue_test():
+    directory = tempfile.mkdtemp()
+    tasks = PersistentQueue(directory, segment_size = 128, observer = print)
+    for number in range(1, 11):
+        tasks.enqueue(f"task {number}".encode())
+    print(f"Dequeued {tasks.dequeue()}, {tasks.dequeue()}, {tasks.dequeue()}")
+    print(f"Segment files = {sorted(name for name in os.listdir(directory) if name.endswith('.log'))}")
+
+    # "Restart": a new instance finds the same queue from the headers
+    tasks = PersistentQueue(directory, segment_size = 128, observer = print)
+    print(f"Count = {tasks.get_count()}, peek = {tasks.peek()}")
+    while (tasks.get_count() > 0):
+        tasks.dequeue()
+    tasks.sync()
+    print(f"Segment files = {sorted(name for name in os.listdir(directory) if name.endswith('.log'))}")
+    tasks.close()
+    shutil.rmtree(directory)
+
+# Enqueues then dequeues n records of record_size bytes with every policy
+def fsync_benchmark(operations: int = 2_000, record_size: int = 100):
+    policies = [
+        ("every op", dict(fsync_policy = FSYNC_EVERY_OP)),
+        ("every 100 ops", dict(fsync_policy = FSYNC_EVERY_N, fsync_every = 100)),
+        ("every 10 ms", dict(fsync_policy = FSYNC_INTERVAL, fsync_interval_ms = 10)),
+    ]
+    payload = bytes(record_size)
+
+    print(f"{'policy':>14} {'enqueues/sec':>14} {'dequeues/sec':>14}")
+    for name, options in policies:
+        directory = tempfile.mkdtemp()
+        work_queue = PersistentQueue(directory, **options)
+
+        start = time.perf_counter()
+        for _ in range(operations):
+            work_queue.enqueue(payload)
+        work_queue.sync()
+        enqueue_rate = operations / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(operations):
+            work_queue.dequeue()
+        work_queue.sync()
+        dequeue_rate = operations / (time.perf_counter() - start)
+
+        work_queue.close()
+        shutil.rmtree(directory)
+        print(f"{name:>14} {enqueue_rate:>14,.0f} {dequeue_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    persistent_queue_test()
+
+    #fsync_benchmark()
@@ -0,0 +1,358 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import heapq
+import random
+import time
+
+# Priority queue on an array backed d-ary heap (binary heap when arity = 2)
+#
+# The heap is one Python list, the children of index i are at
+# arity * i + 1 ... arity * i + arity and its parent is at (i - 1) // arity:
+#
+#   arity = 2        [1]             list : [1, 3, 2, 7, 4]
+#                   /   \
+#                 [3]   [2]          smallest priority is always at index 0
+#                /   \
+#              [7]   [4]
+#
+# Every push returns a HeapEntry handle which remembers its own index in the
+# list (the index map). The sift functions keep that index up to date, so
+# decrease_key and remove find their entry in O(1) and fix the heap in
+# O(log n) instead of searching it in O(n).
+# A bigger arity gives a flatter heap: pushes and decrease_key get cheaper
+# (fewer levels), pops compare more children per level.
+
+# Handle of one element in the heap, index is -1 once it left the heap
+class HeapEntry:
+    __slots__ = ("priority", "data", "index")
+
+    def __init__(self, priority, data, index: int):
+        self.priority = priority
+        self.data = data
+        self.index = index
+
+# observer is an optional function which receives diagnostic messages
+class PriorityQueue:
+
+    def __init__(self, arity: int = 2, observer = None):
+        if (arity < 2):
+            raise ValueError("arity must be at least 2")
+
+        self.arity = arity
+        self.heap = []
+        self.observer = observer
+
+    # Number of elements, Time complexity O(1)
+    def __len__(self):
+        return len(self.heap)
+
+    # Yields (priority, data) in heap (array) order, not in sorted order
+    def __iter__(self):
+        for entry in self.heap:
+            yield entry.priority, entry.data
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Returns True when some element holds the data, Time complexity O(n)
+    def search(self, key) -> bool:
+        for entry in self.heap:
+            if (entry.data == key):
+                return True
+        return False
+
+    # Moves the entry at index up while it is smaller than its parent
+    def _sift_up(self, index: int):
+        heap = self.heap
+        arity = self.arity
+        entry = heap[index]
+        priority = entry.priority
+
+        # Parents move down into the hole, the entry is written once at the end
+        while (index > 0):
+            parent_index = (index - 1) // arity
+            parent = heap[parent_index]
+            if (not priority < parent.priority):
+                break
+            heap[index] = parent
+            parent.index = index
+            index = parent_index
+
+        heap[index] = entry
+        entry.index = index
+
+    # Moves the entry at index down while a child is smaller
+    def _sift_down(self, index: int):
+        heap = self.heap
+        arity = self.arity
+        size = len(heap)
+        entry = heap[index]
+        priority = entry.priority
+
+        while (True):
+            first_child = arity * index + 1
+            if (first_child >= size):
+                break
+
+            # Smallest of the (up to arity) children
+            smallest_index = first_child
+            smallest = heap[first_child]
+            for child_index in range(first_child + 1, min(first_child + arity, size)):
+                child = heap[child_index]
+                if (child.priority < smallest.priority):
+                    smallest_index = child_index
+                    smallest = child
+
+            if (not smallest.priority < priority):
+                break
+            heap[index] = smallest
+            smallest.index = index
+            index = smallest_index
+
+        heap[index] = entry
+        entry.index = index
+
+    # Adds data with the given priority, Time complexity O(log n)
+    # Returns the handle for decrease_key / remove
+    def push(self, priority, data = None) -> HeapEntry:
+        entry = HeapEntry(priority, data, len(self.heap))
+        self.heap.append(entry)
+        self._sift_up(entry.index)
+        return entry
+
+    # Removes the element with the smallest priority, Time complexity O(log n)
+    # Returns (priority, data), -100 when empty like Queue.dequeue
+    def pop(self):
+        # Case 1: Heap is empty
+        if (not self.heap):
+            if (self.observer != None):
+                self.observer("Priority queue is empty")
+            return -100
+
+        # Case 2: Last entry moves to the root and sinks to its place
+        top = self.heap[0]
+        last = self.heap.pop()
+        if (last is not top):
+            self.heap[0] = last
+            self._sift_down(0)
+
+        top.index = -1
+        return top.priority, top.data
+
+    # Returns (priority, data) of the smallest element, -100 when empty
+    def peek(self):
+        if (not self.heap):
+            if (self.observer != None):
+                self.observer("Priority queue is empty")
+            return -100
+
+        return self.heap[0].priority, self.heap[0].data
+
+    def get_count(self) -> int:
+        return len(self.heap)
+
+    # Lowers the priority of a queued element, Time complexity O(log n)
+    def decrease_key(self, handle: HeapEntry, priority):
+        if (handle.index < 0):
+            raise KeyError("entry is not in the priority queue")
+        if (handle.priority < priority):
+            raise ValueError("new priority is greater than the current priority")
+
+        handle.priority = priority
+        self._sift_up(handle.index)
+
+    # Removes any queued element, Time complexity O(log n)
+    # Returns its (priority, data)
+    def remove(self, handle: HeapEntry):
+        index = handle.index
+        if (index < 0):
+            raise KeyError("entry is not in the priority queue")
+
+        # The last entry fills the hole, it can belong above or below it
+        last = self.heap.pop()
+        if (last is not handle):
+            self.heap[index] = last
+            last.index = index
+            self._sift_up(index)
+            self._sift_down(last.index)
+
+        handle.index = -1
+        return handle.priority, handle.data
+
+    # Adds all the (priority, data) pairs and rebuilds the heap bottom up,
+    # Time complexity O(n + k) instead of O(k log n) for k single pushes.
+    # Returns the handles in input order.
+    def heapify(self, items) -> list:
+        handles = []
+        for priority, data in items:
+            entry = HeapEntry(priority, data, len(self.heap))
+            self.heap.append(entry)
+            handles.append(entry)
+
+        # Leaves are already heaps, sift down every parent from the last one
+        for index in range((len(self.heap) - 2) // self.arity, -1, -1):
+            self._sift_down(index)
+        return handles
+
+    def print_all_elements(self):
+        if (not self.heap):
+            print("Priority queue is empty")
+            return
+
+        print("Elements in the priority queue (heap order)")
+        for priority, data in self:
+            print(f" {priority}: {data} ")
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def priority_queue_test():
+    tasks = PriorityQueue(observer = print)
+    tasks.pop()
+
+    tasks.heapify([(5, "write report"), (1, "fix build"), (3, "review PR")])
+    email = tasks.push(4, "answer email")
+    tasks.print_all_elements()
+
+    tasks.decrease_key(email, 0)
+    print(f"Peek after decrease_key = {tasks.peek()}")
+    print(f"Removed {tasks.remove(tasks.push(2, 'lunch'))}")
+
+    while (len(tasks) > 0):
+        print(f"Popped {tasks.pop()}")
+
+# Dijkstra on a dict graph {node: [(neighbour, weight), ...]}
+# Every node is pushed once, shorter paths use decrease_key
+def dijkstra(graph: dict, source) -> dict:
+    distances = {source: 0}
+    handles = {}
+    frontier = PriorityQueue()
+    handles[source] = frontier.push(0, source)
+
+    while (len(frontier) > 0):
+        distance, node = frontier.pop()
+        for neighbour, weight in graph.get(node, ()):
+            new_distance = distance + weight
+            if (neighbour not in distances):
+                distances[neighbour] = new_distance
+                handles[neighbour] = frontier.push(new_distance, neighbour)
+            elif (new_distance < distances[neighbour] and handles[neighbour].index >= 0):
+                distances[neighbour] = new_distance
+                frontier.decrease_key(handles[neighbour], new_distance)
+    return distances
+
+def dijkstra_test():
+    graph = {
+        "A": [("B", 4), ("C", 1)],
+        "C": [("B", 2), ("D", 5)],
+        "B": [("D", 1)],
+    }
+    print(f"Shortest distances from A = {dijkstra(graph, 'A')}")
+
+# n pushes then n pops, heapq works on (priority, sequence, data) tuples.
+# Then the same heap gets n decrease_key calls: in place for PriorityQueue,
+# as push of a new tuple + lazy skip of the stale one for heapq.
+def heap_benchmark(sizes = (10_000, 100_000, 1_000_000)):
+    def run_heapq(priorities):
+        heap = []
+        for sequence, priority in enumerate(priorities):
+            heapq.heappush(heap, (priority, sequence, None))
+        while (heap):
+            heapq.heappop(heap)
+
+    def run_heapq_heapify(priorities):
+        heap = [(priority, sequence, None) for sequence, priority in enumerate(priorities)]
+        heapq.heapify(heap)
+        while (heap):
+            heapq.heappop(heap)
+
+    def run_heapq_decrease(priorities):
+        heap = [(priority, sequence, sequence) for sequence, priority in enumerate(priorities)]
+        heapq.heapify(heap)
+        current = list(priorities)
+        for sequence in range(len(priorities)):
+            current[sequence] = current[sequence] - 1
+            heapq.heappush(heap, (current[sequence], sequence, sequence))
+        while (heap):
+            priority, _, key = heapq.heappop(heap)
+            if (priority != current[key]):
+                continue
+
+    def run_push(arity: int):
+        def run(priorities):
+            queue = PriorityQueue(arity)
+            for priority in priorities:
+                queue.push(priority)
+            while (queue.heap):
+                queue.pop()
+        return run
+
+    def run_heapify(arity: int):
+        def run(priorities):
+            queue = PriorityQueue(arity)
+            queue.heapify((priority, None) for priority in priorities)
+            while (queue.heap):
+                queue.pop()
+        return run
+
+    def run_decrease(arity: int):
+        def run(priorities):
+            queue = PriorityQueue(arity)
+            handles = queue.heapify((priority, None) for priority in priorities)
+            for handle in handles:
+                queue.decrease_key(handle, handle.priority - 1)
+            while (queue.heap):
+                queue.pop()
+        return run
+
+    workloads = [
+        ("heapq push/pop", run_heapq),
+        ("binary push/pop", run_push(2)),
+        ("4-ary push/pop", run_push(4)),
+        ("heapq heapify/pop", run_heapq_heapify),
+        ("binary heapify/pop", run_heapify(2)),
+        ("4-ary heapify/pop", run_heapify(4)),
+        ("heapq lazy decrease", run_heapq_decrease),
+        ("binary decrease_key", run_decrease(2)),
+        ("4-ary decrease_key", run_decrease(4)),
+    ]
+
+    print(f"{'elements':>10} {'workload':>20} {'time (s)':>10}")
+    for size in sizes:
+        priorities = [random.random() for _ in range(size)]
+        for name, run in workloads:
+            start = time.perf_counter()
+            run(priorities)
+            print(f"{size:>10} {name:>20} {time.perf_counter() - start:>10.4f}")
+
+
+if __name__ == "__main__":
+    priority_queue_test()
+    dijkstra_test()
+
+    #heap_benchmark()
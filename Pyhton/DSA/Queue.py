@@ -25,30 +25,60 @@ Telegram: https://t.me/+hyVHXek9WM0zNWQ1
 """
 
 class Node:
+    __slots__ = ("data", "next")
 
     def __init__(self, data):
         self.data = data
         self.next = None
 
+# observer is an optional function which receives diagnostic messages
+# node_pool is an optional NodePool(Node) which recycles deleted nodes.
 class Queue:
 
-    def __init__(self):
+    def __init__(self, observer = None, node_pool = None):
         self.rear = None
         self.front = None
         self.count = 0
+        self.observer = observer
+        self.node_pool = node_pool
+
+    # Number of elements in the queue, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the elements from front to rear without printing
+    def __iter__(self):
+        current_node = self.front
+        while (current_node != None):
+            yield current_node.data
+            current_node = current_node.next
+
+    # Supports "key in queue"
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Returns True when the key is present anywhere in the queue
+    def search(self, key) -> bool:
+        current_node = self.front
+        while (current_node != None):
+            if (current_node.data == key):
+                return True
+            current_node = current_node.next
+        return False
 
     def enqueue(self, data):
         # Inserts from the rear 
-        print(f"Inserting value {data} into the queue")
-        new_node = Node(1)
+        if (self.observer != None):
+            self.observer(f"Inserting value {data} into the queue")
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
 
         # Case 1: Queue is empty
         if (self.rear == None):
             self.front = new_node
         else:
             # Case 2: Queue has some nodes
-            # Current read node 
-            new_node.next = self.rear
+            # Current rear node points to the new node, front to rear
+            self.rear.next = new_node
             
         
         self.rear = new_node
@@ -56,13 +86,17 @@ class Queue:
 
     def dequeue(self) -> int:
         if (self.front == None):
-             print("Queue is empty")
+             if (self.observer != None):
+                 self.observer("Queue is empty")
              return -100
         
         # Take copy of the value
         # Move to the next node
-        return_data = self.front.data
-        self.front = self.front.next
+        dequeued_node = self.front
+        return_data = dequeued_node.data
+        self.front = dequeued_node.next
+        if (self.node_pool != None):
+            self.node_pool.release(dequeued_node)
 
         # If there was only one element, queu became empty
         # In such case front also has to be pointed to None
@@ -70,12 +104,14 @@ class Queue:
             self.rear = None
         
         self.count -= 1
-        print(f"Removing element {return_data} from the queue")
+        if (self.observer != None):
+            self.observer(f"Removing element {return_data} from the queue")
         return return_data
     
     def peek(self) -> int:
         if (self.front == None):
-            print("Queue is empty")
+            if (self.observer != None):
+                self.observer("Queue is empty")
             return -100
         
         return self.front.data
@@ -96,7 +132,7 @@ class Queue:
 
 if __name__ == "__main__":
     print("queue implementation")
-    my_queue = Queue()
+    my_queue = Queue(observer = print)
 
     my_queue.dequeue()
     my_queue.print_all_elements()
@@ -114,5 +150,6 @@ if __name__ == "__main__":
     my_queue.enqueue(4)
     value = my_queue.dequeue()
     print(f"We got value {value} from the queue")
+    print(f"Elements = {list(my_queue)}, 3 in queue = {3 in my_queue}")
 
 
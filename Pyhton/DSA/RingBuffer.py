@@ -0,0 +1,293 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+from array import array
+
+# Ring buffer (fixed capacity circular buffer)
+# Same idea as CicularList, but the "ring" is one preallocated array and
+# start / count tell where the elements are. Nothing is allocated per
+# element, the index simply wraps around with % capacity.
+#
+#   capacity = 6, start = 4, count = 4
+#   index : 0    1    2    3    4    5
+#   slots : [c]  [d]  [ ]  [ ]  [a]  [b]       order is a, b, c, d
+#
+# When the buffer is full one of two policies is applied:
+#   OVERWRITE_OLDEST : the element at the other end is dropped (sliding window)
+#   REJECT_WHEN_FULL : the insert is refused and returns False
+
+OVERWRITE_OLDEST = "overwrite"
+REJECT_WHEN_FULL = "reject"
+
+# Element ring buffer with the CicularList API
+# typecode : array type for numeric samples ('q', 'd', ...) or None to
+#            store any Python object in a list
+# observer : optional function which receives diagnostic messages
+class RingBuffer:
+
+    def __init__(self, capacity: int, typecode: str = None, policy: str = OVERWRITE_OLDEST, observer = None):
+        if (capacity <= 0):
+            raise ValueError("capacity must be greater than 0")
+        if (policy not in (OVERWRITE_OLDEST, REJECT_WHEN_FULL)):
+            raise ValueError(f"Unknown policy {policy}")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.observer = observer
+        self.typecode = typecode
+        if (typecode == None):
+            self.slots = [None] * capacity
+        else:
+            self.slots = array(typecode, [0]) * capacity
+
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    # Yields the elements from the beginning (oldest) to the tail (newest)
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.slots[(self.start + i) % self.capacity]
+
+    def __contains__(self, key):
+        return self.search_key(key)
+
+    def is_full(self) -> bool:
+        return self.count == self.capacity
+
+    # True when there is room, otherwise applies the REJECT_WHEN_FULL policy
+    def _has_room(self) -> bool:
+        if (self.count < self.capacity or self.policy == OVERWRITE_OLDEST):
+            return True
+        if (self.observer != None):
+            self.observer("Ring buffer is full")
+        return False
+
+    # Adds data as the newest element, Time complexity O(1)
+    # When full with OVERWRITE_OLDEST the oldest element is dropped
+    def insert_at_tail(self, data) -> bool:
+        if (not self._has_room()):
+            return False
+
+        self.slots[(self.start + self.count) % self.capacity] = data
+        if (self.count == self.capacity):
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.count = self.count + 1
+        return True
+
+    # Adds data as the oldest element, Time complexity O(1)
+    # When full with OVERWRITE_OLDEST the newest element is dropped
+    def insert_at_beginning(self, data) -> bool:
+        if (not self._has_room()):
+            return False
+
+        self.start = (self.start - 1) % self.capacity
+        self.slots[self.start] = data
+        if (self.count < self.capacity):
+            self.count = self.count + 1
+        return True
+
+    # Removes and returns the oldest element, None when empty
+    def delete_at_beginning(self):
+        if (self.count == 0):
+            if (self.observer != None):
+                self.observer("List is empty")
+            return None
+
+        data = self.slots[self.start]
+        # A list slot would keep the deleted object alive until overwritten
+        if (self.typecode == None):
+            self.slots[self.start] = None
+        self.start = (self.start + 1) % self.capacity
+        self.count = self.count - 1
+        return data
+
+    # Removes and returns the newest element, None when empty
+    def delete_at_tail(self):
+        if (self.count == 0):
+            return None
+
+        self.count = self.count - 1
+        index = (self.start + self.count) % self.capacity
+        data = self.slots[index]
+        if (self.typecode == None):
+            self.slots[index] = None
+        return data
+
+    # Returns the element at index 0 (oldest) to count - 1 (newest)
+    def get(self, index: int):
+        if (index < 0 or index >= self.count):
+            raise IndexError("ring buffer index out of range")
+        return self.slots[(self.start + index) % self.capacity]
+
+    def search_key(self, key) -> bool:
+        for value in self:
+            if (value == key):
+                return True
+        return False
+
+    def print_all_nodes(self):
+        if (self.count == 0):
+            print("List is empty")
+            return
+
+        for value in self:
+            print(f"  {value} --> ")
+
+# Ring buffer of raw bytes whose reads return memoryview slices
+#
+# Every byte is written twice, at i and at i + capacity ("mirrored" buffer).
+# A read of n bytes starting at start is then always the contiguous slice
+# [start, start + n) even when it wraps around the end of the ring, so it can
+# be returned as a memoryview without copying.
+#
+#   capacity = 4, start = 3, count = 3  ->  bytes are x, y, z
+#   buffer : [y z _ x | y z _ x]
+#                   ^-----^  memoryview of buffer[3:6] is "xyz"
+#
+# A returned view shows the buffer itself, so it is valid until those bytes
+# are overwritten by later writes. Use bytes(view) to keep a copy.
+class ByteRingBuffer:
+
+    def __init__(self, capacity: int, policy: str = OVERWRITE_OLDEST):
+        if (capacity <= 0):
+            raise ValueError("capacity must be greater than 0")
+        if (policy not in (OVERWRITE_OLDEST, REJECT_WHEN_FULL)):
+            raise ValueError(f"Unknown policy {policy}")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.buffer = bytearray(2 * capacity)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    # Copies data into both halves at the given ring offset
+    def _copy_in(self, offset: int, data):
+        size = len(data)
+        self.buffer[offset:offset + size] = data
+        self.buffer[offset + self.capacity:offset + self.capacity + size] = data
+
+    # Appends bytes, returns the number of bytes stored
+    # REJECT_WHEN_FULL stores nothing when all the bytes do not fit
+    # OVERWRITE_OLDEST drops the oldest bytes to make room
+    def insert_at_tail(self, data) -> int:
+        data = memoryview(data).cast("B")
+        size = len(data)
+        free = self.capacity - self.count
+
+        if (size > free):
+            if (self.policy == REJECT_WHEN_FULL):
+                return 0
+
+            # Only the last capacity bytes can survive
+            if (size > self.capacity):
+                data = data[size - self.capacity:]
+                size = self.capacity
+            self.delete_at_beginning(size - free)
+
+        end = (self.start + self.count) % self.capacity
+        first_part = min(size, self.capacity - end)
+        self._copy_in(end, data[:first_part])
+        if (first_part < size):
+            self._copy_in(0, data[first_part:])
+
+        self.count = self.count + size
+        return size
+
+    # Returns a view of the oldest n bytes (all when n is None), no copy
+    def peek(self, n: int = None) -> memoryview:
+        if (n == None or n > self.count):
+            n = self.count
+        return self.view[self.start:self.start + n]
+
+    # Returns a view of the oldest n bytes and removes them from the buffer
+    def read(self, n: int = None) -> memoryview:
+        data = self.peek(n)
+        self.delete_at_beginning(len(data))
+        return data
+
+    # Drops the oldest n bytes
+    def delete_at_beginning(self, n: int = 1):
+        n = min(n, self.count)
+        self.start = (self.start + n) % self.capacity
+        self.count = self.count - n
+
+    # key is a bytes like pattern or one byte value (int 0 ... 255)
+    def search_key(self, key) -> bool:
+        if (isinstance(key, int)):
+            if (key < 0 or key > 255):
+                raise ValueError("byte value must be in 0 ... 255")
+            key = bytes([key])
+        elif (isinstance(key, (bytes, bytearray, memoryview))):
+            key = bytes(key)
+        else:
+            raise TypeError(f"search_key needs bytes or a byte value, not {type(key).__name__}")
+
+        return self.peek().tobytes().find(key) != -1
+
+
+### This code is outside the class
+# Driver code to test the above classes
+
+def sliding_window_test():
+    window = RingBuffer(4, typecode = "d")
+    for sample in (1.0, 2.0, 3.0, 4.0, 5.0, 6.0):
+        window.insert_at_tail(sample)
+        print(f"Window = {list(window)}, average = {sum(window) / len(window)}")
+
+def reject_policy_test():
+    buffer = RingBuffer(2, policy = REJECT_WHEN_FULL, observer = print)
+    print(f"Insert a = {buffer.insert_at_tail('a')}")
+    print(f"Insert b = {buffer.insert_at_tail('b')}")
+    print(f"Insert c = {buffer.insert_at_tail('c')}")
+    print(f"Removed {buffer.delete_at_beginning()}, buffer = {list(buffer)}")
+
+def bytes_test():
+    buffer = ByteRingBuffer(8)
+    buffer.insert_at_tail(b"abcdef")
+    print(f"Read 4 = {buffer.read(4).tobytes()}")
+
+    # Wraps around the end of the ring, still one contiguous view
+    buffer.insert_at_tail(b"ghijk")
+    view = buffer.peek()
+    print(f"Peek = {view.tobytes()} (memoryview of {len(view)} bytes)")
+
+    # Overwrites the oldest bytes
+    buffer.insert_at_tail(b"XYZ")
+    print(f"After overwrite = {buffer.read().tobytes()}")
+
+
+if __name__ == "__main__":
+    sliding_window_test()
+    reject_policy_test()
+    bytes_test()
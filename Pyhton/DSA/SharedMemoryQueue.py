@@ -0,0 +1,287 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+
+# Queue of byte records shared between processes
+#
+# The whole queue lives in one multiprocessing.shared_memory block, so a
+# message is copied into shared memory by the producer and copied out by
+# the consumer: no pickling and no pipe in between.
+#
+#   [ producer line | consumer line | ring of capacity bytes ............ ]
+#     tail, enqueued  head, dequeued   [len][payload][len][payload]...
+#
+# Every record is a 4 byte length followed by the payload. head and tail are
+# byte positions which only grow, the ring offset is position % capacity, so
+# a record can wrap around the end of the ring and is then copied in two
+# parts. Used bytes are tail - head.
+#
+# The producer only writes tail / enqueued and the consumer only writes
+# head / dequeued, and they sit on different cache lines. The producer
+# copies the record first and moves tail afterwards, so the consumer never
+# sees a half written record. With one producer and one consumer (SPSC) no
+# lock is needed at all. For several producers / consumers (MPMC) producers
+# share one lock and consumers share another, a producer still never waits
+# for a consumer.
+
+HEADER_SIZE = 128
+PRODUCER_OFFSET = 0
+CONSUMER_OFFSET = 64
+COUNTERS = struct.Struct("QQ")
+RECORD_LENGTH = struct.Struct("I")
+
+class SharedMemoryQueue:
+
+    # capacity     : size of the ring in bytes, a record needs its length + 4
+    # multi_process: False for one producer and one consumer process (SPSC),
+    #                True when several processes enqueue or dequeue (MPMC)
+    # observer     : optional function which receives diagnostic messages
+    def __init__(self, capacity: int = 1 << 20, multi_process: bool = True, observer = None):
+        if (capacity <= RECORD_LENGTH.size):
+            raise ValueError(f"capacity must be greater than {RECORD_LENGTH.size}")
+
+        self.capacity = capacity
+        self.observer = observer
+        self.memory = shared_memory.SharedMemory(create = True, size = HEADER_SIZE + capacity)
+        self.memory.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        if (multi_process):
+            self.producer_lock = multiprocessing.Lock()
+            self.consumer_lock = multiprocessing.Lock()
+        else:
+            self.producer_lock = None
+            self.consumer_lock = None
+        self._attach_views()
+
+    def _attach_views(self):
+        self.ring = self.memory.buf[HEADER_SIZE:HEADER_SIZE + self.capacity]
+
+    # The queue is handed to a spawned process by pickling: the shared block
+    # is attached again by name, views of the old mapping can not be sent
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["ring"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._attach_views()
+
+    # Number of records in the queue, Time complexity O(1)
+    def __len__(self):
+        return self.get_count()
+
+    def _read_counters(self, offset: int):
+        return COUNTERS.unpack_from(self.memory.buf, offset)
+
+    # Copies data into the ring at a byte position, in two parts on wrap
+    def _copy_in(self, position: int, data):
+        offset = position % self.capacity
+        first_part = min(len(data), self.capacity - offset)
+        self.ring[offset:offset + first_part] = data[:first_part]
+        if (first_part < len(data)):
+            self.ring[:len(data) - first_part] = data[first_part:]
+
+    # Copies size bytes out of the ring at a byte position
+    def _copy_out(self, position: int, size: int) -> bytes:
+        offset = position % self.capacity
+        if (offset + size <= self.capacity):
+            return self.ring[offset:offset + size].tobytes()
+        first_part = self.capacity - offset
+        return self.ring[offset:].tobytes() + self.ring[:size - first_part].tobytes()
+
+    # Adds one record at the rear, returns False when there is no room
+    # data is any bytes like object (bytes, bytearray, memoryview, array)
+    def enqueue(self, data) -> bool:
+        data = memoryview(data).cast("B")
+        record_size = RECORD_LENGTH.size + len(data)
+        if (record_size > self.capacity):
+            raise ValueError(f"record of {len(data)} bytes does not fit into the ring")
+
+        if (self.producer_lock != None):
+            self.producer_lock.acquire()
+        try:
+            tail, enqueued = self._read_counters(PRODUCER_OFFSET)
+            head, _ = self._read_counters(CONSUMER_OFFSET)
+
+            # Case 1: Not enough free bytes
+            if (self.capacity - (tail - head) < record_size):
+                if (self.observer != None):
+                    self.observer("Queue is full")
+                return False
+
+            # Case 2: Copy the record, then publish it by moving tail
+            self._copy_in(tail, RECORD_LENGTH.pack(len(data)))
+            self._copy_in(tail + RECORD_LENGTH.size, data)
+            COUNTERS.pack_into(self.memory.buf, PRODUCER_OFFSET, tail + record_size, enqueued + 1)
+            return True
+        finally:
+            if (self.producer_lock != None):
+                self.producer_lock.release()
+
+    # Returns (head, dequeued, payload size) of the front record, None when empty
+    def _front(self):
+        head, dequeued = self._read_counters(CONSUMER_OFFSET)
+        tail, _ = self._read_counters(PRODUCER_OFFSET)
+        if (head == tail):
+            return None
+        size, = RECORD_LENGTH.unpack(self._copy_out(head, RECORD_LENGTH.size))
+        return head, dequeued, size
+
+    # Removes the front record and returns its bytes, -100 when empty
+    def dequeue(self):
+        if (self.consumer_lock != None):
+            self.consumer_lock.acquire()
+        try:
+            front = self._front()
+            if (front == None):
+                if (self.observer != None):
+                    self.observer("Queue is empty")
+                return -100
+
+            head, dequeued, size = front
+            data = self._copy_out(head + RECORD_LENGTH.size, size)
+            COUNTERS.pack_into(self.memory.buf, CONSUMER_OFFSET, head + RECORD_LENGTH.size + size, dequeued + 1)
+            return data
+        finally:
+            if (self.consumer_lock != None):
+                self.consumer_lock.release()
+
+    # Returns the bytes of the front record without removing it, -100 when empty
+    def peek(self):
+        if (self.consumer_lock != None):
+            self.consumer_lock.acquire()
+        try:
+            front = self._front()
+            if (front == None):
+                if (self.observer != None):
+                    self.observer("Queue is empty")
+                return -100
+
+            head, _, size = front
+            return self._copy_out(head + RECORD_LENGTH.size, size)
+        finally:
+            if (self.consumer_lock != None):
+                self.consumer_lock.release()
+
+    # Lock free snapshot. The consumer counter is read first: both counters
+    # only grow and dequeued never passes enqueued, so the difference can
+    # not go negative. It is clamped anyway, a record takes at least 4 bytes.
+    def get_count(self) -> int:
+        _, dequeued = self._read_counters(CONSUMER_OFFSET)
+        _, enqueued = self._read_counters(PRODUCER_OFFSET)
+        return min(max(enqueued - dequeued, 0), self.capacity // RECORD_LENGTH.size)
+
+    # Detaches this process from the shared block
+    def close(self):
+        self.ring.release()
+        self.memory.close()
+
+    # Frees the shared block, call once in the creating process after close
+    def unlink(self):
+        self.memory.unlink()
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def _produce(work_queue: SharedMemoryQueue, messages: int, size: int):
+    payload = bytes(size)
+    for _ in range(messages):
+        while (not work_queue.enqueue(payload)):
+            time.sleep(0)
+
+def shared_memory_queue_test():
+    work_queue = SharedMemoryQueue(capacity = 64, observer = print)
+    work_queue.dequeue()
+    for word in (b"alpha", b"beta", b"gamma"):
+        work_queue.enqueue(word)
+    print(f"Count = {work_queue.get_count()}, peek = {work_queue.peek()}")
+
+    # Records wrap around the end of the 64 byte ring
+    for word in (b"delta", b"epsilon", b"zeta"):
+        print(f"Dequeued {work_queue.dequeue()}, enqueued {word} = {work_queue.enqueue(word)}")
+
+    # Another process fills it, this process drains it (polling quietly)
+    work_queue.observer = None
+    producer = multiprocessing.Process(target = _produce, args = (work_queue, 10, 8))
+    producer.start()
+    received = 0
+    while (received < 10 + 3):
+        if (work_queue.dequeue() != -100):
+            received = received + 1
+    producer.join()
+    print(f"Received {received} records, count = {work_queue.get_count()}")
+
+    work_queue.close()
+    work_queue.unlink()
+
+def _produce_mp(work_queue, messages: int, size: int):
+    payload = bytes(size)
+    for _ in range(messages):
+        work_queue.put(payload)
+
+# One producer process sends messages, this process receives them.
+# Every size moves about total_bytes, with at least 100 messages.
+def ipc_benchmark(sizes = (64, 1024, 64 * 1024, 1024 * 1024), total_bytes: int = 64 * 1024 * 1024):
+    print(f"{'message':>10} {'queue':>22} {'messages/sec':>14} {'MB/sec':>10}")
+    for size in sizes:
+        messages = max(100, total_bytes // size)
+        capacity = max(1 << 20, 8 * (size + RECORD_LENGTH.size))
+
+        variants = [
+            ("multiprocessing.Queue", lambda: multiprocessing.Queue(), _produce_mp, lambda q: q.get()),
+            ("SharedMemoryQueue SPSC", lambda: SharedMemoryQueue(capacity, multi_process = False), _produce, SharedMemoryQueue.dequeue),
+            ("SharedMemoryQueue MPMC", lambda: SharedMemoryQueue(capacity), _produce, SharedMemoryQueue.dequeue),
+        ]
+        for name, create, produce, take in variants:
+            work_queue = create()
+            start = time.perf_counter()
+            producer = multiprocessing.Process(target = produce, args = (work_queue, messages, size))
+            producer.start()
+
+            received = 0
+            while (received < messages):
+                if (take(work_queue) == -100):
+                    time.sleep(0)
+                else:
+                    received = received + 1
+            producer.join()
+            elapsed = time.perf_counter() - start
+
+            if (isinstance(work_queue, SharedMemoryQueue)):
+                work_queue.close()
+                work_queue.unlink()
+            print(f"{size:>10} {name:>22} {messages / elapsed:>14,.0f} {messages * size / elapsed / 2 ** 20:>10,.1f}")
+
+
+if __name__ == "__main__":
+    shared_memory_queue_test()
+
+    #ipc_benchmark()
@@ -24,16 +24,44 @@ Telegram: https://t.me/+hyVHXek9WM0zNWQ1
 -----------------------------------------------------------------------------
 """
 
+import time
+
 # Class which represent the node in a singly linked list
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 # Class implements all the operations for singly linked list
+# observer is an optional function which receives diagnostic messages
+# node_pool is an optional NodePool(Node) which recycles deleted nodes.
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, observer = None, node_pool = None):
         self.head = None
+        self.observer = observer
+        self.node_pool = node_pool
+        # Reference to the last node and number of nodes are kept up to date
+        # by every insert / delete so that append and length are O(1)
+        self.tail = None
+        self.count = 0
+
+    # Number of nodes in the list, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the data of every node from head to tail, so the list works
+    # with for loops, list(), sum() etc. without printing anything
+    def __iter__(self):
+        current_node = self.head
+        while (current_node != None):
+            yield current_node.data
+            current_node = current_node.next
+
+    # Supports "key in list"
+    def __contains__(self, key):
+        return self.search(key)
     
     # This function add the node at the beginning
     # This needs to handle two scenarios/cases
@@ -41,45 +69,43 @@ class SinglyLinkedList:
     # 2) List has some elements
     def insert_at_beginning(self, data):
         # Create a new node
-        new_node = Node(data)
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
 
         # Case 1: If the list is empty, make the new node as head
         if (self.head == None):
             self.head = new_node
+            self.tail = new_node
+            self.count = 1
             return
         
         # Case 2: If the list is not empty, make the new node as head and point to the old head
         new_node.next = self.head
         self.head = new_node
+        self.count = self.count + 1
         return
 
     # This function adds the node at the end of the linked list
     # It needs to handle two cases
     # 1. When list is empty
-    # 2. When list has only one node 
-    # 3. When list has more than one node 
+    # 2. When list has one or more nodes
+    # We keep a reference to the last node, so no loop is needed
+    # Time complexity O(1)
 
     def insert_at_end(self, data):
         # Create an object of type Node
-        new_node = Node(data)
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
         
         # 1 When list is empty
         if (self.head == None):
             self.head = new_node
+            self.tail = new_node
+            self.count = 1
             return
         
-        # 2 When list has only one node 
-        if (self.head.next == None):
-            self.head.next = new_node
-            return
-        
-        # 3 When there are more than one node loop till the last node
-        current_node = self.head
-        while (current_node.next != None):
-            current_node = current_node.next
-
-        # Set the last node next to the new node
-        current_node.next = new_node
+        # 2 When list has one or more nodes, link after the last node
+        self.tail.next = new_node
+        self.tail = new_node
+        self.count = self.count + 1
         return
 
     def print_list(self):
@@ -95,38 +121,42 @@ class SinglyLinkedList:
             print (str(current_node.data) + " --> ")
             current_node = current_node.next
     
-    def search(self, key):
-        # When list is empty
-        if (self.head == None):
-            print("List is empty")
-            return
-        
+    # Returns True when the key is present, nothing is printed in the loop
+    def search(self, key) -> bool:
         current_node = self.head
 
         #while (current_node.next != None):
         while (current_node != None):
-            print (str(current_node.data) + " --> ")
-            
             if (key == current_node.data):
-                print("Given key is present in the list")
-                return
+                if (self.observer != None):
+                    self.observer("Given key is present in the list")
+                return True
             
             current_node = current_node.next
         
-        print("Given key is not present in the list")
+        if (self.observer != None):
+            self.observer("Given key is not present in the list")
+        return False
 
     def delete_at_beginning(self):
         # List is empty
         if (self.head == None):
             return
 
+        deleted_node = self.head
+
         # List has only one node
         if (self.head.next == None):
             self.head = None
-            return
-        
-        # two or more nodes present 
-        self.head = self.head.next
+            self.tail = None
+            self.count = 0
+        else:
+            # two or more nodes present 
+            self.head = self.head.next
+            self.count = self.count - 1
+
+        if (self.node_pool != None):
+            self.node_pool.release(deleted_node)
 
     def delete_at_end(self):
         # list is empty
@@ -135,50 +165,75 @@ class SinglyLinkedList:
         
         # List has one node 
         if (self.head.next == None):
+            if (self.node_pool != None):
+                self.node_pool.release(self.head)
             self.head = None
+            self.tail = None
+            self.count = 0
             return
 
         # We have 2 more more nodes in the list 
+        # We still need the node before the tail, so this remains O(n)
         current_node = self.head
         while (current_node.next.next != None):
             current_node = current_node.next
 
+        if (self.node_pool != None):
+            self.node_pool.release(current_node.next)
         current_node.next = None
+        self.tail = current_node
+        self.count = self.count - 1
 
     def insert_at_position(self, data, insert_position):
         # Position is invalid 
         if (insert_position <= 0):
-            print("Invalid position")
+            if (self.observer != None):
+                self.observer("Invalid position")
             return
         
+        # Valid positions are 1 to count + 1, checked in O(1) using count
+        if (insert_position > self.count + 1):
+            if (self.observer != None):
+                self.observer("Invalid position, there are lesser number of nodes")
+            return
+
         # Insert at the first position
         if (insert_position == 1):
             self.insert_at_beginning(data)
             return
 
+        # Insert after the last node, no need to loop
+        if (insert_position == self.count + 1):
+            self.insert_at_end(data)
+            return
+
         # Insert at positions 2 or greater 
         current_node = self.head
         current_position = 1
 
-        while current_position < insert_position-1 and current_node is not None:
+        while current_position < insert_position-1:
             current_position = current_position + 1
             current_node = current_node.next
         
-        if (current_node == None):
-            print("Invalid position, there are lesser number of nodes")
-            return
-        
-        new_node = Node(data)
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
         new_node.next = current_node.next #1
         current_node.next = new_node #2
+        self.count = self.count + 1
         
 
     def delete_at_position(self, delete_position):
         # Position is invalid 
         if (delete_position <= 0):
-            print("Invalid position")
+            if (self.observer != None):
+                self.observer("Invalid position")
             return
         
+        # Valid positions are 1 to count, checked in O(1) using count
+        if (delete_position > self.count):
+            if (self.observer != None):
+                self.observer("Invalid position, there are lesser number of nodes")
+            return
+
         # Insert at the first position
         if (delete_position == 1):
             self.delete_at_beginning()
@@ -188,15 +243,19 @@ class SinglyLinkedList:
         current_node = self.head
         current_position = 1
 
-        while current_position < delete_position-1 and current_node is not None:
+        while current_position < delete_position-1:
             current_position = current_position + 1
             current_node = current_node.next
         
-        if (current_node == None):
-            print("Invalid position, there are lesser number of nodes")
-            return
-        
-        current_node.next = current_node.next.next
+        deleted_node = current_node.next
+        current_node.next = deleted_node.next
+        self.count = self.count - 1
+        if (self.node_pool != None):
+            self.node_pool.release(deleted_node)
+
+        # Deleted the last node, node before it becomes the tail
+        if (current_node.next == None):
+            self.tail = current_node
 
 
 
@@ -231,8 +290,9 @@ def print_search_list_driver_code(list: SinglyLinkedList):
     list.insert_at_end(30)
     list.print_list()
 
-    list.search(100)
-    list.search(20)
+    print(f"Search 100 = {list.search(100)}")
+    print(f"Search 20 = {list.search(20)}")
+    print(f"20 in list = {20 in list}, values = {[value for value in list]}")
 
 def delete_operations_start_end(list: SinglyLinkedList):
     list.delete_at_beginning()
@@ -265,6 +325,21 @@ def insert_delete_at_given_position(list: SinglyLinkedList):
     list.insert_at_position(40, 4)
     list.insert_at_position(100, 10)
 
+# Builds lists of growing sizes with insert_at_end and prints the time per node.
+# With the tail reference the time per node stays flat, i.e. the total time
+# grows linearly with the number of nodes (earlier it grew quadratically).
+def insert_at_end_benchmark(sizes = (1_000, 10_000, 100_000, 1_000_000)):
+    print(f"{'nodes':>10} {'total (s)':>12} {'per node (ns)':>15}")
+    for size in sizes:
+        list = SinglyLinkedList()
+        start = time.perf_counter()
+        for value in range(size):
+            list.insert_at_end(value)
+        elapsed = time.perf_counter() - start
+
+        assert len(list) == size
+        print(f"{size:>10} {elapsed:>12.4f} {elapsed / size * 1e9:>15.1f}")
+
 
 
 
@@ -272,7 +347,7 @@ def insert_delete_at_given_position(list: SinglyLinkedList):
 
 if __name__ == "__main__":
     # Create a new singly linked list
-    list = SinglyLinkedList()
+    list = SinglyLinkedList(observer = print)
 
    # insert_at_beginning_driver_code(list)
 
@@ -284,6 +359,8 @@ if __name__ == "__main__":
 
     insert_delete_at_given_position(list)
 
+   # insert_at_end_benchmark()
+
 
 
 
@@ -0,0 +1,344 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import random
+import time
+
+# Indexable skip list
+# Level 0 is a normal singly linked list holding every element. Every node
+# is also promoted to the levels above it with probability PROMOTE_PROBABILITY,
+# so the upper levels are "express lanes" that skip over many nodes at once.
+#
+#   level 2: head ------------------------> 30 ------------------------> None
+#   level 1: head ---------> 15 ----------> 30 ---------> 50 ----------> None
+#   level 0: head --> 10 --> 15 --> 20 --> 30 --> 40 --> 50 --> 60 --> None
+#
+# Every link also stores its span, i.e. how many level 0 steps it jumps.
+# Adding up spans while walking the express lanes tells us the position,
+# so operations by position and by key both run in O(log n) on average.
+# Positions are 1 based like in SinglyLinkedList / DoublyLinkedList.
+
+MAX_LEVEL = 32
+PROMOTE_PROBABILITY = 0.5
+
+# Class which represent a node, next[i] / span[i] are the link at level i
+class Node:
+    __slots__ = ("data", "next", "span")
+
+    def __init__(self, data, level: int):
+        self.data = data
+        self.next = [None] * level
+        self.span = [0] * level
+
+# observer is an optional function which receives diagnostic messages
+class SkipList:
+    def __init__(self, observer = None):
+        # Head is a sentinel node present in all the levels
+        self.head = Node(None, MAX_LEVEL)
+        self.level = 1
+        self.count = 0
+        # Key based search can only use the express lanes while elements
+        # are in sorted order. Positional inserts clear this flag when they
+        # break the order and search falls back to a linear scan.
+        self.is_sorted = True
+        self.observer = observer
+
+    # Number of elements in the list, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields every element in position order (level 0 list)
+    def __iter__(self):
+        current_node = self.head.next[0]
+        while (current_node != None):
+            yield current_node.data
+            current_node = current_node.next[0]
+
+    # Supports "key in slist", uses the express lanes while sorted
+    def __contains__(self, key):
+        return self.search(key)
+
+    def _random_level(self) -> int:
+        level = 1
+        while (level < MAX_LEVEL and random.random() < PROMOTE_PROBABILITY):
+            level = level + 1
+        return level
+
+    # Links a new node after update[0], update[i] is the last node before the
+    # new node at level i and rank[i] is the position of update[i]
+    def _insert_after(self, update: list, rank: list, data):
+        new_level = self._random_level()
+
+        # New levels start at head and span the whole list
+        if (new_level > self.level):
+            for i in range(self.level, new_level):
+                rank[i] = 0
+                update[i] = self.head
+                update[i].span[i] = self.count
+            self.level = new_level
+
+        new_node = Node(data, new_level)
+        for i in range(new_level):
+            new_node.next[i] = update[i].next[i]
+            update[i].next[i] = new_node
+
+            # update[i] used to jump over the new position, split its span
+            new_node.span[i] = update[i].span[i] - (rank[0] - rank[i])
+            update[i].span[i] = (rank[0] - rank[i]) + 1
+
+        # Links above the new node now jump over one more element
+        for i in range(new_level, self.level):
+            update[i].span[i] = update[i].span[i] + 1
+
+        self.count = self.count + 1
+
+        # Check the order against the neighbours in O(1), like in the linked
+        # lists any data can be stored and values which can not be compared
+        # (None, "a" and 1, dicts) just mean the list is not sorted
+        previous_node = update[0]
+        next_node = new_node.next[0]
+        try:
+            if (previous_node != self.head and previous_node.data > data):
+                self.is_sorted = False
+            if (next_node != None and data > next_node.data):
+                self.is_sorted = False
+        except TypeError:
+            self.is_sorted = False
+
+    # Walks the express lanes to the node just before the given position
+    def _find_update_by_position(self, position: int):
+        update = [None] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        current_node = self.head
+        traversed = 0
+
+        for i in range(self.level - 1, -1, -1):
+            while (current_node.next[i] != None and traversed + current_node.span[i] < position):
+                traversed = traversed + current_node.span[i]
+                current_node = current_node.next[i]
+            update[i] = current_node
+            rank[i] = traversed
+
+        return update, rank
+
+    def insert_at_position(self, data, insert_position):
+        # Valid positions are 1 to count + 1
+        if (insert_position <= 0 or insert_position > self.count + 1):
+            if (self.observer != None):
+                self.observer("Invalid position")
+            return
+
+        update, rank = self._find_update_by_position(insert_position)
+        self._insert_after(update, rank, data)
+
+    def insert_at_beginning(self, data):
+        self.insert_at_position(data, 1)
+
+    def insert_at_end(self, data):
+        self.insert_at_position(data, self.count + 1)
+
+    # Inserts data at its place in sorted order, Time complexity O(log n)
+    def insert_sorted(self, data):
+        if (not self.is_sorted):
+            if (self.observer != None):
+                self.observer("List is not in sorted order, use insert_at_position")
+            return
+
+        update = [None] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        current_node = self.head
+        traversed = 0
+
+        for i in range(self.level - 1, -1, -1):
+            while (current_node.next[i] != None and current_node.next[i].data < data):
+                traversed = traversed + current_node.span[i]
+                current_node = current_node.next[i]
+            update[i] = current_node
+            rank[i] = traversed
+
+        self._insert_after(update, rank, data)
+
+    def delete_at_position(self, delete_position):
+        # Valid positions are 1 to count
+        if (delete_position <= 0 or delete_position > self.count):
+            if (self.observer != None):
+                self.observer("Invalid position")
+            return
+
+        update, _ = self._find_update_by_position(delete_position)
+        to_be_deleted = update[0].next[0]
+
+        for i in range(self.level):
+            if (update[i].next[i] == to_be_deleted):
+                update[i].span[i] = update[i].span[i] + to_be_deleted.span[i] - 1
+                update[i].next[i] = to_be_deleted.next[i]
+            else:
+                update[i].span[i] = update[i].span[i] - 1
+
+        # Drop the express lanes which became empty
+        while (self.level > 1 and self.head.next[self.level - 1] == None):
+            self.level = self.level - 1
+
+        self.count = self.count - 1
+        if (self.count == 0):
+            self.is_sorted = True
+
+    def delete_at_beginning(self):
+        if (self.count == 0):
+            return
+        self.delete_at_position(1)
+
+    def delete_at_end(self):
+        if (self.count == 0):
+            return
+        self.delete_at_position(self.count)
+
+    # Returns the data at the given position, Time complexity O(log n)
+    def get_at_position(self, position):
+        if (position <= 0 or position > self.count):
+            if (self.observer != None):
+                self.observer("Invalid position")
+            return None
+
+        current_node = self.head
+        traversed = 0
+        for i in range(self.level - 1, -1, -1):
+            while (current_node.next[i] != None and traversed + current_node.span[i] <= position):
+                traversed = traversed + current_node.span[i]
+                current_node = current_node.next[i]
+
+            if (traversed == position):
+                return current_node.data
+
+        return None
+
+    # Returns the position of the first node holding key, 0 when not found
+    # Time complexity O(log n) while sorted, otherwise O(n)
+    def find_position(self, key) -> int:
+        if (not self.is_sorted):
+            return self._find_position_linear(key)
+
+        current_node = self.head
+        traversed = 0
+        try:
+            for i in range(self.level - 1, -1, -1):
+                while (current_node.next[i] != None and current_node.next[i].data < key):
+                    traversed = traversed + current_node.span[i]
+                    current_node = current_node.next[i]
+        except TypeError:
+            # A key which can not be compared with the elements
+            return self._find_position_linear(key)
+
+        current_node = current_node.next[0]
+        if (current_node != None and current_node.data == key):
+            return traversed + 1
+        return 0
+
+    # Scans level 0 from the first element, Time complexity O(n)
+    def _find_position_linear(self, key) -> int:
+        position = 1
+        current_node = self.head.next[0]
+        while (current_node != None):
+            if (current_node.data == key):
+                return position
+            position = position + 1
+            current_node = current_node.next[0]
+        return 0
+
+    def search(self, key) -> bool:
+        return self.find_position(key) != 0
+
+    def print_list(self):
+        if (self.count == 0):
+            print("List is empty")
+            return
+
+        current_node = self.head.next[0]
+        while (current_node != None):
+            print(f" {current_node.data} --> ")
+            current_node = current_node.next[0]
+
+
+### This code is outside the class
+# Driver code to test the above class
+
+def positional_driver_code(slist: SkipList):
+    slist.insert_at_end(10)
+    slist.insert_at_end(30)
+    slist.insert_at_position(20, 2)
+    slist.insert_at_beginning(5)
+    slist.insert_at_position(100, 10)
+    slist.print_list()
+
+    print(f"Element at position 3 = {slist.get_at_position(3)}")
+    print(f"Search 30 = {slist.search(30)}, position = {slist.find_position(30)}")
+    print(f"Search 25 = {slist.search(25)}")
+
+    slist.delete_at_position(2)
+    slist.delete_at_end()
+    slist.print_list()
+
+    # Any data can be inserted by position, even values which can not be
+    # compared, the list is then searched with a linear scan
+    mixed = SkipList()
+    for value in (None, None, "a", 1, {"key": 1}, {"key": 2}):
+        mixed.insert_at_end(value)
+    print(f"Mixed values = {list(mixed)}, sorted = {mixed.is_sorted}, position of 1 = {mixed.find_position(1)}")
+
+def sorted_driver_code(slist: SkipList):
+    for value in (50, 10, 40, 20, 30):
+        slist.insert_sorted(value)
+    slist.print_list()
+    print(f"Position of 40 = {slist.find_position(40)}, values = {list(slist)}")
+
+# Random positional inserts, SkipList against SinglyLinkedList
+def positional_insert_benchmark(sizes = (1_000, 5_000, 20_000)):
+    from SinglyLinkedList import SinglyLinkedList
+
+    print(f"{'inserts':>10} {'SinglyLinkedList (s)':>22} {'SkipList (s)':>14}")
+    for size in sizes:
+        positions = [random.randint(1, i + 1) for i in range(size)]
+        timings = []
+        for list_class in (SinglyLinkedList, SkipList):
+            list = list_class()
+            start = time.perf_counter()
+            for value, position in enumerate(positions):
+                list.insert_at_position(value, position)
+            timings.append(time.perf_counter() - start)
+
+        print(f"{size:>10} {timings[0]:>22.4f} {timings[1]:>14.4f}")
+
+
+# This is the main block to invoke the driver methods and test your code
+
+if __name__ == "__main__":
+    slist = SkipList(observer = print)
+
+    positional_driver_code(slist)
+
+   # sorted_driver_code(SkipList())
+
+   # positional_insert_benchmark()
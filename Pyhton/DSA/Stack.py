@@ -25,47 +25,84 @@ Telegram: https://t.me/+hyVHXek9WM0zNWQ1
 """
 
 class Node:
+    __slots__ = ("data", "next")
 
     def __init__(self, data):
         self.data = data
         self.next = None
 
+# observer is an optional function which receives diagnostic messages
+# node_pool is an optional NodePool(Node) which recycles deleted nodes.
 class Stack:
 
-    def __init__(self):
+    def __init__(self, observer = None, node_pool = None):
         self.count = 0
         self.top = None
+        self.observer = observer
+        self.node_pool = node_pool
+
+    # Number of items in the stack, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the items from top to bottom without printing
+    def __iter__(self):
+        current_node = self.top
+        while (current_node is not None):
+            yield current_node.data
+            current_node = current_node.next
+
+    # Supports "key in stack"
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Returns True when the key is present anywhere in the stack
+    def search(self, key) -> bool:
+        current_node = self.top
+        while (current_node is not None):
+            if (current_node.data == key):
+                return True
+            current_node = current_node.next
+        return False
 
     def push(self, data):
-        new_node = Node(data)
+        new_node = Node(data) if (self.node_pool == None) else self.node_pool.acquire(data)
 
         new_node.next = self.top
         self.top = new_node
         self.count = self.count + 1
-        print(f"Pushed the value {data} to stack top")
+        if (self.observer != None):
+            self.observer(f"Pushed the value {data} to stack top")
 
     def pop(self) -> int: 
         # Case 1: Stack is empty
         if (self.top == None):
-            print("Stack is empty! can't perform pop operation")
+            if (self.observer != None):
+                self.observer("Stack is empty! can't perform pop operation")
             return -100
         
-        data = self.top.data
-        self.top = self.top.next
+        popped_node = self.top
+        data = popped_node.data
+        self.top = popped_node.next
         self.count = self.count - 1
-        print(f"Popped the item from stack {data}")
+        if (self.node_pool != None):
+            self.node_pool.release(popped_node)
+        if (self.observer != None):
+            self.observer(f"Popped the item from stack {data}")
         return data
     
     def peek(self) -> int:
          # Case 1: Stack is empty
         if (self.top == None):
-            print("Stack is empty! can't perform pop operation")
+            if (self.observer != None):
+                self.observer("Stack is empty! can't perform pop operation")
             return -100
         
         return self.top.data
     
     def get_count(self) -> int:
-        print(f"There are {self.count} items in the stack")
+        if (self.observer != None):
+            self.observer(f"There are {self.count} items in the stack")
         return self.count
     
     def print_all_values(self):
@@ -81,7 +118,7 @@ class Stack:
 
 if __name__ == "__main__":
 
-    stack = Stack()
+    stack = Stack(observer = print)
 
     stack.pop()
     count_items = stack.get_count()
@@ -100,6 +137,7 @@ if __name__ == "__main__":
     stack.print_all_values()
     stack.pop()
     stack.print_all_values()
+    print(f"Items = {list(stack)}, 3 in stack = {3 in stack}, 5 in stack = {5 in stack}")
 
 
 
@@ -0,0 +1,276 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+import heapq
+import random
+import time
+
+from CicularList import CicularList
+
+# Hierarchical hashed timing wheel
+#
+# Time is counted in ticks. A wheel is a CicularList of slots, every slot
+# (node) holds a bucket of timers. The cursor node of the lowest wheel moves
+# one slot per tick and fires every timer in the slot it reaches.
+#
+#   level 0 (1 tick per slot)       [0][1][2]...[255]      cursor moves every tick
+#   level 1 (256 ticks per slot)    [0][1][2]...[63]       cursor moves every 256 ticks
+#   level 2 (256*64 ticks per slot) [0][1][2]...[63]       ...
+#
+# A timer goes to the lowest level whose range covers its delay, in the slot
+# of its expiry tick: schedule is O(1). When the cursor of a higher level
+# moves to a slot, the timers of that slot are "cascaded", i.e. scheduled
+# again into the lower levels, now that they are closer to expiry.
+# Buckets are dicts (insertion ordered sets), so cancel removes a timer from
+# its bucket in O(1).
+
+DEFAULT_WHEEL_SIZES = (256, 64, 64, 64)
+
+# A scheduled callback, returned by schedule() so that it can be cancelled
+# bucket is the dict the timer is in, also while its batch is being fired
+class Timer:
+    __slots__ = ("expires", "callback", "args", "bucket", "cancelled")
+
+    def __init__(self, expires: int, callback, args):
+        self.expires = expires
+        self.callback = callback
+        self.args = args
+        self.bucket = None
+        self.cancelled = False
+
+class TimingWheel:
+
+    def __init__(self, wheel_sizes = DEFAULT_WHEEL_SIZES):
+        self.wheel_sizes = tuple(wheel_sizes)
+        self.current_tick = 0
+        self.count = 0
+
+        # spans[level] = number of ticks covered by one slot of that level
+        self.spans = []
+        span = 1
+        for size in self.wheel_sizes:
+            self.spans.append(span)
+            span = span * size
+
+        # Every level is a CicularList ring of buckets. slot_nodes gives
+        # direct access to the node of a slot index, cursors hold the node
+        # of the slot the level is currently at (slot 0 at tick 0).
+        self.wheels = []
+        self.slot_nodes = []
+        self.cursors = []
+        for size in self.wheel_sizes:
+            ring = CicularList()
+            for _ in range(size):
+                ring.insert_at_tail({})
+
+            nodes = []
+            node = ring.tail.next
+            for _ in range(size):
+                nodes.append(node)
+                node = node.next
+
+            self.wheels.append(ring)
+            self.slot_nodes.append(nodes)
+            self.cursors.append(nodes[0])
+
+    # Number of pending timers
+    def __len__(self):
+        return self.count
+
+    # Puts the timer in the bucket of the right level and slot, O(levels)
+    def _place(self, timer: Timer):
+        delay = timer.expires - self.current_tick
+        top_level = len(self.wheel_sizes) - 1
+
+        for level in range(len(self.wheel_sizes)):
+            span = self.spans[level]
+            if (delay < span * self.wheel_sizes[level] or level == top_level):
+                if (delay >= span * self.wheel_sizes[level]):
+                    # Beyond the range of the top level: park it in the slot
+                    # which is cascaded last, it is placed again from there
+                    slot = (self.current_tick // span) % self.wheel_sizes[level]
+                else:
+                    slot = (timer.expires // span) % self.wheel_sizes[level]
+
+                bucket = self.slot_nodes[level][slot].data
+                bucket[timer] = None
+                timer.bucket = bucket
+                return
+
+    # Calls callback(*args) after delay_ticks ticks, returns the Timer
+    # A delay smaller than 1 fires on the next tick
+    def schedule(self, delay_ticks: int, callback, *args) -> Timer:
+        timer = Timer(self.current_tick + max(1, delay_ticks), callback, args)
+        self._place(timer)
+        self.count = self.count + 1
+        return timer
+
+    # Returns True when the timer was still pending, Time complexity O(1)
+    # Works from a callback too, also for a timer of the batch being fired
+    def cancel(self, timer: Timer) -> bool:
+        if (timer.bucket == None):
+            return False
+
+        del timer.bucket[timer]
+        timer.bucket = None
+        timer.cancelled = True
+        self.count = self.count - 1
+        return True
+
+    # Moves the cursor of a level to its next slot and takes out its bucket
+    def _take_next_bucket(self, level: int) -> dict:
+        node = self.cursors[level].next
+        self.cursors[level] = node
+        bucket = node.data
+        node.data = {}
+        return bucket
+
+    # Advances the clock by the given number of ticks and fires the timers
+    # which expire. Timers of one slot are fired together as one batch.
+    # Returns the number of callbacks fired.
+    def advance(self, ticks: int = 1) -> int:
+        fired = 0
+        for _ in range(ticks):
+            self.current_tick = self.current_tick + 1
+
+            # Cascade from the highest level down, so timers coming from a
+            # higher level can still drop into the lowest level on this tick
+            for level in range(len(self.wheel_sizes) - 1, 0, -1):
+                if (self.current_tick % self.spans[level] == 0):
+                    for timer in self._take_next_bucket(level):
+                        self._place(timer)
+
+            # The batch is walked on a copy, so a callback can cancel a
+            # timer of this batch (it is removed from the batch and skipped)
+            batch = self._take_next_bucket(0)
+            try:
+                for timer in list(batch):
+                    if (timer.cancelled):
+                        continue
+
+                    # Case 1: Parked beyond the range of a single level wheel,
+                    # not due yet, it goes back into the wheel
+                    if (timer.expires > self.current_tick):
+                        del batch[timer]
+                        self._place(timer)
+                        continue
+
+                    # Case 2: Due, fire it
+                    del batch[timer]
+                    timer.bucket = None
+                    self.count = self.count - 1
+                    fired = fired + 1
+                    timer.callback(*timer.args)
+            finally:
+                # A callback raised: the timers of the batch which are left
+                # go to the slot of the next tick, so they are not lost
+                if (batch):
+                    next_bucket = self.cursors[0].next.data
+                    for timer in batch:
+                        next_bucket[timer] = None
+                        timer.bucket = next_bucket
+        return fired
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def timing_wheel_test():
+    wheel = TimingWheel(wheel_sizes = (8, 4, 4))
+    wheel.schedule(3, print, "timer A fired at tick 3")
+    wheel.schedule(20, print, "timer B fired at tick 20")
+    timer_c = wheel.schedule(5, print, "timer C should never fire")
+    wheel.schedule(100, print, "timer D fired at tick 100 (beyond the top level)")
+
+    print(f"Pending timers = {len(wheel)}, cancel C = {wheel.cancel(timer_c)}")
+    for _ in range(100):
+        wheel.advance()
+    print(f"Pending timers = {len(wheel)} at tick {wheel.current_tick}")
+
+# Heap of (expiry tick, sequence number, timer) with lazy cancellation
+class HeapTimers:
+
+    def __init__(self):
+        self.heap = []
+        self.current_tick = 0
+        self.sequence = 0
+
+    def schedule(self, delay_ticks: int, callback, *args) -> list:
+        entry = [self.current_tick + max(1, delay_ticks), self.sequence, callback, args]
+        self.sequence = self.sequence + 1
+        heapq.heappush(self.heap, entry)
+        return entry
+
+    def cancel(self, entry: list):
+        entry[2] = None
+
+    def advance(self, ticks: int = 1) -> int:
+        fired = 0
+        for _ in range(ticks):
+            self.current_tick = self.current_tick + 1
+            # Entries are popped one at a time, when a callback raises the
+            # others are still in the heap and fire on the next advance
+            while (self.heap and self.heap[0][0] <= self.current_tick):
+                _, _, callback, args = heapq.heappop(self.heap)
+                if (callback != None):
+                    callback(*args)
+                    fired = fired + 1
+        return fired
+
+# Schedules n timers with random delays, cancels 10 % of them and advances
+# until every timer expired. large_sizes are opt-in, e.g. (10_000_000,),
+# 10_000_000 timers need a few GB of memory.
+def timers_benchmark(sizes = (10_000, 100_000, 1_000_000), large_sizes = (), max_delay: int = 10_000):
+    def callback():
+        pass
+
+    print(f"{'timers':>10} {'structure':>12} {'schedule (s)':>13} {'cancel (s)':>11} {'advance (s)':>12} {'fired':>10}")
+    for size in list(sizes) + list(large_sizes):
+        delays = [random.randint(1, max_delay) for _ in range(size)]
+        for timers_class in (HeapTimers, TimingWheel):
+            timers = timers_class()
+
+            start = time.perf_counter()
+            handles = [timers.schedule(delay, callback) for delay in delays]
+            schedule_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for handle in handles[::10]:
+                timers.cancel(handle)
+            cancel_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fired = timers.advance(max_delay)
+            advance_time = time.perf_counter() - start
+
+            print(f"{size:>10} {timers_class.__name__:>12} {schedule_time:>13.3f} {cancel_time:>11.3f} {advance_time:>12.3f} {fired:>10}")
+
+
+if __name__ == "__main__":
+    timing_wheel_test()
+
+    #timers_benchmark()
+    #timers_benchmark(large_sizes = (10_000_000,))
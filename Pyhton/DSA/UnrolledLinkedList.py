@@ -0,0 +1,294 @@
+"""
+-----------------------------------------------------------------------------
+Copyright <2024> <algorithms365>
+
+Professional Coding Skills Workshops
+
+Licensed under the MIT License:
+https://opensource.org/licenses/MIT
+
+For more information about algorithms365:
+Visit Our Skills Website: https://skills.algorithms365.com/
+Our Company Website: https://algorithms365.com/
+
+For Regular Updates Follow & Subscribe Us on Our Social Media Platforms:
+Instagram: https://www.instagram.com/algorithms365/
+YouTube: https://www.youtube.com/@algorithms365
+Facebook: https://www.facebook.com/algorithms365
+Twitter(X): https://x.com/algorithms365
+LinkedIn: https://www.linkedin.com/company/algorithms365-technologies-llp/
+
+Join Our Communities:
+WhatsApp: https://chat.whatsapp.com/K1K7wDMEXG0DJhqMCxFtht
+Telegram: https://t.me/+hyVHXek9WM0zNWQ1
+-----------------------------------------------------------------------------
+"""
+
+# Unrolled linked list
+# Instead of one element per node, every node stores a small block (array)
+# of up to `capacity` elements. The list still splices like a linked list
+# (nodes are linked with next) but elements sit next to each other in memory
+# like in a Python list, so there is much less per element overhead and
+# search walks through contiguous blocks.
+#
+#   head --> [10, 20, 30, __] --> [40, 50, __, __] --> [60, 70, 80, __] --> None
+#
+# Rules we keep:
+# 1. A node never holds more than `capacity` elements, a full node is split
+#    into two half full nodes when we insert into it
+# 2. After a delete, a node with less than capacity // 2 elements borrows
+#    from / merges with the next node, so the list does not fill up with
+#    almost empty nodes
+
+DEFAULT_CAPACITY = 64
+
+# Class which represent the node (block) in an unrolled linked list
+class Node:
+    __slots__ = ("elements", "next")
+
+    def __init__(self):
+        self.elements = []
+        self.next = None
+
+# Class implements the SinglyLinkedList operations on top of blocks
+# observer is an optional function which receives diagnostic messages
+class UnrolledLinkedList:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, observer = None):
+        if (capacity < 2):
+            raise ValueError("capacity must be at least 2")
+
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.count = 0
+        self.observer = observer
+
+    # Number of elements in the list, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields every element, block by block
+    def __iter__(self):
+        current_node = self.head
+        while (current_node != None):
+            yield from current_node.elements
+            current_node = current_node.next
+
+    # Supports "key in list"
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Splits a full node into two nodes, the second half moves to the new node
+    def _split_node(self, node: Node):
+        new_node = Node()
+        half = len(node.elements) // 2
+        new_node.elements = node.elements[half:]
+        del node.elements[half:]
+
+        new_node.next = node.next
+        node.next = new_node
+        if (self.tail == node):
+            self.tail = new_node
+
+    # Removes the node after previous_node (or head when previous_node is None)
+    def _unlink_node(self, previous_node: Node, node: Node):
+        if (previous_node == None):
+            self.head = node.next
+        else:
+            previous_node.next = node.next
+
+        if (self.tail == node):
+            self.tail = previous_node
+
+    # Called after a delete, keeps every node at least half full
+    # by borrowing an element from the next node or merging with it
+    def _rebalance_node(self, previous_node: Node, node: Node):
+        # Case 1: Node became empty, simply remove it
+        if (len(node.elements) == 0):
+            self._unlink_node(previous_node, node)
+            return
+
+        minimum = self.capacity // 2
+        next_node = node.next
+        if (len(node.elements) >= minimum or next_node == None):
+            return
+
+        # Case 2: Next node can spare elements, borrow the first one
+        if (len(next_node.elements) > minimum):
+            node.elements.append(next_node.elements.pop(0))
+            return
+
+        # Case 3: Both nodes are small, merge the next node into this node
+        node.elements.extend(next_node.elements)
+        self._unlink_node(node, next_node)
+
+    # Finds the node holding the element at the given position (1 based)
+    # Returns previous node, node and index of the element inside the node
+    # Time complexity O(n / capacity)
+    def _find_position(self, position: int):
+        previous_node = None
+        current_node = self.head
+        index = position - 1
+
+        while (index >= len(current_node.elements)):
+            index = index - len(current_node.elements)
+            previous_node = current_node
+            current_node = current_node.next
+
+        return previous_node, current_node, index
+
+    def insert_at_beginning(self, data):
+        # Case 1: List is empty
+        if (self.head == None):
+            self.head = Node()
+            self.tail = self.head
+
+        # Case 2: First node is full, split it before inserting
+        elif (len(self.head.elements) == self.capacity):
+            self._split_node(self.head)
+
+        self.head.elements.insert(0, data)
+        self.count = self.count + 1
+
+    # Appends to the block of the last node, Time complexity O(1)
+    def insert_at_end(self, data):
+        # Case 1: List is empty
+        if (self.head == None):
+            self.head = Node()
+            self.tail = self.head
+
+        # Case 2: Last node is full, start a new node
+        elif (len(self.tail.elements) == self.capacity):
+            new_node = Node()
+            self.tail.next = new_node
+            self.tail = new_node
+
+        self.tail.elements.append(data)
+        self.count = self.count + 1
+
+    def insert_at_position(self, data, insert_position):
+        # Valid positions are 1 to count + 1
+        if (insert_position <= 0 or insert_position > self.count + 1):
+            if (self.observer != None):
+                self.observer("Invalid position")
+            return
+
+        if (insert_position == 1):
+            self.insert_at_beginning(data)
+            return
+
+        if (insert_position == self.count + 1):
+            self.insert_at_end(data)
+            return
+
+        _, node, index = self._find_position(insert_position)
+
+        # Node is full, split it and find out in which half the position falls
+        if (len(node.elements) == self.capacity):
+            self._split_node(node)
+            if (index > len(node.elements)):
+                index = index - len(node.elements)
+                node = node.next
+
+        node.elements.insert(index, data)
+        self.count = self.count + 1
+
+    def delete_at_beginning(self):
+        # List is empty
+        if (self.head == None):
+            return
+
+        del self.head.elements[0]
+        self.count = self.count - 1
+        self._rebalance_node(None, self.head)
+
+    def delete_at_end(self):
+        # List is empty
+        if (self.head == None):
+            return
+
+        self.delete_at_position(self.count)
+
+    def delete_at_position(self, delete_position):
+        # Valid positions are 1 to count
+        if (delete_position <= 0 or delete_position > self.count):
+            if (self.observer != None):
+                self.observer("Invalid position")
+            return
+
+        previous_node, node, index = self._find_position(delete_position)
+        del node.elements[index]
+        self.count = self.count - 1
+        self._rebalance_node(previous_node, node)
+
+    # Returns True when key is present, the block is scanned by the list
+    # membership test which runs in C instead of one Python step per node
+    def search(self, key) -> bool:
+        current_node = self.head
+        while (current_node != None):
+            if (key in current_node.elements):
+                return True
+
+            current_node = current_node.next
+
+        return False
+
+    def print_list(self):
+        # When list is empty
+        if (self.head == None):
+            print("List is empty")
+            return
+
+        current_node = self.head
+        while (current_node != None):
+            print(f" {current_node.elements} --> ")
+            current_node = current_node.next
+
+
+### This code is outside the class
+# Driver code to test the above class
+
+def insert_delete_driver_code(list: UnrolledLinkedList):
+    for value in range(1, 11):
+        list.insert_at_end(value * 10)
+    list.print_list()
+
+    list.insert_at_beginning(5)
+    list.insert_at_position(15, 3)
+    list.insert_at_position(200, 14)
+    list.print_list()
+
+    list.delete_at_beginning()
+    list.delete_at_end()
+    list.delete_at_position(5)
+    list.print_list()
+
+    print(f"Search 70 = {list.search(70)}")
+    print(f"Search 1000 = {list.search(1000)}")
+    print(f"Number of elements = {len(list)}, values = {[value for value in list]}")
+
+# Compares the memory used by the nodes of SinglyLinkedList and
+# UnrolledLinkedList holding the same number of elements
+def memory_driver_code(size: int = 100_000):
+    import tracemalloc
+    from SinglyLinkedList import SinglyLinkedList
+
+    for list_class in (SinglyLinkedList, UnrolledLinkedList):
+        tracemalloc.start()
+        list = list_class()
+        for value in range(size):
+            list.insert_at_end(value)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{list_class.__name__:>20}: {current / size:.1f} bytes per element")
+
+
+# This is the main block to invoke the driver methods and test your code
+
+if __name__ == "__main__":
+    list = UnrolledLinkedList(capacity = 4, observer = print)
+
+    insert_delete_driver_code(list)
+
+   # memory_driver_code()
@@ -0,0 +1,346 @@
+import bisect
+import random
+import time
+
+# Node of the AVL tree, height of a leaf is 1
+class AVLNode:
+    __slots__ = ("key", "left", "right", "height")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+
+# Self balancing binary search tree (AVL)
+# Keys are unique, smaller keys go left and bigger keys go right. After every
+# insert / delete the heights of the two sub trees of any node differ by at
+# most 1, so the height stays O(log n) and so do search, insert, delete,
+# floor and ceiling. A node which gets out of balance is fixed by rotations:
+#
+#   Right rotation of y            Left rotation of x
+#         y                x              x                  y
+#        / \              / \            / \                / \
+#       x   C    ==>     A   y          A   y      ==>     x   C
+#      / \                  / \            / \            / \
+#     A   B                B   C          B   C          A   B
+class AVLTree:
+
+    # Class of the nodes the tree creates, subclasses can use a node with
+    # extra fields and keep them up to date in _updateHeight
+    nodeClass = AVLNode
+
+    def __init__(self):
+        self.root = None
+        self.count = 0
+
+    # Number of keys, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    # Yields the keys in sorted order
+    def __iter__(self):
+        return self.iterateRange(None, None)
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def _height(self, node: AVLNode) -> int:
+        return node.height if (node is not None) else 0
+
+    def _updateHeight(self, node: AVLNode):
+        leftHeight = node.left.height if (node.left is not None) else 0
+        rightHeight = node.right.height if (node.right is not None) else 0
+        node.height = (leftHeight if (leftHeight > rightHeight) else rightHeight) + 1
+
+    def _rotateRight(self, node: AVLNode) -> AVLNode:
+        newRoot = node.left
+        node.left = newRoot.right
+        newRoot.right = node
+        self._updateHeight(node)
+        self._updateHeight(newRoot)
+        return newRoot
+
+    def _rotateLeft(self, node: AVLNode) -> AVLNode:
+        newRoot = node.right
+        node.right = newRoot.left
+        newRoot.left = node
+        self._updateHeight(node)
+        self._updateHeight(newRoot)
+        return newRoot
+
+    # Restores the balance of node after one of its sub trees changed
+    # Returns the new root of this sub tree
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        self._updateHeight(node)
+        balance = self._height(node.left) - self._height(node.right)
+
+        # Case 1: Left side is too high
+        if (balance > 1):
+            # Left-Right shape, turn it into Left-Left first
+            if (self._height(node.left.left) < self._height(node.left.right)):
+                node.left = self._rotateLeft(node.left)
+            return self._rotateRight(node)
+
+        # Case 2: Right side is too high
+        if (balance < -1):
+            # Right-Left shape, turn it into Right-Right first
+            if (self._height(node.right.right) < self._height(node.right.left)):
+                node.right = self._rotateRight(node.right)
+            return self._rotateLeft(node)
+
+        # Case 3: Balanced
+        return node
+
+    # Adds the key, Time complexity O(log n)
+    # Returns False when the key was already present
+    def insert(self, key) -> bool:
+        countBefore = self.count
+        self.root = self._insert(self.root, key)
+        return self.count != countBefore
+
+    def _insert(self, node: AVLNode, key) -> AVLNode:
+        # Termination: empty spot found
+        if (node is None):
+            self.count = self.count + 1
+            return self.nodeClass(key)
+
+        # D & C: go to the side where the key belongs
+        if (key < node.key):
+            node.left = self._insert(node.left, key)
+        elif (key > node.key):
+            node.right = self._insert(node.right, key)
+        else:
+            return node
+
+        # Work: fix the balance on the way back up
+        return self._rebalance(node)
+
+    # Removes the key, Time complexity O(log n)
+    # Returns False when the key was not present
+    def delete(self, key) -> bool:
+        countBefore = self.count
+        self.root = self._delete(self.root, key)
+        return self.count != countBefore
+
+    def _delete(self, node: AVLNode, key) -> AVLNode:
+        if (node is None):
+            return None
+
+        if (key < node.key):
+            node.left = self._delete(node.left, key)
+        elif (key > node.key):
+            node.right = self._delete(node.right, key)
+        else:
+            # Case 1: At most one child, the child takes the place of the node
+            if (node.left is None or node.right is None):
+                self.count = self.count - 1
+                return node.left if (node.left is not None) else node.right
+
+            # Case 2: Two children, the smallest key of the right sub tree
+            # (the successor) moves here and is deleted from the right
+            successor = node.right
+            while (successor.left is not None):
+                successor = successor.left
+            node.key = successor.key
+            node.right = self._delete(node.right, successor.key)
+
+        return self._rebalance(node)
+
+    # Time complexity O(log n), only one path from the root is visited
+    def search(self, key) -> bool:
+        currentNode = self.root
+        while (currentNode is not None):
+            if (key < currentNode.key):
+                currentNode = currentNode.left
+            elif (key > currentNode.key):
+                currentNode = currentNode.right
+            else:
+                return True
+        return False
+
+    # Largest key <= key, None when there is none
+    def floor(self, key):
+        result = None
+        currentNode = self.root
+        while (currentNode is not None):
+            if (key < currentNode.key):
+                currentNode = currentNode.left
+            else:
+                # Candidate, a bigger one can only be on the right
+                result = currentNode.key
+                if (key == currentNode.key):
+                    break
+                currentNode = currentNode.right
+        return result
+
+    # Smallest key >= key, None when there is none
+    def ceiling(self, key):
+        result = None
+        currentNode = self.root
+        while (currentNode is not None):
+            if (key > currentNode.key):
+                currentNode = currentNode.right
+            else:
+                # Candidate, a smaller one can only be on the left
+                result = currentNode.key
+                if (key == currentNode.key):
+                    break
+                currentNode = currentNode.left
+        return result
+
+    # Yields the keys low <= key <= high in sorted order, None means no bound
+    # In-order walk with an explicit stack which skips the sub trees outside
+    # the range, Time complexity O(log n + number of keys yielded)
+    def iterateRange(self, low = None, high = None):
+        stack = []
+        currentNode = self.root
+
+        while (stack or currentNode is not None):
+            # Go left, but only while the keys there can still be >= low
+            while (currentNode is not None):
+                if (low is not None and currentNode.key < low):
+                    currentNode = currentNode.right
+                else:
+                    stack.append(currentNode)
+                    currentNode = currentNode.left
+
+            if (not stack):
+                return
+            currentNode = stack.pop()
+            if (high is not None and currentNode.key > high):
+                return
+            yield currentNode.key
+            currentNode = currentNode.right
+
+    # Replaces the content with the keys of a sorted sequence in O(n)
+    # The middle key becomes the root, the halves become the sub trees, so
+    # the tree is perfectly balanced without a single rotation.
+    def bulkLoad(self, sortedKeys):
+        keys = list(sortedKeys)
+        for index in range(1, len(keys)):
+            if (not keys[index - 1] < keys[index]):
+                raise ValueError("bulkLoad needs strictly increasing keys")
+
+        self.root = self._build(keys, 0, len(keys) - 1)
+        self.count = len(keys)
+
+    def _build(self, keys: list, first: int, last: int) -> AVLNode:
+        if (first > last):
+            return None
+
+        middle = (first + last) // 2
+        node = self.nodeClass(keys[middle])
+        node.left = self._build(keys, first, middle - 1)
+        node.right = self._build(keys, middle + 1, last)
+        self._updateHeight(node)
+        return node
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def avlTreeTest():
+    tree = AVLTree()
+    for key in (50, 20, 70, 10, 30, 60, 80, 25):
+        tree.insert(key)
+    print(f"Keys = {list(tree)}, height = {tree.root.height}")
+    print(f"Search 30 = {tree.search(30)}, search 35 = {tree.search(35)}")
+    print(f"Floor 35 = {tree.floor(35)}, ceiling 35 = {tree.ceiling(35)}")
+    print(f"Keys in [20, 60] = {list(tree.iterateRange(20, 60))}")
+
+    tree.delete(20)
+    tree.delete(50)
+    print(f"After deleting 20 and 50 = {list(tree)}, height = {tree.root.height}")
+
+    # Inserting sorted keys one by one would make a chain without balancing
+    tree = AVLTree()
+    for key in range(1, 1025):
+        tree.insert(key)
+    print(f"1024 sorted inserts, height = {tree.root.height}")
+
+# AVLTree versus bisect on a sorted list with keyCount keys
+def bisectBenchmark(keyCount: int = 1_000_000, operations: int = 100_000):
+    keys = list(range(0, 2 * keyCount, 2))
+    probes = [random.randrange(2 * keyCount) for _ in range(operations)]
+    newKeys = random.sample(range(1, 2 * keyCount, 2), operations)
+
+    tree = AVLTree()
+    sortedList = []
+
+    def bulkLoadTree():
+        tree.bulkLoad(keys)
+
+    def bulkLoadList():
+        sortedList.extend(keys)
+
+    def searchTree():
+        for key in probes:
+            tree.search(key)
+
+    def searchList():
+        for key in probes:
+            index = bisect.bisect_left(sortedList, key)
+            index < len(sortedList) and sortedList[index] == key
+
+    def floorTree():
+        for key in probes:
+            tree.floor(key)
+
+    def floorList():
+        for key in probes:
+            index = bisect.bisect_right(sortedList, key)
+            sortedList[index - 1] if (index > 0) else None
+
+    def rangeTree():
+        for key in probes[:10_000]:
+            for _ in tree.iterateRange(key, key + 200):
+                pass
+
+    def rangeList():
+        for key in probes[:10_000]:
+            for _ in sortedList[bisect.bisect_left(sortedList, key):bisect.bisect_right(sortedList, key + 200)]:
+                pass
+
+    def insertTree():
+        for key in newKeys:
+            tree.insert(key)
+
+    def insertList():
+        for key in newKeys:
+            bisect.insort(sortedList, key)
+
+    def deleteTree():
+        for key in newKeys:
+            tree.delete(key)
+
+    def deleteList():
+        for key in newKeys:
+            del sortedList[bisect.bisect_left(sortedList, key)]
+
+    workloads = [
+        ("bulk load", bulkLoadTree, bulkLoadList),
+        ("search", searchTree, searchList),
+        ("floor", floorTree, floorList),
+        ("range of 100", rangeTree, rangeList),
+        ("insert", insertTree, insertList),
+        ("delete", deleteTree, deleteList),
+    ]
+
+    print(f"{keyCount} keys, {operations} operations per workload (10_000 for range)")
+    print(f"{'workload':>14} {'AVLTree (s)':>12} {'bisect (s)':>11}")
+    for name, treeRun, listRun in workloads:
+        start = time.perf_counter()
+        treeRun()
+        treeTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        listRun()
+        listTime = time.perf_counter() - start
+        print(f"{name:>14} {treeTime:>12.3f} {listTime:>11.3f}")
+
+
+if __name__ == "__main__":
+    avlTreeTest()
+
+    #bisectBenchmark()
@@ -0,0 +1,218 @@
+import time
+import tracemalloc
+
+from Trees import Node, Trees, TreeStats
+
+# NumPy is optional for the rest of the repository, ArrayTree needs it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# No child
+NONE = -1
+
+# Binary tree stored in three NumPy arrays instead of one object per node
+#
+#   index :   0   1   2   3   4        tree:      1
+#   data  : [ 1,  2,  3,  4,  5]                /   \
+#   left  : [ 1,  3, -1, -1, -1]               2     3
+#   right : [ 2,  4, -1, -1, -1]              / \
+#                                            4   5
+#
+# A node is an index, its children are left[index] / right[index] (NONE when
+# missing). data is int64 and left / right are int32 (int64 above 2^31
+# nodes), 16 bytes per node instead of a Node object with its attribute dict.
+#
+# The converters number the nodes in level order, so every level is one
+# contiguous slice (levelStarts) and the aggregates are NumPy reductions
+# over one slice per level. Arrays built some other way are walked level by
+# level with vectorized child lookups instead.
+class ArrayTree:
+
+    def __init__(self, data, left, right, root: int = 0, levelStarts = None):
+        if (not NUMPY_AVAILABLE):
+            raise ImportError("ArrayTree needs NumPy")
+
+        self.data = np.asarray(data)
+        indexType = np.int32 if (len(self.data) < 2 ** 31) else np.int64
+        self.left = np.asarray(left, dtype = indexType)
+        self.right = np.asarray(right, dtype = indexType)
+        self.root = root if (len(self.data) > 0) else NONE
+        self.levelStarts = levelStarts
+
+    # Number of nodes, Time complexity O(1)
+    def __len__(self):
+        return len(self.data)
+
+    # Bytes used by the three arrays
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.left.nbytes + self.right.nbytes
+
+    # Implicit heap layout of a complete tree: the children of i are
+    # 2i + 1 and 2i + 2, computed for all nodes at once
+    @classmethod
+    def fromCompleteValues(cls, values, dtype = np.int64 if NUMPY_AVAILABLE else None) -> "ArrayTree":
+        data = np.asarray(values, dtype = dtype)
+        count = len(data)
+        indexes = np.arange(count, dtype = np.int64)
+        left = np.where(2 * indexes + 1 < count, 2 * indexes + 1, NONE)
+        right = np.where(2 * indexes + 2 < count, 2 * indexes + 2, NONE)
+
+        # Level h holds the indexes 2^h - 1 ... 2^(h+1) - 2
+        levelStarts = [0]
+        while (levelStarts[-1] < count):
+            levelStarts.append(min(2 * levelStarts[-1] + 1, count))
+        return cls(data, left, right, 0, levelStarts)
+
+    # Converts a linked Node tree, the nodes are numbered in level order
+    @classmethod
+    def fromNodes(cls, root: Node, dtype = np.int64 if NUMPY_AVAILABLE else None) -> "ArrayTree":
+        data = []
+        left = []
+        right = []
+        levelStarts = [0]
+
+        level = [root] if (root is not None) else []
+        while (level):
+            nextLevel = []
+            for currentNode in level:
+                data.append(currentNode.data)
+                # The children get the next free numbers of the next level
+                if (currentNode.left is not None):
+                    left.append(levelStarts[-1] + len(level) + len(nextLevel))
+                    nextLevel.append(currentNode.left)
+                else:
+                    left.append(NONE)
+                if (currentNode.right is not None):
+                    right.append(levelStarts[-1] + len(level) + len(nextLevel))
+                    nextLevel.append(currentNode.right)
+                else:
+                    right.append(NONE)
+            levelStarts.append(levelStarts[-1] + len(level))
+            level = nextLevel
+
+        return cls(np.array(data, dtype = dtype), left, right, 0, levelStarts)
+
+    # Converts back to a linked Node tree and returns its root
+    def toNodes(self) -> Node:
+        if (self.root == NONE):
+            return None
+
+        nodes = [Node(value) for value in self.data.tolist()]
+        for currentNode, leftIndex, rightIndex in zip(nodes, self.left.tolist(), self.right.tolist()):
+            if (leftIndex != NONE):
+                currentNode.left = nodes[leftIndex]
+            if (rightIndex != NONE):
+                currentNode.right = nodes[rightIndex]
+        return nodes[self.root]
+
+    # Yields the nodes of each level: a slice when the nodes are numbered in
+    # level order, otherwise an index array built from the previous level
+    def levels(self):
+        if (self.levelStarts is not None):
+            for first, last in zip(self.levelStarts, self.levelStarts[1:]):
+                yield slice(first, last)
+            return
+
+        level = np.array([self.root] if (self.root != NONE) else [], dtype = self.left.dtype)
+        while (level.size > 0):
+            yield level
+            children = np.concatenate((self.left[level], self.right[level]))
+            level = children[children != NONE]
+
+    # Same result as Trees.GetStats, all aggregates in one level by level
+    # pass with one vectorized reduction per level and aggregate
+    def getStats(self) -> TreeStats:
+        stats = TreeStats()
+        stats.count = 0
+        stats.sum = 0
+        stats.height = 0
+        stats.leafCount = 0
+        stats.leafSum = 0
+
+        for level in self.levels():
+            values = self.data[level]
+            isLeaf = (self.left[level] == NONE) & (self.right[level] == NONE)
+            leafValues = values[isLeaf]
+
+            stats.height = stats.height + 1
+            stats.count = stats.count + len(values)
+            stats.sum = stats.sum + int(values.sum())
+            levelMin = values.min().item()
+            levelMax = values.max().item()
+            stats.min = levelMin if (stats.min is None or levelMin < stats.min) else stats.min
+            stats.max = levelMax if (stats.max is None or levelMax > stats.max) else stats.max
+
+            if (leafValues.size > 0):
+                stats.leafCount = stats.leafCount + len(leafValues)
+                stats.leafSum = stats.leafSum + int(leafValues.sum())
+                levelLeafMax = leafValues.max().item()
+                if (stats.leafMax is None or levelLeafMax > stats.leafMax):
+                    stats.leafMax = levelLeafMax
+        return stats
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def arrayTreeTest():
+    if (not NUMPY_AVAILABLE):
+        print("NumPy is not installed, ArrayTree is not available")
+        return
+
+    tree = Trees()
+    tree.createBinaryTree()
+    arrayTree = ArrayTree.fromNodes(tree.root)
+    print(f"data = {arrayTree.data}, left = {arrayTree.left}, right = {arrayTree.right}")
+    print(f"Stats = {arrayTree.getStats()}")
+
+    root = arrayTree.toNodes()
+    print(f"Back to nodes, pre-order = {[node.data for node in tree.GetNodesPreOrder(root)]}")
+
+    heap = ArrayTree.fromCompleteValues(range(1, 11))
+    print(f"Complete tree of 10 values, stats = {heap.getStats()}")
+
+# Memory and GetStats time of a Node tree versus an ArrayTree, both complete
+# trees of nodeCount random values. 50M nodes need tens of GB as Node objects
+# but under 1 GB as arrays.
+def memoryBenchmark(nodeCount: int = 1_000_000):
+    if (not NUMPY_AVAILABLE):
+        print("NumPy is not installed, ArrayTree is not available")
+        return
+
+    values = np.random.randint(0, 1_000_000, nodeCount)
+
+    tracemalloc.start()
+    tree = Trees()
+    tree.createCompleteBinaryTree(values.tolist())
+    nodeBytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    tree.GetStats(tree.root)
+    nodeTime = time.perf_counter() - start
+
+    arrayTree = ArrayTree.fromCompleteValues(values)
+    start = time.perf_counter()
+    arrayTree.getStats()
+    arrayTime = time.perf_counter() - start
+
+    # Same tree without the level slices, walked with index arrays
+    walkedTree = ArrayTree(arrayTree.data, arrayTree.left, arrayTree.right)
+    start = time.perf_counter()
+    walkedTree.getStats()
+    walkedTime = time.perf_counter() - start
+
+    print(f"{nodeCount} nodes")
+    print(f"{'representation':>22} {'memory (MB)':>12} {'getStats (s)':>13}")
+    print(f"{'Node objects':>22} {nodeBytes / 2 ** 20:>12.1f} {nodeTime:>13.4f}")
+    print(f"{'ArrayTree (slices)':>22} {arrayTree.nbytes() / 2 ** 20:>12.1f} {arrayTime:>13.4f}")
+    print(f"{'ArrayTree (walked)':>22} {walkedTree.nbytes() / 2 ** 20:>12.1f} {walkedTime:>13.4f}")
+
+
+if __name__ == "__main__":
+    arrayTreeTest()
+
+    #memoryBenchmark()
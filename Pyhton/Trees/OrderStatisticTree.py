@@ -0,0 +1,170 @@
+import bisect
+import random
+import time
+
+from AVLTree import AVLNode, AVLTree
+
+# AVL node which also caches the number of keys and the sum of the keys in
+# its sub tree (itself included)
+class OrderStatisticNode(AVLNode):
+    __slots__ = ("size", "total")
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.size = 1
+        self.total = key
+
+# AVL tree augmented with sub tree sizes and sums
+#
+#                      (40) size 5, total 200
+#                     /    \
+#   (20) size 2, total 30   (60) size 2, total 130
+#   /                           \
+# (10) size 1, total 10         (70) size 1, total 70
+#
+# size and total of a node only depend on its own key and its two children,
+# so they are recomputed wherever the height is (_updateHeight): on the way
+# back up after insert / delete and for both nodes of every rotation. With
+# them select, rank and rangeSum follow one root to leaf path, O(log n).
+class OrderStatisticTree(AVLTree):
+
+    nodeClass = OrderStatisticNode
+
+    def _updateHeight(self, node: OrderStatisticNode):
+        left = node.left
+        right = node.right
+        height = 0
+        size = 1
+        total = node.key
+        if (left is not None):
+            height = left.height
+            size = size + left.size
+            total = total + left.total
+        if (right is not None):
+            if (right.height > height):
+                height = right.height
+            size = size + right.size
+            total = total + right.total
+        node.height = height + 1
+        node.size = size
+        node.total = total
+
+    # k-th smallest key, k = 1 is the smallest, None when k is out of range
+    def select(self, k: int):
+        if (k < 1 or k > self.count):
+            return None
+
+        currentNode = self.root
+        while (currentNode is not None):
+            leftSize = currentNode.left.size if (currentNode.left is not None) else 0
+            # Case 1: The key is in the left sub tree
+            if (k <= leftSize):
+                currentNode = currentNode.left
+            # Case 2: This node is the k-th key
+            elif (k == leftSize + 1):
+                return currentNode.key
+            # Case 3: Skip the left sub tree and this node
+            else:
+                k = k - leftSize - 1
+                currentNode = currentNode.right
+        return None
+
+    # Number of keys <= key, so select(rank(key)) == key for a present key
+    def rank(self, key) -> int:
+        count, _ = self._prefix(key, True)
+        return count
+
+    # Returns (number, sum) of the keys < key, or <= key when inclusive
+    def _prefix(self, key, inclusive: bool):
+        count = 0
+        total = 0
+        currentNode = self.root
+        while (currentNode is not None):
+            if (currentNode.key < key or (inclusive and currentNode.key == key)):
+                # This node and its whole left sub tree are included
+                if (currentNode.left is not None):
+                    count = count + currentNode.left.size
+                    total = total + currentNode.left.total
+                count = count + 1
+                total = total + currentNode.key
+                currentNode = currentNode.right
+            else:
+                currentNode = currentNode.left
+        return count, total
+
+    # Sum of the keys low <= key <= high, Time complexity O(log n)
+    def rangeSum(self, low, high):
+        if (high < low):
+            return 0
+        _, upTo = self._prefix(high, True)
+        _, below = self._prefix(low, False)
+        return upTo - below
+
+    # Number of keys low <= key <= high, Time complexity O(log n)
+    def rangeCount(self, low, high) -> int:
+        if (high < low):
+            return 0
+        upTo, _ = self._prefix(high, True)
+        below, _ = self._prefix(low, False)
+        return upTo - below
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def orderStatisticTest():
+    tree = OrderStatisticTree()
+    for key in (50, 20, 70, 10, 30, 60, 80):
+        tree.insert(key)
+    print(f"Keys = {list(tree)}")
+    print(f"3rd smallest = {tree.select(3)}, rank of 60 = {tree.rank(60)}, rank of 55 = {tree.rank(55)}")
+    print(f"Sum over [20, 60] = {tree.rangeSum(20, 60)}, count = {tree.rangeCount(20, 60)}")
+
+    tree.delete(30)
+    tree.insert(35)
+    print(f"After delete 30, insert 35: 3rd smallest = {tree.select(3)}, sum over [20, 60] = {tree.rangeSum(20, 60)}")
+
+# Mixed workload on changing data: every round inserts one key, deletes one
+# key and asks select, rank and rangeSum. The sorted list answers with
+# bisect, but has to memmove on insert / delete and sum the range slice.
+def dashboardBenchmark(keyCount: int = 100_000, rounds: int = 10_000, rangeWidth: int = 20_000):
+    keys = random.sample(range(10 * keyCount), keyCount)
+    sortedKeys = sorted(keys)
+    operations = [(random.randrange(10 * keyCount), random.randrange(10 * keyCount),
+                   random.randrange(1, keyCount // 2), random.randrange(10 * keyCount)) for _ in range(rounds)]
+
+    tree = OrderStatisticTree()
+    tree.bulkLoad(sortedKeys)
+    start = time.perf_counter()
+    for insertKey, deleteKey, k, low in operations:
+        tree.insert(insertKey)
+        tree.delete(deleteKey)
+        tree.select(k)
+        tree.rank(low)
+        tree.rangeSum(low, low + rangeWidth)
+    treeTime = time.perf_counter() - start
+
+    sortedList = list(sortedKeys)
+    start = time.perf_counter()
+    for insertKey, deleteKey, k, low in operations:
+        index = bisect.bisect_left(sortedList, insertKey)
+        if (index == len(sortedList) or sortedList[index] != insertKey):
+            sortedList.insert(index, insertKey)
+        index = bisect.bisect_left(sortedList, deleteKey)
+        if (index < len(sortedList) and sortedList[index] == deleteKey):
+            del sortedList[index]
+        sortedList[k - 1]
+        bisect.bisect_right(sortedList, low)
+        sum(sortedList[bisect.bisect_left(sortedList, low):bisect.bisect_right(sortedList, low + rangeWidth)])
+    listTime = time.perf_counter() - start
+
+    print(f"{keyCount} keys, {rounds} rounds, ranges of width {rangeWidth}")
+    print(f"{'structure':>20} {'time (s)':>9}")
+    print(f"{'OrderStatisticTree':>20} {treeTime:>9.3f}")
+    print(f"{'sorted list':>20} {listTime:>9.3f}")
+
+
+if __name__ == "__main__":
+    orderStatisticTest()
+
+    #dashboardBenchmark()
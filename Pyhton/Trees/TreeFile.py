@@ -0,0 +1,305 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+from array import array
+
+from Trees import Node, Trees
+
+# Binary file format for trees, read through mmap
+#
+#   [ header | structure bitmap | padding | values ]
+#
+# The structure is the pre-order walk with one bit per position: 1 for a
+# node, 0 for a missing child. n nodes take 2n + 1 bits:
+#
+#        1           pre-order positions : 1  2  4  -  -  5  -  -  3  -  -
+#       / \          bitmap              : 1  1  1  0  0  1  0  0  1  0  0
+#      2   3         values (pre-order)  : 1  2  4  5  3
+#     / \
+#    4   5
+#
+# values is a packed array (typecode 'q' = 64 bit int by default) in
+# pre-order, aligned to 8 bytes so it can be used as a memoryview of the
+# mapped file directly. The file is written in the native byte order.
+#
+# Opening the file maps it and reads the header only, whatever its size.
+# Nothing is turned into Node objects: pre-order traversal and search read
+# the values, in-order / post-order walk the bitmap with a stack of O(height).
+
+MAGIC = b"BTRE"
+# magic, version, typecode, node count, bitmap bytes
+HEADER = struct.Struct("<4sBcQQ")
+HEADER_SIZE = 32
+
+# bits of a byte, most significant first, so a bitmap is read byte by byte
+BYTE_BITS = [tuple((byte >> (7 - bit)) & 1 for bit in range(8)) for byte in range(256)]
+
+# Writes the tree below root to path, returns the number of nodes
+def saveTree(root: Node, path: str, typecode: str = "q") -> int:
+    bitmap = bytearray()
+    currentByte = 0
+    bitCount = 0
+    values = array(typecode)
+
+    # Pre-order with an explicit stack, None marks a missing child
+    stack = [root]
+    while (stack):
+        currentNode = stack.pop()
+        currentByte = currentByte << 1
+        if (currentNode is not None):
+            currentByte = currentByte | 1
+            values.append(currentNode.data)
+            stack.append(currentNode.right)
+            stack.append(currentNode.left)
+
+        bitCount = bitCount + 1
+        if (bitCount % 8 == 0):
+            bitmap.append(currentByte)
+            currentByte = 0
+
+    # Last partial byte, filled up with zeros on the right
+    if (bitCount % 8 != 0):
+        bitmap.append(currentByte << (8 - bitCount % 8))
+
+    padding = -(HEADER_SIZE + len(bitmap)) % 8
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, 1, typecode.encode(), len(values), len(bitmap)).ljust(HEADER_SIZE, b"\0"))
+        file.write(bitmap)
+        file.write(bytes(padding))
+        values.tofile(file)
+    return len(values)
+
+# Tree file opened with mmap, nothing is read until it is used
+class MappedTree:
+
+    def __init__(self, path: str):
+        self.file = open(path, "rb")
+        self.map = None
+
+        # An empty, truncated or foreign file closes what was opened
+        try:
+            # mmap raises ValueError for an empty file
+            self.map = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+
+            magic, _, typecode, self.count, bitmapBytes = HEADER.unpack_from(self.map)
+            if (magic != MAGIC):
+                raise ValueError("wrong magic")
+
+            self.typecode = typecode.decode()
+            self.itemSize = struct.calcsize(self.typecode)
+            self.valuesOffset = HEADER_SIZE + bitmapBytes + (-(HEADER_SIZE + bitmapBytes) % 8)
+
+            # The bitmap needs 2n + 1 bits and the values n items
+            if (8 * bitmapBytes < 2 * self.count + 1 or
+                    len(self.map) < self.valuesOffset + self.count * self.itemSize):
+                raise ValueError("file is truncated")
+
+            # raw is released when the block ends, also when the cast fails,
+            # otherwise it would keep the map from being closed
+            with memoryview(self.map) as raw:
+                self.bitmap = raw[HEADER_SIZE:HEADER_SIZE + bitmapBytes]
+                self.values = raw[self.valuesOffset:self.valuesOffset + self.count * self.itemSize].cast(self.typecode)
+        except Exception as error:
+            self.close()
+            raise ValueError(f"{path} is not a tree file") from error
+
+    # Number of nodes, Time complexity O(1)
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    # The memoryviews have to be released before the map can be closed
+    def close(self):
+        if (hasattr(self, "values")):
+            self.values.release()
+        if (hasattr(self, "bitmap")):
+            self.bitmap.release()
+        if (self.map is not None):
+            self.map.close()
+        self.file.close()
+
+    # Returns True when a node holds the key, O(n) like Trees.Search
+    # The packed key is searched in the mapped bytes (mmap.find runs in C),
+    # a hit which is not aligned to a value is skipped. The key is first
+    # converted to the stored type (2.0 finds 2 in an integer file), keys
+    # which can not be packed that way are compared value by value.
+    def search(self, key) -> bool:
+        try:
+            if (self.typecode in "fd"):
+                key = float(key)
+                # NaN equals nothing, 0.0 and -0.0 are equal with other bytes
+                if (key != key):
+                    return False
+                if (key == 0):
+                    return key in self.values
+            else:
+                if (key != int(key)):
+                    return False
+                key = int(key)
+        except (TypeError, ValueError, OverflowError):
+            return key in self.values
+
+        try:
+            pattern = struct.pack(self.typecode, key)
+        except (struct.error, OverflowError):
+            # Out of the range of the stored type
+            return False
+
+        end = self.valuesOffset + self.count * self.itemSize
+        position = self.map.find(pattern, self.valuesOffset, end)
+        while (position != -1):
+            if ((position - self.valuesOffset) % self.itemSize == 0):
+                return True
+            position = self.map.find(pattern, position + 1, end)
+        return False
+
+    # Values in pre-order, they are stored in that order
+    def preOrder(self):
+        return iter(self.values)
+
+    # Yields ("inorder", value) when the left sub tree of a node is done
+    # (its in-order position) and ("postorder", value) when its right sub
+    # tree is done (its post-order position).
+    # A stack entry is [value, number of finished sub trees].
+    def _events(self):
+        stack = []
+        nextValue = 0
+        values = self.values
+        remaining = 2 * self.count + 1
+
+        for byte in self.bitmap:
+            for bit in BYTE_BITS[byte]:
+                if (remaining == 0):
+                    return
+                remaining = remaining - 1
+
+                # Case 1: A node starts, its left sub tree comes next
+                if (bit):
+                    stack.append([values[nextValue], 0])
+                    nextValue = nextValue + 1
+                    continue
+
+                # Case 2: A missing child, the sub tree of the top entry is
+                # finished. A node whose right sub tree finished is itself
+                # finished, which can finish its parent too, and so on.
+                while (stack):
+                    top = stack[-1]
+                    top[1] = top[1] + 1
+                    if (top[1] == 1):
+                        yield "inorder", top[0]
+                        break
+                    stack.pop()
+                    yield "postorder", top[0]
+
+    def inOrder(self):
+        for kind, value in self._events():
+            if (kind == "inorder"):
+                yield value
+
+    def postOrder(self):
+        for kind, value in self._events():
+            if (kind == "postorder"):
+                yield value
+
+    # Builds the linked Node tree, only needed to change the tree
+    def toNodes(self) -> Node:
+        root = None
+        stack = []
+        values = self.values
+        nextValue = 0
+        remaining = 2 * self.count + 1
+
+        # A stack entry is [node, number of children positions seen]
+        for byte in self.bitmap:
+            for bit in BYTE_BITS[byte]:
+                if (remaining == 0):
+                    return root
+                remaining = remaining - 1
+
+                newNode = None
+                if (bit):
+                    newNode = Node(values[nextValue])
+                    nextValue = nextValue + 1
+
+                if (stack):
+                    parent = stack[-1]
+                    if (parent[1] == 0):
+                        parent[0].left = newNode
+                    else:
+                        parent[0].right = newNode
+                    parent[1] = parent[1] + 1
+                    if (parent[1] == 2):
+                        stack.pop()
+                elif (root is None):
+                    root = newNode
+
+                if (newNode is not None):
+                    stack.append([newNode, 0])
+        return root
+
+
+### This code is outside the class
+# Driver code and benchmark
+
+def treeFileTest():
+    tree = Trees()
+    tree.createBinaryTree()
+    path = os.path.join(tempfile.mkdtemp(), "tree.bin")
+    saveTree(tree.root, path)
+    print(f"Saved {os.path.getsize(path)} bytes")
+
+    mapped = MappedTree(path)
+    print(f"Nodes = {len(mapped)}, search 5 = {mapped.search(5)}, search 100 = {100 in mapped}")
+    print(f"Pre-order  = {list(mapped.preOrder())}")
+    print(f"In-order   = {list(mapped.inOrder())}")
+    print(f"Post-order = {list(mapped.postOrder())}")
+    print(f"Rebuilt nodes in-order = {[node.data for node in tree.GetNodesInOrder(mapped.toNodes())]}")
+    mapped.close()
+    os.remove(path)
+
+# Startup cost of a nodeCount tree: rebuilding Node objects (from values,
+# from pickle) versus mapping the tree file, then one search that misses
+def startupBenchmark(nodeCount: int = 1_000_000):
+    tree = Trees()
+    tree.createCompleteBinaryTree(range(nodeCount))
+    directory = tempfile.mkdtemp()
+    treePath = os.path.join(directory, "tree.bin")
+    picklePath = os.path.join(directory, "tree.pickle")
+    saveTree(tree.root, treePath)
+    with open(picklePath, "wb") as file:
+        pickle.dump(list(range(nodeCount)), file)
+
+    print(f"{nodeCount} nodes, tree file {os.path.getsize(treePath) / 2 ** 20:.1f} MB")
+    print(f"{'startup':>22} {'open (s)':>10} {'search (s)':>11}")
+
+    start = time.perf_counter()
+    with open(picklePath, "rb") as file:
+        rebuilt = Trees()
+        rebuilt.createCompleteBinaryTree(pickle.load(file))
+    openTime = time.perf_counter() - start
+    start = time.perf_counter()
+    rebuilt.Search(rebuilt.root, -1)
+    print(f"{'pickle + Node objects':>22} {openTime:>10.4f} {time.perf_counter() - start:>11.4f}")
+
+    start = time.perf_counter()
+    mapped = MappedTree(treePath)
+    openTime = time.perf_counter() - start
+    start = time.perf_counter()
+    mapped.search(-1)
+    print(f"{'mmap tree file':>22} {openTime:>10.4f} {time.perf_counter() - start:>11.4f}")
+    mapped.close()
+
+    for path in (treePath, picklePath):
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    treeFileTest()
+
+    #startupBenchmark()
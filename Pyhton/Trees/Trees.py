@@ -1,4 +1,7 @@
+import random
+import time
 from collections import deque
+from operator import attrgetter
 
 class Node:
     def __init__(self, data: int):
@@ -6,6 +9,24 @@ class Node:
         self.left = None
         self.right = None
 
+# getData(node) returns node.data, used with map() in the aggregates
+getData = attrgetter("data")
+
+# Names of the aggregates GetStats can compute
+AGGREGATES = ("count", "sum", "min", "max", "height", "leafCount", "leafSum", "leafMax")
+
+# Result of GetStats, aggregates which were not requested stay None
+class TreeStats:
+    __slots__ = AGGREGATES
+
+    def __init__(self):
+        for name in AGGREGATES:
+            setattr(self, name, None)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)}" for name in AGGREGATES if getattr(self, name) != None)
+        return f"TreeStats({values})"
+
 class Trees:
 
     def __init__(self):
@@ -25,233 +46,224 @@ class Trees:
         self.root.right.left = Node(6)
         self.root.right.right = Node (7)
 
-    # Display the tree nodes in Pre-order 
-    def printBinaryTree(self, node: Node): # 1: function parameters
-        
-        # 2 Loop termination condition
-        if (node == None):
-            print(" None ")    
+    # Traversal generators
+    # They yield the nodes one at a time with an explicit stack instead of
+    # recursion, so trees of any depth work and the caller can stop early
+    # (e.g. Search). The DFS stacks hold at most O(height) nodes.
+    #
+    #        1
+    #      /   \          Pre-order   : 1 2 4 5 3 6 7   (node, left, right)
+    #     2     3         In-order    : 4 2 5 1 6 3 7   (left, node, right)
+    #    / \   / \        Post-order  : 4 5 2 6 7 3 1   (left, right, node)
+    #   4   5 6   7       Level-order : 1 2 3 4 5 6 7   (level by level)
+
+    # The loops use "is not None" and local names for stack.append / pop,
+    # they run once per node and this keeps them as fast as the recursion.
+    def GetNodesPreOrder(self, node: Node):
+        if (node is None):
             return
-        
-        # 3 Work
-        print(f" {node.data} ")
-
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        self.printBinaryTree(node.left)
 
-        # Recursively visit the right sub tree
-        self.printBinaryTree(node.right)
-
-        # 5 return nothing
+        stack = [node]
+        push = stack.append
+        pop = stack.pop
+        while (stack):
+            currentNode = pop()
+            yield currentNode
+
+            # Right is pushed first, so left is visited first
+            if (currentNode.right is not None):
+                push(currentNode.right)
+            if (currentNode.left is not None):
+                push(currentNode.left)
+
+    # Pre-order which also yields the depth of every node (root = 1), the
+    # depth is kept next to each node on the stack
+    def GetNodesPreOrderWithDepth(self, node: Node):
+        if (node is None):
+            return
 
- # Display the tree nodes in Pre-order 
-    def CountNodes(self, node: Node)-> int: # 1: function parameters
-        
-        # 2 Loop termination condition
-        if (node == None):
-            print(" None ")    
-            return 0
-        
-       
-        print(f" {node.data} ")
+        stack = [(node, 1)]
+        push = stack.append
+        pop = stack.pop
+        while (stack):
+            currentNode, depth = pop()
+            yield currentNode, depth
+
+            if (currentNode.right is not None):
+                push((currentNode.right, depth + 1))
+            if (currentNode.left is not None):
+                push((currentNode.left, depth + 1))
+
+    def GetNodesInOrder(self, node: Node):
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        currentNode = node
 
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        leftCount = self.CountNodes(node.left)
+        while (stack or currentNode is not None):
+            # Go down to the left most node which is not visited yet
+            while (currentNode is not None):
+                push(currentNode)
+                currentNode = currentNode.left
 
-        # Recursively visit the right sub tree
-        rightCount = self.CountNodes(node.right)
+            currentNode = pop()
+            yield currentNode
+            currentNode = currentNode.right
 
-         # 3 Work
-        TotalCount = leftCount + rightCount + 1
-        return TotalCount  # return 
-    
-        # return (1+ leftCount(node.left) + rightCount(node.right))
+    def GetNodesPostOrder(self, node: Node):
+        stack = []
+        push = stack.append
+        currentNode = node
+        lastVisited = None
+
+        while (stack or currentNode is not None):
+            while (currentNode is not None):
+                push(currentNode)
+                currentNode = currentNode.left
+
+            topNode = stack[-1]
+            # Case 1: Right sub tree exists and is not visited yet
+            if (topNode.right is not None and topNode.right is not lastVisited):
+                currentNode = topNode.right
+            # Case 2: Both sub trees are done, visit the node
+            else:
+                lastVisited = stack.pop()
+                yield lastVisited
+
+    # Uses a queue which holds up to one level (O(width)) of nodes
+    def GetNodesLevelOrder(self, node: Node):
+        if (node is None):
+            return
 
-    def FindMax(self, node: Node)-> int: # 1: function parameters
-        
-        # 2 Loop termination condition
+        queue = deque()
+        queue.append(node)
+        push = queue.append
+        popleft = queue.popleft
+        while (queue):
+            nextNode = popleft()
+            yield nextNode
+
+            if (nextNode.left is not None):
+                push(nextNode.left)
+            if (nextNode.right is not None):
+                push(nextNode.right)
+
+    # Display the tree nodes in Pre-order, None marks a missing child
+    def printBinaryTree(self, node: Node):
+        stack = [node]
+        while (stack):
+            currentNode = stack.pop()
+            if (currentNode == None):
+                print(" None ")
+                continue
+
+            print(f" {currentNode.data} ")
+            stack.append(currentNode.right)
+            stack.append(currentNode.left)
+
+    def CountNodes(self, node: Node)-> int:
+        count = 0
+        for _ in self.GetNodesPreOrder(node):
+            count = count + 1
+        return count
+
+    # Returns 0 for an empty tree
+    def FindMax(self, node: Node)-> int:
         if (node == None):
-            print(" None ")    
             return 0
-        
-       
-        print(f" {node.data} ")
-
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        leftMax = self.FindMax(node.left)
+        return max(map(getData, self.GetNodesPreOrder(node)))
 
-        # Recursively visit the right sub tree
-        rightMax = self.FindMax(node.right)
-
-         # 3 Work
-        maxValue = max(leftMax, rightMax)
-        maxValue = max(maxValue, node.data)
-        return maxValue
-    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-    
-    def FindMin(self, node: Node)-> int: # 1: function parameters
-        
-        # 2 Loop termination condition
+    # Returns 0 for an empty tree
+    def FindMin(self, node: Node)-> int:
         if (node == None):
-            print(" None ")    
             return 0
-        
-       
-        print(f" {node.data} ")
+        return min(map(getData, self.GetNodesPreOrder(node)))
 
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        leftMin = self.FindMin(node.left)
+    def GetSum(self, node: Node)-> int:
+        return sum(map(getData, self.GetNodesPreOrder(node)))
 
-        # Recursively visit the right sub tree
-        leftMin = self.FindMin(node.right)
+    def GetSumOfLeafNodes(self, node: Node)-> int:
+        return sum(currentNode.data for currentNode in self.GetNodesPreOrder(node)
+                   if (currentNode.left == None and currentNode.right == None))
 
-         # 3 Work
-        minValue = min(leftMin, leftMin)
-        minValue = min(minValue, node.data)
-        return minValue
-
-    def GetSum(self, node: Node)-> int: # 1: function parameters
-        
-        # 2 Loop termination condition
+    # Returns 0 for an empty tree
+    def GetLeafNodesMax(self, node: Node)-> int:
         if (node == None):
-            print(" None ")    
             return 0
-        
-       
-        print(f" {node.data} ")
+        return max(currentNode.data for currentNode in self.GetNodesPreOrder(node)
+                   if (currentNode.left == None and currentNode.right == None))
 
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        leftSum = self.GetSum(node.left)
-
-        # Recursively visit the right sub tree
-        rightSum = self.GetSum(node.right)
-
-         # 3 Work
-        totalSum = leftSum + rightSum + node.data
-        return totalSum
-
-    def GetSumOfLeafNodes(self, node: Node)-> int: # 1: function parameters
-       # Edge case Tree is empty
-        if (node == None):
-            return 0
-        
+    # A tree is balanced when at every node the heights of the left and
+    # right sub trees differ by at most 1. Counting the nodes of both sub
+    # trees (as before) visits the whole tree per node, IsHeightBalanced
+    # needs one pass.
+    def IsBinaryTreeBalanced(self, node: Node)-> bool:
+        return self.IsHeightBalanced(node)
+
+    # Height balance check in O(n), stops at the first unbalanced node
+    # iterative = True uses an explicit stack instead of recursion, for
+    # trees deeper than the recursion limit (e.g. a 10^6 node chain)
+    def IsHeightBalanced(self, node: Node, iterative: bool = False) -> bool:
+        if (iterative):
+            return self._isHeightBalancedIterative(node)
+        return self._balancedHeight(node) != -1
+
+    # Returns the height of the sub tree, -1 when it is not balanced
+    def _balancedHeight(self, node: Node) -> int:
         # 2 Loop termination condition
-        if (node.left == None and node.right == None):
-            return node.data
-       
-        print(f" {node.data} ")
-
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        leftSum = self.GetSumOfLeafNodes(node.left)
-
-        # Recursively visit the right sub tree
-        rightSum = self.GetSumOfLeafNodes(node.right)
-
-         # 3 Work        
-        leafNodesSum = leftSum + rightSum         
-        return leafNodesSum
-    
-    def GetLeafNodesMax(self, node: Node)-> int: # 1: function parameters
-        
         if (node == None):
             return 0
-        
-        # 2 Loop termination condition
-        if (node.left == None and node.right == None):
-            return node.data
-       
-        print(f" {node.data} ")
-
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        leftLeafNodeMax = self.GetLeafNodesMax(node.left)
 
-        # Recursively visit the right sub tree
-        rightLeafNodeMax = self.GetLeafNodesMax(node.right)
-
-         # 3 Work        
-        leafNodeMax = max(leftLeafNodeMax, rightLeafNodeMax)      
-        return leafNodeMax
-    
-    def IsBinaryTreeBalanced(self, node: Node)-> bool:
-        if (node == None):
-            return True
-        
-        leftTreeCount = self.CountNodes(node.left)
-        rightTreeCount = self.CountNodes(node.right)
-
-        difference = abs(leftTreeCount - rightTreeCount)
-        
-        if (difference > 1):
-            return False
-        else:
-            return True
-
-    def Search(self, node: Node, key: int)-> bool: # 1: function parameters
-        
-        # 2 Loop termination condition
-        if (node == None):            
-            return False
-
-        # 4 D & C strategy 
-        # Recursively visit the left sub tree
-        isFoundInLeftSubTree = self.Search(node.left, key)
-
-        # Recursively visit the right sub tree
-        isFoundInRightSubTree = self.Search(node.right, key)
-
-        if (node.data == key or isFoundInLeftSubTree or isFoundInRightSubTree):
-            return True
-        else:
-            return False
+        # 4 D & C strategy, stop as soon as one side is not balanced
+        leftHeight = self._balancedHeight(node.left)
+        if (leftHeight == -1):
+            return -1
+        rightHeight = self._balancedHeight(node.right)
+        if (rightHeight == -1):
+            return -1
 
+        # 3 Work
+        if (abs(leftHeight - rightHeight) > 1):
+            return -1
+        return max(leftHeight, rightHeight) + 1
+
+    # Post-order with an explicit stack. A node is pushed twice: first to
+    # push its children, then (visited = True) to combine their heights,
+    # which are on top of the heights stack by then.
+    def _isHeightBalancedIterative(self, node: Node) -> bool:
+        heights = []
+        stack = [(node, False)]
+
+        while (stack):
+            current, visited = stack.pop()
+            if (current == None):
+                heights.append(0)
+            elif (visited):
+                rightHeight = heights.pop()
+                leftHeight = heights.pop()
+                if (abs(leftHeight - rightHeight) > 1):
+                    return False
+                heights.append(max(leftHeight, rightHeight) + 1)
+            else:
+                stack.append((current, True))
+                stack.append((current.right, False))
+                stack.append((current.left, False))
+        return True
+
+    # Stops at the first node which holds the key
+    def Search(self, node: Node, key: int)-> bool:
+        for currentNode in self.GetNodesPreOrder(node):
+            if (currentNode.data == key):
+                return True
+        return False
+
+    # Depth of the deepest node, O(height) memory
     def GetHeightOfBinaryTree(self, node: Node)-> int:
-        if (node == None):
-            return 0
-        
-        leftNodeHeight = self.GetHeightOfBinaryTree(node.left)
-        rightNodeHeight = self.GetHeightOfBinaryTree(node.right)
-
-        maxHeight = max(leftNodeHeight, rightNodeHeight)
-        maxHeight = maxHeight + 1  # self count 
-        return maxHeight
+        return max((depth for _, depth in self.GetNodesPreOrderWithDepth(node)), default = 0)
 
     def LevelOrderTraversal(self, node: Node):
-        if (node == None):
-            return
-        
-        queue = deque()
-        queue.append(node)
-
-        while not queue:
-            nexNode = queue.popleft()
-            print(f" {nexNode.data} ")
-
-            if nexNode.left != None:
-                queue.append(nexNode.left)
-            
-            if nexNode.right != None:
-                queue.append(nexNode.right)
+        for currentNode in self.GetNodesLevelOrder(node):
+            print(f" {currentNode.data} ")
 
     def isBSTNotWorkingAlways(self, node: Node) -> bool:
         # termination
@@ -303,42 +315,277 @@ class Trees:
         
         return currentNode.data
 
-    
+    # BST check in O(n), stops at the first node which breaks the order
+    # Every node has to lie strictly between the bounds inherited from its
+    # ancestors, comparing with the direct children only is not enough
+    # (isBSTNotWorkingAlways finds those bounds with FindMax / FindMin
+    # at every node instead, which is O(n^2)).
+    # iterative = True walks in-order with an explicit stack instead of
+    # recursion, in-order values of a BST are strictly increasing.
+    def IsValidBST(self, node: Node, iterative: bool = False) -> bool:
+        if (iterative):
+            return self._isValidBSTIterative(node)
+        return self._isWithinBounds(node, None, None)
+
+    # lowerBound / upperBound are None when there is no bound on that side
+    def _isWithinBounds(self, node: Node, lowerBound, upperBound) -> bool:
+        # 2 Loop termination condition
+        if (node == None):
+            return True
 
-myTree = Trees()
-myTree.createBinaryTree()
-myTree.printBinaryTree(myTree.root)
+        # 3 Work
+        if (lowerBound != None and node.data <= lowerBound):
+            return False
+        if (upperBound != None and node.data >= upperBound):
+            return False
 
-print(f"Number of nodes in the BT = {myTree.CountNodes(myTree.root)}")
+        # 4 D & C strategy, the right side is skipped when the left fails
+        return (self._isWithinBounds(node.left, lowerBound, node.data) and
+                self._isWithinBounds(node.right, node.data, upperBound))
+
+    def _isValidBSTIterative(self, node: Node) -> bool:
+        previousNode = None
+        for currentNode in self.GetNodesInOrder(node):
+            if (previousNode != None and currentNode.data <= previousNode.data):
+                return False
+            previousNode = currentNode
+        return True
+
+    # Computes the requested aggregates in one pass over the tree, nothing
+    # is printed. CountNodes, GetSum, FindMax ... each need a full traversal
+    # of their own, this visits every node once for all of them.
+    # Nodes are visited level by level (no recursion, so deep trees work),
+    # the number of levels is the height.
+    def GetStats(self, node: Node, aggregates = AGGREGATES) -> TreeStats:
+        unknown = set(aggregates) - set(AGGREGATES)
+        if (unknown):
+            raise ValueError(f"Unknown aggregates {sorted(unknown)}")
+
+        stats = TreeStats()
+        wanted = set(aggregates)
+        if ("count" in wanted):
+            stats.count = 0
+        if ("height" in wanted):
+            stats.height = 0
+        if ("leafCount" in wanted):
+            stats.leafCount = 0
+        if ("sum" in wanted):
+            stats.sum = 0
+        if ("leafSum" in wanted):
+            stats.leafSum = 0
+        if (node == None):
+            return stats
+
+        # Flags in locals, so the loop does not look them up per node
+        wantSum = "sum" in wanted
+        wantMin = "min" in wanted
+        wantMax = "max" in wanted
+        wantLeafs = bool(wanted & {"leafCount", "leafSum", "leafMax"})
+
+        count = 0
+        height = 0
+        total = 0
+        minValue = node.data
+        maxValue = node.data
+        leafCount = 0
+        leafSum = 0
+        leafMax = None
+
+        level = [node]
+        while (level):
+            height = height + 1
+            count = count + len(level)
+            nextLevel = []
+            for current in level:
+                value = current.data
+                if (wantSum):
+                    total = total + value
+                if (wantMin and value < minValue):
+                    minValue = value
+                if (wantMax and value > maxValue):
+                    maxValue = value
+
+                # Case 1: Leaf node
+                if (current.left == None and current.right == None):
+                    if (wantLeafs):
+                        leafCount = leafCount + 1
+                        leafSum = leafSum + value
+                        if (leafMax == None or value > leafMax):
+                            leafMax = value
+                    continue
+
+                # Case 2: Inner node, its children form the next level
+                if (current.left != None):
+                    nextLevel.append(current.left)
+                if (current.right != None):
+                    nextLevel.append(current.right)
+            level = nextLevel
+
+        for name, value in (("count", count), ("sum", total), ("min", minValue), ("max", maxValue),
+                            ("height", height), ("leafCount", leafCount), ("leafSum", leafSum), ("leafMax", leafMax)):
+            if (name in wanted):
+                setattr(stats, name, value)
+        return stats
+
+    # Builds a complete binary tree from the values in level order
+    def createCompleteBinaryTree(self, values):
+        nodes = [Node(value) for value in values]
+        for index, current in enumerate(nodes):
+            if (2 * index + 1 < len(nodes)):
+                current.left = nodes[2 * index + 1]
+            if (2 * index + 2 < len(nodes)):
+                current.right = nodes[2 * index + 2]
+        self.root = nodes[0] if (nodes) else None
+
+
+### This code is outside the class
+# Benchmark
+
+# All the aggregates one method at a time (one traversal each) versus one
+# GetStats pass.
+def aggregatesBenchmark(nodeCount: int = 1_000_000):
+    tree = Trees()
+    tree.createCompleteBinaryTree([random.randint(1, 1_000_000) for _ in range(nodeCount)])
+    root = tree.root
+
+    singleMethods = [tree.CountNodes, tree.GetSum, tree.FindMax, tree.FindMin,
+                     tree.GetHeightOfBinaryTree, tree.GetSumOfLeafNodes, tree.GetLeafNodesMax]
+
+    start = time.perf_counter()
+    for method in singleMethods:
+        method(root)
+    separateTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.GetStats(root)
+    fusedTime = time.perf_counter() - start
+
+    print(f"{'nodes':>10} {'one by one (s)':>15} {'GetStats (s)':>13} {'speedup':>8}")
+    print(f"{nodeCount:>10} {separateTime:>15.3f} {fusedTime:>13.3f} {separateTime / fusedTime:>7.1f}x")
+
+
+# Both validators, recursive and iterative, on a complete tree and on a
+# chain (every node is the right child of the previous one) of nodeCount
+# nodes. The chain is a valid BST but not balanced, only the iterative
+# mode can handle its depth.
+def validatorsBenchmark(nodeCount: int = 1_000_000):
+    completeTree = Trees()
+    completeTree.createCompleteBinaryTree(range(nodeCount))
+
+    # In-order numbering turns the complete tree into a BST
+    for value, currentNode in enumerate(completeTree.GetNodesInOrder(completeTree.root)):
+        currentNode.data = value
+
+    chain = Node(0)
+    currentNode = chain
+    for value in range(1, nodeCount):
+        currentNode.right = Node(value)
+        currentNode = currentNode.right
+
+    print(f"{'tree':>10} {'check':>16} {'mode':>10} {'result':>14} {'time (s)':>9}")
+    for treeName, root in (("complete", completeTree.root), ("chain", chain)):
+        for checkName, check in (("IsHeightBalanced", completeTree.IsHeightBalanced), ("IsValidBST", completeTree.IsValidBST)):
+            for iterative in (False, True):
+                start = time.perf_counter()
+                try:
+                    result = check(root, iterative)
+                except RecursionError:
+                    result = "RecursionError"
+                elapsed = time.perf_counter() - start
+                mode = "iterative" if (iterative) else "recursive"
+                print(f"{treeName:>10} {checkName:>16} {mode:>10} {str(result):>14} {elapsed:>9.3f}")
+
+
+# Recursive sum / count / height (what the methods used to do, without the
+# printing) versus the same aggregates on the traversal generators, on a
+# complete tree. The skewed tree (a left chain) is only possible with the
+# generators, the recursive versions stop with RecursionError.
+def traversalBenchmark(nodeCount: int = 1_000_000):
+    def recursiveSum(node: Node) -> int:
+        if (node == None):
+            return 0
+        return recursiveSum(node.left) + recursiveSum(node.right) + node.data
 
-print(f"Max value in BT = {myTree.FindMax(myTree.root)}")
+    def recursiveCount(node: Node) -> int:
+        if (node == None):
+            return 0
+        return recursiveCount(node.left) + recursiveCount(node.right) + 1
 
-print(f"Min value in BT= {myTree.FindMin(myTree.root)}")
+    def recursiveHeight(node: Node) -> int:
+        if (node == None):
+            return 0
+        return max(recursiveHeight(node.left), recursiveHeight(node.right)) + 1
 
-print(f"Sum of all nodes in BT = {myTree.GetSum(myTree.root)}")
+    tree = Trees()
+    tree.createCompleteBinaryTree(range(nodeCount))
 
-print(f"Sum of leaft nodes in BT = {myTree.GetSumOfLeafNodes(myTree.root)}")
+    skewed = Node(0)
+    currentNode = skewed
+    for value in range(1, nodeCount):
+        currentNode.left = Node(value)
+        currentNode = currentNode.left
 
-print(f"Sum of leaft nodes in BT = {myTree.GetLeafNodesMax(myTree.root)}")
+    workloads = [
+        ("sum", recursiveSum, tree.GetSum),
+        ("count", recursiveCount, tree.CountNodes),
+        ("height", recursiveHeight, tree.GetHeightOfBinaryTree),
+    ]
 
-print(f"Search key 2 is it present = {myTree.Search(myTree.root, 2)}")
-print(f"Search key 100 is it present = {myTree.Search(myTree.root, 100)}")
+    print(f"{'tree':>10} {'aggregate':>10} {'recursive (s)':>14} {'iterative (s)':>14}")
+    for treeName, root in (("complete", tree.root), ("skewed", skewed)):
+        for name, recursive, iterative in workloads:
+            start = time.perf_counter()
+            try:
+                recursive(root)
+                recursiveTime = f"{time.perf_counter() - start:.3f}"
+            except RecursionError:
+                recursiveTime = "RecursionError"
 
-print(f"Height of the BT = {myTree.GetHeightOfBinaryTree(myTree.root)}")
+            start = time.perf_counter()
+            iterative(root)
+            print(f"{treeName:>10} {name:>10} {recursiveTime:>14} {time.perf_counter() - start:>14.3f}")
 
-print(f"Is this BT = {myTree.isBST(myTree.root)}")
 
-print(f"Left most child value  = {myTree.getLeftMostChildValue(myTree.root)}")
+if __name__ == "__main__":
+    myTree = Trees()
+    myTree.createBinaryTree()
+    myTree.printBinaryTree(myTree.root)
 
-print(f"Right most child value  = {myTree.getRighttMostChildValue(myTree.root)}")
+    print(f"Number of nodes in the BT = {myTree.CountNodes(myTree.root)}")
 
+    print(f"Max value in BT = {myTree.FindMax(myTree.root)}")
 
+    print(f"Min value in BT= {myTree.FindMin(myTree.root)}")
 
+    print(f"Sum of all nodes in BT = {myTree.GetSum(myTree.root)}")
 
+    print(f"Sum of leaft nodes in BT = {myTree.GetSumOfLeafNodes(myTree.root)}")
 
-        
-        
+    print(f"Sum of leaft nodes in BT = {myTree.GetLeafNodesMax(myTree.root)}")
+
+    print(f"Search key 2 is it present = {myTree.Search(myTree.root, 2)}")
+    print(f"Search key 100 is it present = {myTree.Search(myTree.root, 100)}")
+
+    print(f"Height of the BT = {myTree.GetHeightOfBinaryTree(myTree.root)}")
+
+    print(f"Is this BT = {myTree.isBST(myTree.root, float('-inf'), float('inf'))}")
+
+    print(f"Left most child value  = {myTree.getLeftMostChildValue(myTree.root)}")
+
+    print(f"Right most child value  = {myTree.getRighttMostChildValue(myTree.root)}")
 
+    print(f"Stats of the BT = {myTree.GetStats(myTree.root)}")
+    print(f"Only count and height = {myTree.GetStats(myTree.root, ('count', 'height'))}")
 
+    print(f"Is height balanced = {myTree.IsHeightBalanced(myTree.root)}, iterative = {myTree.IsHeightBalanced(myTree.root, True)}")
+    print(f"Is valid BST = {myTree.IsValidBST(myTree.root)}, iterative = {myTree.IsValidBST(myTree.root, True)}")
 
+    print("Level order")
+    myTree.LevelOrderTraversal(myTree.root)
+    print(f"Pre-order  = {[node.data for node in myTree.GetNodesPreOrder(myTree.root)]}")
+    print(f"In-order   = {[node.data for node in myTree.GetNodesInOrder(myTree.root)]}")
+    print(f"Post-order = {[node.data for node in myTree.GetNodesPostOrder(myTree.root)]}")
 
+    #aggregatesBenchmark()
+    #validatorsBenchmark()
+    #traversalBenchmark()